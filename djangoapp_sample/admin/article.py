@@ -1,8 +1,21 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from ..models import Article
 
 
+class ArticleChangeList(ChangeList):
+    """
+    Change list which does not load article contents.
+    """
+    def get_queryset(self, *args, **kwargs):
+        return super().get_queryset(*args, **kwargs).for_feed()
+
+
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
-    pass
+    list_display = ("title", "blog", "publish_start")
+    list_select_related = ("blog",)
+
+    def get_changelist(self, request, **kwargs):
+        return ArticleChangeList
@@ -5,4 +5,5 @@ from ..models import Blog
 
 @admin.register(Blog)
 class BlogAdmin(admin.ModelAdmin):
-    pass
+    list_display = ("title", "article_count")
+    readonly_fields = ("article_count",)
@@ -5,3 +5,6 @@ class djangoapp_sampleConfig(AppConfig):
     name = "djangoapp_sample"
     verbose_name = "Django app sample"
     default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        from . import signals  # noqa: F401
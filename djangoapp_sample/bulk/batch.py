@@ -0,0 +1,248 @@
+"""
+Batch writing of articles from a single API payload.
+
+A batch payload is a JSON object with optional lists ``create``, ``update`` and
+``delete``. Created and updated items use the ``ArticleBatchItemSerializer``
+fields, updated items require an ``id`` and only the given fields are changed,
+deleted items are article ids.
+
+Every item is validated before any write, with a single query for blog ids and a
+single query for article ids. When valid, the whole batch is written with
+``bulk_create``, ``bulk_update`` and a queryset delete within one transaction.
+"""
+from django.conf import settings
+from django.db import router, transaction
+from rest_framework import serializers
+
+from ..models import Article, Blog
+from ..serializers import ArticleBatchItemSerializer
+
+
+OPERATIONS = ("create", "update", "delete")
+
+
+class ArticleBatch:
+    """
+    Validate and write a batch of article operations.
+
+    Errors are returned per item, aligned with the payload lists, so a client can
+    know which items to fix. The batch is all or nothing, nothing is written when
+    any item is invalid.
+
+    Arguments:
+        data (object): The batch payload.
+
+    Keyword Arguments:
+        using (string): Database alias, default to the router choice.
+        max_size (integer): Maximum number of items for the whole batch, default to
+            setting ``ARTICLE_BATCH_MAX_SIZE``.
+    """
+    def __init__(self, data, using=None, max_size=None):
+        self.initial_data = data
+        self.using = using or router.db_for_write(Article)
+        self.max_size = max_size or settings.ARTICLE_BATCH_MAX_SIZE
+        self.validated_data = None
+        self.errors = {}
+
+    def _validate_items(self, items, partial=False):
+        """
+        Validate created or updated items with the item serializer.
+
+        Returns:
+            tuple: List of validated data and list of errors, each error is an
+            empty dictionnary for a valid item.
+        """
+        # A single serializer is used for every item
+        child = ArticleBatchItemSerializer(
+            data=items, many=True, partial=partial
+        ).child
+        values, errors = [], []
+
+        for item in items:
+            try:
+                values.append(child.run_validation(item))
+                errors.append({})
+            except serializers.ValidationError as e:
+                values.append(None)
+                errors.append(dict(e.detail))
+
+        return values, errors
+
+    def _validate_ids(self, items):
+        """
+        Validate deleted items which are article ids.
+        """
+        field = serializers.IntegerField(min_value=1)
+        values, errors = [], []
+
+        for item in items:
+            try:
+                values.append(field.run_validation(item))
+                errors.append({})
+            except serializers.ValidationError as e:
+                values.append(None)
+                errors.append({"id": e.detail})
+
+        return values, errors
+
+    def is_valid(self):
+        """
+        Validate the whole batch.
+
+        Returns:
+            bool: True if there is no error.
+        """
+        data = self.initial_data
+        if not isinstance(data, dict) or not set(data).issubset(OPERATIONS):
+            self.errors = {
+                "non_field_errors": [
+                    "Expected an object with optional lists {}.".format(
+                        ", ".join(OPERATIONS)
+                    )
+                ]
+            }
+            return False
+
+        payload = {}
+        for name in OPERATIONS:
+            items = data.get(name) or []
+            if not isinstance(items, list):
+                self.errors = {name: ["Expected a list of items."]}
+                return False
+            payload[name] = items
+
+        size = sum(len(items) for items in payload.values())
+        if size > self.max_size:
+            self.errors = {
+                "non_field_errors": [
+                    "Batch has {} items, it can not exceed {}.".format(
+                        size, self.max_size
+                    )
+                ]
+            }
+            return False
+
+        values, errors = {}, {}
+        values["create"], errors["create"] = self._validate_items(payload["create"])
+        values["update"], errors["update"] = self._validate_items(
+            payload["update"], partial=True
+        )
+        values["delete"], errors["delete"] = self._validate_ids(payload["delete"])
+
+        for item, error in zip(values["create"], errors["create"]):
+            if item is not None and "id" in item:
+                error["id"] = ["Can not be set on creation."]
+
+        # Updated and deleted articles, an article can be only once in the batch
+        seen = set()
+        targets = [
+            (item, error, item and item.get("id"))
+            for item, error in zip(values["update"], errors["update"])
+        ] + [
+            (pk, error, pk)
+            for pk, error in zip(values["delete"], errors["delete"])
+        ]
+        for item, error, pk in targets:
+            if item is None:
+                continue
+            if pk is None:
+                error["id"] = ["This field is required."]
+            elif pk in seen:
+                error["id"] = ["Article {} is already in the batch.".format(pk)]
+            seen.add(pk)
+
+        # Check all article and blog ids with one query each
+        if seen:
+            existing = {
+                pk: (start, end)
+                for pk, start, end in Article.objects.using(self.using)
+                .filter(pk__in=seen)
+                .values_list("pk", "publish_start", "publish_end")
+            }
+            for item, error, pk in targets:
+                if pk is not None and pk not in existing and "id" not in error:
+                    error["id"] = ["Unknown article id {}.".format(pk)]
+
+            # Partial updates are checked against stored publication dates
+            for item, error in zip(values["update"], errors["update"]):
+                if item is None or error or item.get("id") not in existing:
+                    continue
+                start, end = existing[item["id"]]
+                start = item.get("publish_start", start)
+                end = item.get("publish_end", end)
+                if start and end and end <= start:
+                    error["publish_end"] = [
+                        "Publication end must be after publication start."
+                    ]
+
+        written = [
+            (item, error)
+            for name in ("create", "update")
+            for item, error in zip(values[name], errors[name])
+            if item is not None and "blog_id" in item
+        ]
+        blog_ids = {item["blog_id"] for item, error in written}
+        if blog_ids:
+            existing = set(
+                Blog.objects.using(self.using).filter(pk__in=blog_ids)
+                .values_list("pk", flat=True)
+            )
+            for item, error in written:
+                if item["blog_id"] not in existing:
+                    error["blog"] = [
+                        "Unknown blog id {}.".format(item["blog_id"])
+                    ]
+
+        if any(error for name in OPERATIONS for error in errors[name]):
+            self.errors = {
+                name: errors[name] for name in OPERATIONS if payload[name]
+            }
+            return False
+
+        self.validated_data = values
+        return True
+
+    def save(self):
+        """
+        Write the validated batch in a single transaction.
+
+        Returns:
+            dict: Lists of written article ids for each operation, ordered like
+            the payload.
+        """
+        assert self.validated_data is not None, (
+            "You must call '.is_valid()' before calling '.save()'."
+        )
+        data = self.validated_data
+        queryset = Article.objects.using(self.using)
+
+        with transaction.atomic(using=self.using):
+            created = queryset.bulk_create([
+                Article(**item) for item in data["create"]
+            ])
+
+            updated = []
+            if data["update"]:
+                fields = sorted({
+                    name for item in data["update"] for name in item if name != "id"
+                })
+                objects = queryset.only("id", *fields).in_bulk(
+                    [item["id"] for item in data["update"]]
+                )
+                for item in data["update"]:
+                    obj = objects[item["id"]]
+                    for name, value in item.items():
+                        setattr(obj, name, value)
+                    updated.append(obj)
+
+                if fields:
+                    queryset.bulk_update(updated, fields)
+
+            if data["delete"]:
+                queryset.filter(pk__in=data["delete"]).delete()
+
+        return {
+            "create": [obj.pk for obj in created],
+            "update": [obj.pk for obj in updated],
+            "delete": list(data["delete"]),
+        }
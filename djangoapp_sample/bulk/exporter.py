@@ -0,0 +1,154 @@
+"""
+Streaming export of articles to NDJSON or CSV.
+
+Rows are read from a queryset iterator with ``values_list`` so neither model
+instances nor serializers are built, and lines are yielded one by one so they can
+be given to a ``StreamingHttpResponse`` or written to a file without keeping the
+whole export in memory.
+"""
+import csv
+import json
+
+from django.conf import settings
+
+
+EXPORT_FIELDS = [
+    ("id", "id"),
+    ("blog", "blog_id"),
+    ("blog_title", "blog__title"),
+    ("title", "title"),
+    ("content", "content"),
+    ("publish_start", "publish_start"),
+    ("publish_end", "publish_end"),
+]
+"""
+Exported column names and their queryset lookups. Column names are compatible
+with the bulk importer.
+"""
+
+DATETIME_COLUMNS = [
+    index for index, (name, lookup) in enumerate(EXPORT_FIELDS)
+    if name in ("publish_start", "publish_end")
+]
+"""
+Positions of datetime columns in export rows.
+"""
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def filter_articles(queryset, blog=None, publish_after=None, publish_before=None):
+    """
+    Apply export filters on an article queryset.
+
+    Arguments:
+        queryset (QuerySet): Article queryset.
+
+    Keyword Arguments:
+        blog (integer): Blog id to limit articles to.
+        publish_after (datetime.datetime): Only articles published from this date.
+        publish_before (datetime.datetime): Only articles published before this
+            date.
+
+    Returns:
+        QuerySet: Filtered queryset.
+    """
+    if blog is not None:
+        queryset = queryset.filter(blog_id=blog)
+    if publish_after is not None:
+        queryset = queryset.filter(publish_start__gte=publish_after)
+    if publish_before is not None:
+        queryset = queryset.filter(publish_start__lt=publish_before)
+
+    return queryset
+
+
+def iter_rows(queryset, chunk_size=None):
+    """
+    Lazily iterate on export rows.
+
+    Arguments:
+        queryset (QuerySet): Article queryset.
+
+    Keyword Arguments:
+        chunk_size (integer): Number of rows fetched from database at once,
+            default to setting ``ARTICLE_EXPORT_CHUNK_SIZE``.
+
+    Returns:
+        iterator: Each row as a tuple of values in ``EXPORT_FIELDS`` order.
+    """
+    return queryset.order_by("id").values_list(
+        *[lookup for name, lookup in EXPORT_FIELDS]
+    ).iterator(chunk_size=chunk_size or settings.ARTICLE_EXPORT_CHUNK_SIZE)
+
+
+def format_dates(row, empty):
+    """
+    Return a row with its datetime columns in ISO format.
+
+    Arguments:
+        row (tuple): Row values in ``EXPORT_FIELDS`` order.
+        empty (object): Value for empty dates.
+
+    Returns:
+        list: Row values.
+    """
+    row = list(row)
+    for index in DATETIME_COLUMNS:
+        row[index] = row[index].isoformat() if row[index] is not None else empty
+
+    return row
+
+
+def ndjson_lines(rows):
+    """
+    Encode rows as NDJSON lines.
+    """
+    names = [name for name, lookup in EXPORT_FIELDS]
+
+    for row in rows:
+        item = dict(zip(names, format_dates(row, None)))
+        yield json.dumps(item, ensure_ascii=False) + "\n"
+
+
+class EchoBuffer:
+    """
+    A file-like object which just returns what is written to it, it allows to
+    use a CSV writer to encode lines one by one.
+    """
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    """
+    Encode rows as CSV lines starting with a header line.
+    """
+    writer = csv.writer(EchoBuffer())
+
+    yield writer.writerow([name for name, lookup in EXPORT_FIELDS])
+
+    for row in rows:
+        yield writer.writerow(format_dates(row, ""))
+
+
+def export_lines(queryset, format, chunk_size=None):
+    """
+    Lazily encode articles from a queryset.
+
+    Arguments:
+        queryset (QuerySet): Article queryset.
+        format (string): Either ``ndjson`` or ``csv``.
+
+    Keyword Arguments:
+        chunk_size (integer): Number of rows fetched from database at once.
+
+    Returns:
+        iterator: Encoded lines.
+    """
+    encoder = csv_lines if format == "csv" else ndjson_lines
+
+    return encoder(iter_rows(queryset, chunk_size=chunk_size))
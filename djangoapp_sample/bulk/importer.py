@@ -0,0 +1,366 @@
+"""
+Bulk import of blogs and articles from JSONL or CSV streams.
+
+Rows are read lazily and written by batches with ``bulk_create`` so memory stays
+flat whatever the input size. Blogs are resolved through an in-memory map of
+titles and ids so there is no query per row.
+"""
+import csv
+import json
+import time
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ..models import Article, Blog
+
+
+FORMATS = ("jsonl", "csv")
+
+
+def read_rows(stream, format):
+    """
+    Lazily read rows from a text stream.
+
+    Arguments:
+        stream (io.TextIOBase): Text stream to read.
+        format (string): Either ``jsonl`` or ``csv``. CSV must have a header line
+            with column names.
+
+    Raises:
+        ValueError: When a JSON line is invalid.
+
+    Returns:
+        iterator: Each row as a dictionnary.
+    """
+    if format == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid JSON on line {}: {}".format(number, e))
+
+        if not isinstance(row, dict):
+            raise ValueError("Line {} is not a JSON object.".format(number))
+
+        yield row
+
+
+class ImportStats:
+    """
+    Counters about an import.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.read = 0
+        self.written = 0
+        self.errors = []
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        """
+        Number of rows read per second.
+        """
+        elapsed = self.elapsed
+        return self.read / elapsed if elapsed else 0.0
+
+    def error(self, line, message):
+        self.errors.append((line, message))
+
+
+class BulkImporter:
+    """
+    Import blogs or articles by batches.
+
+    Keyword Arguments:
+        batch_size (integer): Number of rows to write per batch.
+        blog_key (string): How to resolve the ``blog`` value from article rows.
+            ``id`` for a blog id, ``title`` for a blog title which is created if
+            it does not exist yet, or ``auto`` to use id for integer values and
+            title for anything else.
+        using (string): Database alias to write to.
+        max_errors (integer): Maximum number of row errors to keep in stats.
+    """
+    def __init__(self, batch_size=1000, blog_key="auto", using="default",
+                 max_errors=100):
+        self.batch_size = batch_size
+        self.blog_key = blog_key
+        self.using = using
+        self.max_errors = max_errors
+        # In-memory blog map, titles to ids and known ids
+        self.blog_titles = {}
+        self.blog_ids = set()
+
+    def _error(self, stats, line, message):
+        if len(stats.errors) < self.max_errors:
+            stats.error(line, message)
+
+    def _batches(self, rows, stats, callback=None):
+        batch = []
+        for row in rows:
+            stats.read += 1
+            batch.append((stats.read, row))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+                if callback:
+                    callback(stats)
+
+        if batch:
+            yield batch
+            if callback:
+                callback(stats)
+
+    def upsert_blogs(self, titles):
+        """
+        Ensure blogs exist for given titles and register their ids in the blog
+        map.
+
+        Arguments:
+            titles (iterable): Blog titles.
+
+        Returns:
+            integer: Number of created blogs.
+        """
+        max_length = Blog._meta.get_field("title").max_length
+        titles = {
+            title for title in titles
+            if title not in self.blog_titles and len(title) <= max_length
+        }
+        if not titles:
+            return 0
+
+        queryset = Blog.objects.using(self.using)
+        existing = dict(
+            queryset.filter(title__in=titles).values_list("title", "pk")
+        )
+        missing = titles - set(existing)
+        if missing:
+            # Blogs created meanwhile by another import are ignored
+            queryset.bulk_create(
+                [Blog(title=title) for title in missing],
+                ignore_conflicts=True,
+            )
+            existing.update(
+                queryset.filter(title__in=missing).values_list("title", "pk")
+            )
+
+        for title, pk in existing.items():
+            self.blog_titles[title] = pk
+            self.blog_ids.add(pk)
+
+        return len(missing)
+
+    def check_blog_ids(self, ids):
+        """
+        Register in the blog map the existing ones from given blog ids.
+
+        Arguments:
+            ids (iterable): Blog ids.
+        """
+        ids = set(ids) - self.blog_ids
+        if ids:
+            self.blog_ids.update(
+                Blog.objects.using(self.using).filter(pk__in=ids).values_list(
+                    "pk", flat=True
+                )
+            )
+
+    def get_blog_reference(self, value):
+        """
+        Return the kind of blog reference from a row value.
+
+        Raises:
+            ValueError: When the value is neither a string nor an integer.
+
+        Returns:
+            tuple: Reference kind (either ``id`` or ``title``) and the reference
+            value.
+        """
+        if value is None:
+            value = ""
+        # Booleans are integers for Python
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            raise ValueError(
+                "Invalid value for 'blog', a string or an integer is expected."
+            )
+
+        is_digit = isinstance(value, int) or value.isdigit()
+
+        if self.blog_key == "id":
+            return "id", int(value) if is_digit else None
+        elif self.blog_key == "auto" and is_digit:
+            return "id", int(value)
+
+        return "title", str(value).strip()
+
+    def get_string(self, row, name):
+        """
+        Return an optional string from a row.
+
+        Raises:
+            ValueError: When the value is not a string.
+
+        Returns:
+            string: The value or an empty string if missing.
+        """
+        value = row.get(name)
+        if value is None:
+            return ""
+        if not isinstance(value, str):
+            raise ValueError("Invalid value for '{}', a string is expected.".format(
+                name
+            ))
+
+        return value
+
+    def get_datetime(self, row, name):
+        """
+        Parse an optional date from a row, naive dates are assumed to be in the
+        current timezone.
+
+        Raises:
+            ValueError: For an invalid date.
+
+        Returns:
+            datetime.datetime: The date or ``None`` if empty.
+        """
+        value = self.get_string(row, name)
+        if not value:
+            return None
+
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise ValueError("Invalid date for '{}'.".format(name))
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+
+        return parsed
+
+    def build_article(self, row):
+        """
+        Build an Article object from a row with its blog resolved.
+
+        Raises:
+            ValueError: For invalid row values.
+
+        Returns:
+            Article: Unsaved article object.
+        """
+        title = self.get_string(row, "title").strip()
+        if not title:
+            raise ValueError("Title is required.")
+        if len(title) > Article._meta.get_field("title").max_length:
+            raise ValueError("Title is too long.")
+
+        kind, reference = self.get_blog_reference(row.get("blog"))
+        blog_id = (
+            reference if kind == "id" and reference in self.blog_ids
+            else self.blog_titles.get(reference)
+        )
+        if blog_id is None:
+            raise ValueError("Unknown blog '{}'.".format(reference))
+
+        publish_start = self.get_datetime(row, "publish_start") or timezone.now()
+        publish_end = self.get_datetime(row, "publish_end")
+        if publish_end and publish_end <= publish_start:
+            raise ValueError("Publication end must be after publication start.")
+
+        return Article(
+            blog_id=blog_id,
+            title=title,
+            content=self.get_string(row, "content"),
+            publish_start=publish_start,
+            publish_end=publish_end,
+        )
+
+    def import_blogs(self, rows, callback=None):
+        """
+        Import blogs, existing titles are left untouched.
+
+        Arguments:
+            rows (iterable): Rows to import.
+
+        Keyword Arguments:
+            callback (callable): Function called with stats after each batch.
+
+        Returns:
+            ImportStats: Import stats.
+        """
+        stats = ImportStats()
+        max_length = Blog._meta.get_field("title").max_length
+
+        for batch in self._batches(rows, stats, callback=callback):
+            titles = []
+            for line, row in batch:
+                try:
+                    title = self.get_string(row, "title").strip()
+                except ValueError as e:
+                    self._error(stats, line, str(e))
+                    continue
+                if not title or len(title) > max_length:
+                    self._error(stats, line, "Invalid title.")
+                    continue
+                titles.append(title)
+
+            with transaction.atomic(using=self.using):
+                stats.written += self.upsert_blogs(titles)
+
+        return stats
+
+    def import_articles(self, rows, callback=None):
+        """
+        Import articles.
+
+        Arguments:
+            rows (iterable): Rows to import.
+
+        Keyword Arguments:
+            callback (callable): Function called with stats after each batch.
+
+        Returns:
+            ImportStats: Import stats.
+        """
+        stats = ImportStats()
+
+        for batch in self._batches(rows, stats, callback=callback):
+            with transaction.atomic(using=self.using):
+                references = []
+                for line, row in batch:
+                    try:
+                        references.append(self.get_blog_reference(row.get("blog")))
+                    except ValueError:
+                        # Reported when the article is built
+                        continue
+                self.check_blog_ids([
+                    value for kind, value in references
+                    if kind == "id" and value is not None
+                ])
+                self.upsert_blogs([
+                    value for kind, value in references if kind == "title" and value
+                ])
+
+                articles = []
+                for line, row in batch:
+                    try:
+                        articles.append(self.build_article(row))
+                    except ValueError as e:
+                        self._error(stats, line, str(e))
+
+                Article.objects.using(self.using).bulk_create(articles)
+
+            stats.written += len(articles)
+
+        return stats
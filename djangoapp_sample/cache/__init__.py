@@ -0,0 +1,24 @@
+from .lookups import forget_blogs, get_blog, get_blog_or_404
+from .stampede import get_metrics, get_or_compute, reset_metrics
+from .versions import (
+    blog_ids_from_scopes, blog_scope, bump_versions, content_invalidated,
+    get_cache, get_versions, invalidate, invalidate_blogs,
+)
+
+
+__all__ = [
+    "blog_ids_from_scopes",
+    "blog_scope",
+    "bump_versions",
+    "content_invalidated",
+    "forget_blogs",
+    "get_blog",
+    "get_blog_or_404",
+    "get_cache",
+    "get_metrics",
+    "get_or_compute",
+    "get_versions",
+    "invalidate",
+    "invalidate_blogs",
+    "reset_metrics",
+]
@@ -0,0 +1,315 @@
+"""
+In-process cache tier in front of the content cache.
+
+When setting ``LOCAL_CACHE_ENABLED`` is enabled, ``get_cache()`` returns a
+``LocalCacheTier`` which keeps recently used entries in process memory so hot
+entries do not cost a round trip to the shared cache backend. Local memory is
+bounded in number of entries and in bytes (from the pickled size of values),
+least recently used entries are evicted first.
+
+Processes do not share their local entries, so invalidations are broadcast with a
+generation token: every content invalidation sets a new generation and each
+process compares it with the one its entries come from at most every
+``LOCAL_CACHE_SYNC_INTERVAL`` seconds, clearing its entries when it changed. The
+generation is stored in the shared cache or in the file from setting
+``LOCAL_CACHE_GENERATION_FILE`` when the shared cache is not shared between
+processes (like the local memory backend).
+
+Local entries are kept pickled and unpickled on each hit, like the Django local
+memory backend does, so a returned value is a copy which can be modified without
+changing the entry for the other requests of the process.
+"""
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+GENERATION_KEY = "djangoapp_sample:local-generation"
+
+
+class LocalCacheTier:
+    """
+    Cache wrapper which reads from a bounded local LRU memory before the shared
+    cache and writes through to the shared cache.
+
+    It implements the part of the Django cache API used by the application.
+
+    Arguments:
+        alias (string): Name of the shared cache from ``CACHES`` setting.
+        max_entries (integer): Maximum number of local entries.
+        max_bytes (integer): Maximum total size of local entries, a value bigger
+            than this is never kept locally.
+        timeout (integer): Maximum lifetime in seconds of a local entry, it bounds
+            how long a shared entry which expires by itself can still be served.
+        sync_interval (float): Maximum number of seconds between two checks of the
+            shared generation, it bounds how long an invalidated entry can still
+            be served.
+
+    Keyword Arguments:
+        generation_file (string): Path to a file to store the generation instead
+            of the shared cache.
+    """
+    def __init__(self, alias, max_entries, max_bytes, timeout, sync_interval,
+                 generation_file=None):
+        self.alias = alias
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.sync_interval = sync_interval
+        self.generation_file = generation_file
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self._generation = None
+        self._synced_at = None
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """
+        Total size in bytes of local entries.
+        """
+        return self._size
+
+    def read_generation(self):
+        if not self.generation_file:
+            return self.shared.get(GENERATION_KEY)
+
+        try:
+            with open(self.generation_file) as fp:
+                return fp.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def write_generation(self, generation):
+        if not self.generation_file:
+            self.shared.set(GENERATION_KEY, generation, None)
+            return
+
+        # Replace the file at once so readers never get a partial token
+        temporary = "{}.{}.tmp".format(self.generation_file, os.getpid())
+        with open(temporary, "w") as fp:
+            fp.write(generation)
+        os.replace(temporary, self.generation_file)
+
+    def sync(self, force=False):
+        """
+        Clear local entries if the shared generation changed since the last check,
+        checks are done at most every ``sync_interval`` seconds.
+
+        Keyword Arguments:
+            force (boolean): Check the generation whatever the interval.
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._synced_at is not None
+            and now - self._synced_at < self.sync_interval
+        ):
+            return
+
+        generation = self.read_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._clear_local()
+                self._generation = generation
+            self._synced_at = now
+
+    def broadcast_invalidation(self):
+        """
+        Clear local entries and set a new shared generation so other processes
+        clear their own entries.
+        """
+        generation = uuid.uuid4().hex[:12]
+        self.write_generation(generation)
+
+        with self._lock:
+            self._clear_local()
+            self._generation = generation
+            self._synced_at = time.monotonic()
+
+    def _clear_local(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[2]
+
+    def _local_get(self, key):
+        """
+        Return a local entry pickled value, ``None`` when it is missing or
+        expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        data, expires, size = entry
+        if expires <= time.monotonic():
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+
+        return data
+
+    def _local_set(self, key, value, timeout):
+        self._discard(key)
+
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = None
+        if value is None or timeout is not None and timeout <= 0:
+            return
+
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        size = len(data)
+        if size > self.max_bytes:
+            return
+
+        lifetime = self.timeout if timeout is None else min(timeout, self.timeout)
+        self._entries[key] = (data, time.monotonic() + lifetime, size)
+        self._size += size
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            key, (data, expires, size) = self._entries.popitem(last=False)
+            self._size -= size
+
+    def get(self, key, default=None):
+        self.sync()
+
+        with self._lock:
+            data = self._local_get(key)
+        if data is not None:
+            return pickle.loads(data)
+
+        value = self.shared.get(key)
+        if value is None:
+            return default
+
+        with self._lock:
+            self._local_set(key, value, None)
+
+        return value
+
+    def get_many(self, keys):
+        self.sync()
+
+        local = {}
+        with self._lock:
+            for key in keys:
+                data = self._local_get(key)
+                if data is not None:
+                    local[key] = data
+        found = {key: pickle.loads(data) for key, data in local.items()}
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            shared = self.shared.get_many(missing)
+            with self._lock:
+                for key, value in shared.items():
+                    self._local_set(key, value, None)
+            found.update(shared)
+
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.shared.set(key, value, timeout)
+
+        with self._lock:
+            self._local_set(key, value, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT):
+        failed = self.shared.set_many(data, timeout)
+
+        with self._lock:
+            for key, value in data.items():
+                self._local_set(key, value, timeout)
+
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        added = self.shared.add(key, value, timeout)
+        if added:
+            with self._lock:
+                self._local_set(key, value, timeout)
+
+        return added
+
+    def delete(self, key):
+        with self._lock:
+            self._discard(key)
+
+        return self.shared.delete(key)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._discard(key)
+
+        self.shared.delete_many(keys)
+
+    def clear(self):
+        with self._lock:
+            self._clear_local()
+
+        self.shared.clear()
+
+
+_local_tier = None
+_local_tier_lock = threading.Lock()
+
+
+def get_local_tier():
+    """
+    Return the local cache tier of the current process for the content cache.
+
+    Returns:
+        LocalCacheTier: The local cache tier, ``None`` if it is disabled.
+    """
+    global _local_tier
+
+    if not settings.LOCAL_CACHE_ENABLED:
+        return None
+
+    if _local_tier is None:
+        with _local_tier_lock:
+            if _local_tier is None:
+                _local_tier = LocalCacheTier(
+                    settings.CONTENT_CACHE_ALIAS,
+                    max_entries=settings.LOCAL_CACHE_MAX_ENTRIES,
+                    max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+                    timeout=settings.LOCAL_CACHE_TIMEOUT,
+                    sync_interval=settings.LOCAL_CACHE_SYNC_INTERVAL,
+                    generation_file=settings.LOCAL_CACHE_GENERATION_FILE,
+                )
+
+    return _local_tier
+
+
+@receiver(setting_changed, dispatch_uid="djangoapp_sample_local_cache_reset")
+def reset_local_tier(setting, **kwargs):
+    """
+    Drop the local cache tier when its settings change (mostly for tests).
+    """
+    global _local_tier
+
+    if setting == "CACHES" or setting.startswith(("LOCAL_CACHE_", "CONTENT_CACHE_")):
+        _local_tier = None
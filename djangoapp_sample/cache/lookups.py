@@ -0,0 +1,94 @@
+"""
+Read-through cache for Blog lookups by primary key.
+
+Found blogs are cached with timeout from setting ``BLOG_LOOKUP_CACHE_TIMEOUT``,
+missing ones are remembered for ``BLOG_LOOKUP_MISS_TIMEOUT`` so repeated requests
+on unknown ids do not query the database each time.
+
+Entries are deleted when blog content is invalidated (see signal
+``content_invalidated``), it includes blog saves and deletions but also article
+changes since they change the blog counter.
+"""
+from django.conf import settings
+from django.http import Http404
+
+from .versions import get_cache
+
+
+BLOG_LOOKUP_KEY_PREFIX = "djangoapp_sample:blog:"
+
+MISSING = "missing"
+"""
+Cached value for a blog which does not exist.
+"""
+
+
+def blog_lookup_key(pk):
+    return "{}{}".format(BLOG_LOOKUP_KEY_PREFIX, pk)
+
+
+def get_blog(pk):
+    """
+    Return a blog from cache or database.
+
+    Arguments:
+        pk (integer): Blog id.
+
+    Raises:
+        TypeError: For a value which is not a valid blog id.
+        ValueError: For a value which is not a valid blog id.
+
+    Returns:
+        djangoapp_sample.models.Blog: The blog or ``None`` if it does not exist.
+    """
+    from ..models import Blog
+
+    pk = Blog._meta.pk.get_prep_value(pk)
+
+    if not settings.BLOG_LOOKUP_CACHE_TIMEOUT:
+        return Blog.objects.filter(pk=pk).first()
+
+    cache = get_cache()
+    key = blog_lookup_key(pk)
+
+    blog = cache.get(key)
+    if blog == MISSING:
+        return None
+    if blog is not None:
+        return blog
+
+    blog = Blog.objects.filter(pk=pk).first()
+    if blog is None:
+        if settings.BLOG_LOOKUP_MISS_TIMEOUT:
+            cache.set(key, MISSING, settings.BLOG_LOOKUP_MISS_TIMEOUT)
+    else:
+        cache.set(key, blog, settings.BLOG_LOOKUP_CACHE_TIMEOUT)
+
+    return blog
+
+
+def get_blog_or_404(pk):
+    """
+    Like ``get_blog()`` but raise a 404 error when blog does not exist.
+    """
+    try:
+        blog = get_blog(pk)
+    except (TypeError, ValueError):
+        blog = None
+
+    if blog is None:
+        raise Http404("No blog found matching the query")
+
+    return blog
+
+
+def forget_blogs(pks):
+    """
+    Delete cached lookups of some blogs.
+
+    Arguments:
+        pks (iterable): Blog ids.
+    """
+    keys = [blog_lookup_key(pk) for pk in pks]
+    if keys:
+        get_cache().delete_many(keys)
@@ -0,0 +1,205 @@
+"""
+Cache recomputation protected against stampedes.
+
+When a popular entry expires, every concurrent request would recompute it at the
+same time. ``get_or_compute()`` avoids it with:
+
+* Single-flight recomputation: only the request which acquires a lock (an atomic
+  ``add`` in the cache) computes a missing entry, the other ones wait for its
+  result;
+* Probabilistic early expiration (also known as XFetch): an entry may be
+  recomputed a bit before its expiration, with a probability growing as the
+  expiration comes closer and as the computation is slower, so most
+  recomputations happen before anyone sees the entry expired;
+* Stale-while-revalidate: an expired entry is kept for
+  ``CONTENT_CACHE_STALE_TIMEOUT`` more seconds and served while a single request
+  recomputes it.
+
+Each path taken is counted in process metrics, see ``get_metrics()``.
+"""
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+
+from .versions import get_cache
+
+
+_metrics = Counter()
+_metrics_lock = threading.Lock()
+
+METRICS = ("hit", "early", "miss", "expired", "stale", "wait", "fallback")
+"""
+Paths counted in metrics:
+
+* ``hit``: Entry served from cache;
+* ``early``: Entry recomputed before its expiration;
+* ``miss``: Missing entry computed by the lock holder;
+* ``expired``: Expired entry recomputed by the lock holder;
+* ``stale``: Expired entry served while another request recomputes it;
+* ``wait``: Missing entry served after waiting for another request to compute it;
+* ``fallback``: Missing entry computed without lock after waiting for too long.
+"""
+
+
+def count_metric(name):
+    with _metrics_lock:
+        _metrics[name] += 1
+
+
+def get_metrics():
+    """
+    Return the number of times each path has been taken in the current process.
+
+    Returns:
+        dict: Counts for every name from ``METRICS``.
+    """
+    with _metrics_lock:
+        return {name: _metrics[name] for name in METRICS}
+
+
+def reset_metrics():
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def acquire_lock(cache, key, timeout):
+    """
+    Try to acquire a lock for a cache key.
+
+    Returns:
+        string: The lock token to release it, ``None`` if the lock is already
+        held.
+    """
+    token = uuid.uuid4().hex
+    if cache.add(key + ":lock", token, timeout):
+        return token
+
+    return None
+
+
+def release_lock(cache, key, token):
+    # The lock may have expired and been acquired by someone else meanwhile
+    if cache.get(key + ":lock") == token:
+        cache.delete(key + ":lock")
+
+
+def is_fresh(expires, delta, beta, now):
+    """
+    Return if an entry can be served without recomputation, with the XFetch
+    probabilistic early expiration.
+
+    Arguments:
+        expires (float): Entry expiration timestamp, ``None`` for no expiration.
+        delta (float): Number of seconds the entry computation took.
+        beta (float): Early expiration factor, greater values recompute earlier,
+            ``0`` disables early expiration.
+        now (float): Current timestamp.
+    """
+    if expires is None:
+        return True
+
+    return now - delta * beta * math.log(1.0 - random.random()) < expires
+
+
+def store(cache, key, compute):
+    """
+    Compute a value and store it with its expiration and computation duration.
+
+    Returns:
+        object: The computed value.
+    """
+    started = time.time()
+    value, timeout = compute()
+    if timeout == 0:
+        return value
+
+    now = time.time()
+    expires = None
+    stored_timeout = None
+    if timeout is not None:
+        expires = now + timeout
+        stored_timeout = timeout + settings.CONTENT_CACHE_STALE_TIMEOUT
+
+    cache.set(key, (value, expires, now - started), stored_timeout)
+
+    return value
+
+
+def compute_locked(cache, locks, key, compute, token):
+    try:
+        return store(cache, key, compute)
+    finally:
+        release_lock(locks, key, token)
+
+
+def get_or_compute(key, compute, cache=None):
+    """
+    Return a value from cache or compute it, protected against stampedes.
+
+    Arguments:
+        key (string): Cache key.
+        compute (callable): Function without arguments which returns a tuple of
+            the value and its timeout in seconds. A timeout of ``0`` means the
+            value is not cached, ``None`` means it never expires.
+
+    Keyword Arguments:
+        cache (object): Cache to use, default to the content cache.
+
+    Returns:
+        object: The cached or computed value.
+    """
+    if cache is None:
+        cache = get_cache()
+    # Locks must never be kept by the local tier
+    locks = getattr(cache, "shared", cache)
+    lock_timeout = settings.CONTENT_CACHE_LOCK_TIMEOUT
+
+    entry = cache.get(key)
+    if entry is not None:
+        value, expires, delta = entry
+        now = time.time()
+
+        if is_fresh(expires, delta, settings.CONTENT_CACHE_EARLY_BETA, now):
+            count_metric("hit")
+            return value
+
+        token = acquire_lock(locks, key, lock_timeout)
+        if token is None:
+            # Someone is recomputing it
+            count_metric("hit" if now < expires else "stale")
+            return value
+
+        count_metric("early" if now < expires else "expired")
+        return compute_locked(cache, locks, key, compute, token)
+
+    token = acquire_lock(locks, key, lock_timeout)
+    if token is not None:
+        count_metric("miss")
+        return compute_locked(cache, locks, key, compute, token)
+
+    # Wait for the lock holder to store the value, polling with a growing delay
+    deadline = time.monotonic() + lock_timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+
+        entry = cache.get(key)
+        if entry is not None:
+            count_metric("wait")
+            return entry[0]
+
+        # Lock holder failed or did not cache its value
+        if locks.get(key + ":lock") is None:
+            token = acquire_lock(locks, key, lock_timeout)
+            if token is not None:
+                count_metric("miss")
+                return compute_locked(cache, locks, key, compute, token)
+
+    count_metric("fallback")
+    return store(cache, key, compute)
@@ -0,0 +1,159 @@
+"""
+Content versions for cache keys.
+
+A version is an opaque token stored in the cache for a scope of content, like a
+blog. Cache keys include the versions of the scopes they depend on, so bumping a
+version makes every related entry unreachable without knowing their keys nor
+flushing the whole cache. Unreachable entries just expire.
+
+Scopes are strings:
+
+* ``blogs``: anything displayed in blog lists, bumped on any blog change and on
+  article changes since lists show article counters;
+* ``blog:<id>``: a blog and its articles.
+
+Signal ``content_invalidated`` is sent with the bumped scopes so other caches
+which can not be versioned (like the CMS placeholder cache) can be cleared.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.dispatch import Signal
+
+from .local import get_local_tier
+
+
+VERSION_KEY_PREFIX = "djangoapp_sample:version:"
+
+BLOG_SCOPE_PREFIX = "blog:"
+
+content_invalidated = Signal()
+"""
+Sent when content versions have been bumped, with argument ``scopes`` as a set of
+scope names.
+"""
+
+
+def get_cache():
+    """
+    Return the cache backend used for application content, behind the local
+    cache tier when it is enabled.
+    """
+    tier = get_local_tier()
+    if tier is not None:
+        return tier
+
+    return caches[settings.CONTENT_CACHE_ALIAS]
+
+
+def blog_scope(pk):
+    return "{}{}".format(BLOG_SCOPE_PREFIX, pk)
+
+
+def blog_ids_from_scopes(scopes):
+    """
+    Return blog ids from blog scopes, other scopes are ignored.
+
+    Arguments:
+        scopes (iterable): Scope names.
+
+    Returns:
+        set: Blog ids.
+    """
+    return {
+        int(scope[len(BLOG_SCOPE_PREFIX):])
+        for scope in scopes
+        if scope.startswith(BLOG_SCOPE_PREFIX)
+    }
+
+
+def new_version():
+    return uuid.uuid4().hex[:12]
+
+
+def get_versions(scopes):
+    """
+    Return the current versions for some scopes.
+
+    Missing versions (never bumped or evicted) are initialized with a new token,
+    an evicted version can not come back to a previous value.
+
+    Arguments:
+        scopes (list): Scope names.
+
+    Returns:
+        dict: Versions for each scope.
+    """
+    cache = get_cache()
+    keys = {VERSION_KEY_PREFIX + scope: scope for scope in scopes}
+
+    found = cache.get_many(list(keys))
+    versions = {keys[key]: value for key, value in found.items()}
+
+    missing = {
+        key: new_version() for key, scope in keys.items() if scope not in versions
+    }
+    if missing:
+        for key, version in missing.items():
+            # Another process may have initialized it meanwhile
+            if not cache.add(key, version, None):
+                version = cache.get(key) or version
+            versions[keys[key]] = version
+
+    return versions
+
+
+def bump_versions(scopes):
+    """
+    Change the versions of some scopes right now.
+
+    Arguments:
+        scopes (iterable): Scope names.
+    """
+    scopes = set(scopes)
+    if scopes:
+        get_cache().set_many(
+            {VERSION_KEY_PREFIX + scope: new_version() for scope in scopes},
+            None,
+        )
+        content_invalidated.send(sender=bump_versions, scopes=scopes)
+
+        # Last so other processes can not keep locally anything from before the
+        # receivers changes
+        tier = get_local_tier()
+        if tier is not None:
+            tier.broadcast_invalidation()
+
+
+def invalidate(scopes, using=None):
+    """
+    Bump versions of some scopes once the current transaction is committed, so
+    concurrent requests can not cache content from before the commit with the
+    new versions. Without transaction versions are bumped immediately.
+
+    Arguments:
+        scopes (iterable): Scope names.
+
+    Keyword Arguments:
+        using (string): Database alias of the transaction.
+    """
+    scopes = set(scopes)
+    if scopes:
+        transaction.on_commit(lambda: bump_versions(scopes), using=using)
+
+
+def invalidate_blogs(pks, using=None):
+    """
+    Invalidate content for some blogs and the blog lists.
+
+    Arguments:
+        pks (iterable): Blog ids, ``None`` values are ignored.
+
+    Keyword Arguments:
+        using (string): Database alias of the transaction.
+    """
+    scopes = {blog_scope(pk) for pk in pks if pk is not None}
+    if scopes:
+        invalidate(scopes | {"blogs"}, using=using)
@@ -0,0 +1,355 @@
+"""
+Cache warming to render content into caches before visitors request it.
+
+HTML pages and API endpoints are requested in-process through the whole Django
+stack as an anonymous user, so they are cached with the very same keys as real
+requests would. Blog plugin article lists are computed directly.
+
+Requests are built with ``RequestFactory`` and given to a request handler with
+the project middlewares, the test client is not used since it patches signals and
+templates for tests.
+"""
+import sys
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.core.signals import got_request_exception
+from django.db import connections
+from django.db.models import Count
+from django.test.client import RequestFactory
+from django.urls import reverse
+
+from ..models import Article, Blog, BlogPluginModel
+from ..plugins.blog import BlogPlugin
+
+
+WarmingTarget = namedtuple("WarmingTarget", ["kind", "label", "run"])
+"""
+A cache warming job.
+
+Attributes:
+    kind (string): Target kind for statistics.
+    label (string): Target description, like its URL.
+    run (callable): Function without arguments which renders the target, it
+        raises an exception when it fails.
+"""
+
+
+class WarmingError(Exception):
+    """
+    A target could not be rendered.
+    """
+    pass
+
+
+WARMING_EXCEPTION_UID = "djangoapp_sample_warming_exception"
+
+
+def remember_request_exception(sender, request=None, **kwargs):
+    """
+    Keep the exception of a warming request, the handler turns it into an error
+    response.
+
+    It is only connected to ``got_request_exception`` during a warming and other
+    requests are ignored.
+    """
+    if request is not None and getattr(request, "is_warming", False):
+        request.warming_exception = sys.exc_info()[1]
+
+
+def format_exception(exception):
+    return "{}: {}".format(exception.__class__.__name__, exception)
+
+
+class RateLimiter:
+    """
+    Space out calls so they are not started more often than a given rate, shared
+    between threads.
+
+    Arguments:
+        rate (float): Maximum number of calls per second, ``None`` for no limit.
+    """
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class CacheWarmer:
+    """
+    Collect targets to warm and render them from a pool of threads.
+
+    Keyword Arguments:
+        pages (integer): Number of pages to warm for the blog index and each blog
+            detail.
+        articles (integer): Number of the most recent published articles to warm.
+        languages (list): Language codes to request pages with, default to
+            setting ``LANGUAGE_CODE``.
+        host (string): Host name to request with, it must be allowed by
+            ``ALLOWED_HOSTS``.
+        workers (integer): Maximum number of targets rendered at the same time.
+        rate (float): Maximum number of targets started per second, to bound the
+            database load. ``None`` for no limit.
+    """
+    def __init__(self, pages=1, articles=20, languages=None, host="localhost",
+                 workers=4, rate=None):
+        self.pages = pages
+        self.articles = articles
+        self.languages = languages or [settings.LANGUAGE_CODE]
+        self.host = host
+        self.workers = workers
+        self.limiter = RateLimiter(rate)
+
+        # Middlewares are loaded once, the handler is shared by every thread like
+        # with a WSGI server
+        self.handler = BaseHandler()
+        self.handler.load_middleware()
+
+    def request(self, url, language, accept="text/html"):
+        """
+        Return a function which requests an URL.
+
+        Raises:
+            WarmingError: From the returned function when the response is not
+            successful.
+        """
+        def run():
+            request = RequestFactory().get(
+                url,
+                HTTP_HOST=self.host,
+                HTTP_ACCEPT=accept,
+                HTTP_ACCEPT_LANGUAGE=language,
+            )
+            request.is_warming = True
+
+            response = self.handler.get_response(request)
+            if response.status_code != 200:
+                message = "Response status {}".format(response.status_code)
+                exception = getattr(request, "warming_exception", None)
+                if exception is not None:
+                    message += ": {}".format(format_exception(exception))
+                raise WarmingError(message)
+
+        return run
+
+    def page_urls(self, url, count):
+        """
+        Return URLs of the first pages of a paginated view.
+
+        With cursor pagination only the first page URL is known.
+        """
+        pages = min(self.pages, max(count, 1))
+        if settings.LISTING_PAGINATION_MODE == "cursor":
+            pages = min(pages, 1)
+
+        return [url] + [
+            "{}?page={}".format(url, number) for number in range(2, pages + 1)
+        ]
+
+    def get_url_targets(self):
+        """
+        Return URL targets as ``(kind, url, accept)`` tuples.
+        """
+        index_pages = -(-Blog.objects.count() // settings.BLOG_PAGINATION)
+        for url in self.page_urls(
+            reverse("djangoapp_sample:blog-index"), index_pages
+        ):
+            yield "blog-index", url, "text/html"
+
+        # Pages are requested anonymously, they only list published articles
+        published = dict(
+            Article.objects.published().order_by().values("blog_id")
+            .annotate(count=Count("id")).values_list("blog_id", "count")
+        )
+        for blog in Blog.objects.order_by("pk").only("id"):
+            for url in self.page_urls(
+                blog.get_absolute_url(),
+                -(-published.get(blog.pk, 0) // settings.ARTICLE_PAGINATION),
+            ):
+                yield "blog-detail", url, "text/html"
+
+        if self.articles:
+            articles = Article.objects.published().order_by(
+                "-publish_start", "-id"
+            ).only("id", "blog")[:self.articles]
+            for article in articles:
+                yield "article-detail", article.get_absolute_url(), "text/html"
+
+        for viewname in ("djangoapp_sample:api-blog-list",
+                         "djangoapp_sample:api-article-list"):
+            yield "api-list", reverse(viewname), "application/json"
+
+    def get_plugin_targets(self):
+        plugin = BlogPlugin(BlogPluginModel, None)
+
+        def render(instance):
+            def run():
+                plugin.get_articles(instance)
+
+            return run
+
+        instances = BlogPluginModel.objects.select_related("blog").order_by("pk")
+        for instance in instances:
+            yield WarmingTarget(
+                "blog-plugin", "plugin {}".format(instance.pk), render(instance)
+            )
+
+    def get_targets(self):
+        """
+        Return every target to warm.
+
+        Returns:
+            list: ``WarmingTarget`` objects.
+        """
+        targets = [
+            WarmingTarget(kind, url, self.request(url, language, accept))
+            for kind, url, accept in self.get_url_targets()
+            for language in self.languages
+        ]
+        targets.extend(self.get_plugin_targets())
+
+        return targets
+
+    def warm_target(self, target):
+        """
+        Render a target.
+
+        Returns:
+            tuple: The target, the error message or ``None`` if it succeeded and
+            the elapsed time in seconds.
+        """
+        self.limiter.wait()
+        started = time.monotonic()
+        error = None
+        try:
+            target.run()
+        except WarmingError as exception:
+            error = str(exception)
+        except Exception as exception:
+            # A failing target must not stop the warming of the others
+            error = format_exception(exception)
+        finally:
+            # Threads from the pool do not close their connections by themselves
+            if threading.current_thread() is not threading.main_thread():
+                connections.close_all()
+
+        return target, error, time.monotonic() - started
+
+    def run(self, targets=None):
+        """
+        Warm targets.
+
+        Keyword Arguments:
+            targets (list): Targets to warm, default to ``get_targets()``.
+
+        Returns:
+            WarmingStatistics: Statistics from the warming.
+        """
+        targets = self.get_targets() if targets is None else targets
+        statistics = WarmingStatistics(self.workers)
+
+        got_request_exception.connect(
+            remember_request_exception, dispatch_uid=WARMING_EXCEPTION_UID
+        )
+        try:
+            if self.workers <= 1:
+                for target in targets:
+                    statistics.add(*self.warm_target(target))
+            else:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    for result in executor.map(self.warm_target, targets):
+                        statistics.add(*result)
+        finally:
+            got_request_exception.disconnect(dispatch_uid=WARMING_EXCEPTION_UID)
+
+        statistics.stop()
+
+        return statistics
+
+
+class WarmingStatistics:
+    """
+    Counters and durations of a cache warming.
+
+    Arguments:
+        workers (integer): Number of workers used.
+    """
+    def __init__(self, workers):
+        self.workers = workers
+        self.started = time.monotonic()
+        self.elapsed = None
+        self.succeeded = Counter()
+        self.failed = Counter()
+        self.durations = Counter()
+        self.failures = []
+
+    def add(self, target, error, duration):
+        if error is None:
+            self.succeeded[target.kind] += 1
+        else:
+            self.failed[target.kind] += 1
+            self.failures.append((target.label, error))
+        self.durations[target.kind] += duration
+
+    def stop(self):
+        self.elapsed = time.monotonic() - self.started
+
+    @property
+    def total(self):
+        return sum(self.succeeded.values()) + sum(self.failed.values())
+
+    @property
+    def throughput(self):
+        """
+        Number of warmed targets per second.
+        """
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def lines(self):
+        """
+        Return a human readable report.
+
+        Returns:
+            list: Report lines.
+        """
+        lines = [
+            "Warmed {} of {} targets in {:.2f}s ({:.1f}/s) with {} worker(s).".format(
+                sum(self.succeeded.values()),
+                self.total,
+                self.elapsed or 0,
+                self.throughput,
+                self.workers,
+            )
+        ]
+
+        for kind in sorted(set(self.succeeded) | set(self.failed)):
+            count = self.succeeded[kind] + self.failed[kind]
+            lines.append(
+                "- {}: {} ok, {} failed, {:.1f}ms average".format(
+                    kind,
+                    self.succeeded[kind],
+                    self.failed[kind],
+                    self.durations[kind] / count * 1000,
+                )
+            )
+
+        for label, error in self.failures:
+            lines.append("Failed: {} ({})".format(label, error))
+
+        return lines
@@ -0,0 +1,231 @@
+"""
+API filter backends.
+"""
+import sys
+from collections import namedtuple
+
+from django.template import loader
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from .serializers import ArticleFilterSerializer
+
+
+SURROGATES = (0xD800, 0xDFFF)
+"""
+First and last code points of surrogates.
+"""
+
+IndexPlan = namedtuple("IndexPlan", ["index", "equal", "range", "orderings"])
+"""
+A combination of filters and ordering served by an index.
+
+Attributes:
+    index (string): Name of the index.
+    equal (tuple): Fields filtered on equality, they are the first index columns.
+    range (string): Field filtered on a range, it follows the equality columns.
+    orderings (tuple): Allowed orderings, the first one is the default.
+"""
+
+
+class IndexedArticleFilterBackend(BaseFilterBackend):
+    """
+    Filter and order article lists, only for combinations served by an index.
+
+    Query arguments are:
+
+    * ``blog``: Blog id;
+    * ``publish_after`` and ``publish_before``: Publication start range;
+    * ``title_prefix``: Title start, case sensitive;
+    * ``ordering``: One of ``-publish_start``, ``publish_start``, ``title`` or
+      ``-title``, default to the first ordering of the matching index.
+
+    A combination which is not in ``index_plans`` is rejected with a validation
+    error, so clients can not trigger table scans or sorts. Ordering is applied
+    by the cursor pagination from ``get_ordering()``, the primary key breaks ties
+    in the same direction as the index.
+    """
+    template = "djangoapp_sample/api/article_filters.html"
+
+    index_plans = [
+        IndexPlan(
+            "article_blog_pub_id_idx",
+            ("blog",),
+            "publish_start",
+            ("-publish_start", "publish_start"),
+        ),
+        IndexPlan(
+            "article_pub_id_idx",
+            (),
+            "publish_start",
+            ("-publish_start", "publish_start"),
+        ),
+        IndexPlan(
+            "article_title_id_idx",
+            (),
+            "title",
+            ("title", "-title"),
+        ),
+    ]
+
+    tiebreakers = {
+        "-publish_start": "id",
+        "publish_start": "-id",
+        "title": "id",
+        "-title": "-id",
+    }
+
+    def get_filters(self, request):
+        """
+        Return validated filter values from request query arguments.
+
+        Raises:
+            rest_framework.exceptions.ValidationError: For invalid values.
+        """
+        serializer = ArticleFilterSerializer(data={
+            name: value
+            for name, value in request.query_params.items()
+            if name in ArticleFilterSerializer._declared_fields
+        })
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data
+
+    def get_plan(self, filters):
+        """
+        Return the index plan which serves the filters.
+
+        Returns:
+            tuple: The index plan and the ordering to apply.
+
+        Raises:
+            rest_framework.exceptions.ValidationError: When no index serves the
+            combination.
+        """
+        equal = set()
+        if "blog" in filters:
+            equal.add("blog")
+
+        ranges = set()
+        if "publish_after" in filters or "publish_before" in filters:
+            ranges.add("publish_start")
+        if "title_prefix" in filters:
+            ranges.add("title")
+
+        ordering = filters.get("ordering")
+        for plan in self.index_plans:
+            if (
+                set(plan.equal) == equal
+                and ranges <= {plan.range}
+                and (ordering is None or ordering in plan.orderings)
+            ):
+                return plan, ordering or plan.orderings[0]
+
+        raise ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: [
+                "This combination of filters and ordering is not indexed."
+            ],
+        })
+
+    def get_ordering(self, request, queryset, view):
+        _, ordering = self.get_plan(self.get_filters(request))
+
+        return (ordering, self.tiebreakers[ordering])
+
+    def filter_queryset(self, request, queryset, view):
+        filters = self.get_filters(request)
+        _, ordering = self.get_plan(filters)
+
+        if "blog" in filters:
+            queryset = queryset.filter(blog_id=filters["blog"])
+        if "publish_after" in filters:
+            queryset = queryset.filter(publish_start__gte=filters["publish_after"])
+        if "publish_before" in filters:
+            queryset = queryset.filter(publish_start__lt=filters["publish_before"])
+        if "title_prefix" in filters:
+            queryset = self.filter_prefix(queryset, "title", filters["title_prefix"])
+
+        return queryset.order_by(ordering, self.tiebreakers[ordering])
+
+    def get_prefix_upper_bound(self, prefix):
+        """
+        Return the smallest string greater than every string starting with a
+        prefix.
+
+        The last character is incremented, trailing characters which are the last
+        code point can not be incremented so they are dropped first. Surrogates
+        are skipped since they can not be encoded.
+
+        Returns:
+            string: The upper bound or ``None`` when the prefix only has last code
+            points, then there is no upper bound.
+        """
+        prefix = prefix.rstrip(chr(sys.maxunicode))
+        if not prefix:
+            return None
+
+        code = ord(prefix[-1]) + 1
+        if SURROGATES[0] <= code <= SURROGATES[1]:
+            code = SURROGATES[1] + 1
+
+        return prefix[:-1] + chr(code)
+
+    def filter_prefix(self, queryset, name, prefix):
+        """
+        Filter on a prefix with a range an index can serve, ``LIKE`` can not use
+        an index on every database. The prefix is checked again on the range rows.
+        """
+        lookups = {
+            name + "__gte": prefix,
+            name + "__startswith": prefix,
+        }
+        upper = self.get_prefix_upper_bound(prefix)
+        if upper is not None:
+            lookups[name + "__lt"] = upper
+
+        return queryset.filter(**lookups)
+
+    def to_html(self, request, queryset, view):
+        context = {
+            "values": request.query_params,
+            "orderings": ArticleFilterSerializer.ORDERINGS,
+        }
+
+        return loader.get_template(self.template).render(context, request)
+
+    def get_schema_operation_parameters(self, view):
+        descriptions = [
+            ("blog", "integer", None, "Blog id."),
+            ("publish_after", "string", "date-time",
+             "Only articles published from this date."),
+            ("publish_before", "string", "date-time",
+             "Only articles published before this date."),
+            ("title_prefix", "string", None, "Title start, case sensitive."),
+        ]
+
+        parameters = []
+        for name, kind, format, description in descriptions:
+            schema = {"type": kind}
+            if format:
+                schema["format"] = format
+            parameters.append({
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": description,
+                "schema": schema,
+            })
+
+        parameters.append({
+            "name": "ordering",
+            "required": False,
+            "in": "query",
+            "description": (
+                "Result ordering, combinations of filters and ordering which are "
+                "not indexed are rejected."
+            ),
+            "schema": {"type": "string", "enum": ArticleFilterSerializer.ORDERINGS},
+        })
+
+        return parameters
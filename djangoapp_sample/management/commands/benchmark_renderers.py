@@ -0,0 +1,103 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from ...models import Article, Blog
+from ...renderers import get_fast_renderer_classes
+from ...serializers import (
+    ArticleResumeSerializer, ArticleSerializer, BlogSerializer, plan_queryset,
+)
+
+
+SERIALIZERS = {
+    "article": (Article, ArticleSerializer),
+    "article-resume": (Article, ArticleResumeSerializer),
+    "blog": (Blog, BlogSerializer),
+}
+
+
+class Command(BaseCommand):
+    """
+    Compare the available API renderers on the data of an application serializer.
+
+    Objects are serialized once from the database then the same data is rendered
+    many times by each renderer, only the rendering is measured.
+    """
+    help = (
+        "Benchmark the API renderers (standard JSON and the installed fast "
+        "renderers) on serialized articles or blogs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--serializer",
+            choices=sorted(SERIALIZERS),
+            default="article",
+            help="Serializer to get data from. Default to 'article'.",
+        )
+        parser.add_argument(
+            "--objects",
+            type=int,
+            default=100,
+            help="Maximum number of objects to serialize. Default to 100.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of times each renderer renders the data. Default to 20.",
+        )
+
+    def get_data(self, name, limit):
+        model, serializer_class = SERIALIZERS[name]
+        # Without request, hyperlinks are relative URLs
+        context = {"request": None}
+        queryset = plan_queryset(
+            model.objects.order_by("pk"),
+            serializer_class(many=True, context=context),
+        )
+
+        return serializer_class(queryset[:limit], many=True, context=context).data
+
+    def measure(self, renderer, data, repeat):
+        """
+        Return the best rendering duration in seconds and the rendered size.
+        """
+        best = None
+        for i in range(repeat):
+            started = time.perf_counter()
+            content = renderer.render(data)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+
+        return best, len(content)
+
+    def handle(self, *args, **options):
+        if options["objects"] < 1:
+            raise CommandError("Objects must be a positive integer.")
+        if options["repeat"] < 1:
+            raise CommandError("Repeat must be a positive integer.")
+
+        data = self.get_data(options["serializer"], options["objects"])
+        if not data:
+            raise CommandError("There is no object to serialize.")
+
+        self.stdout.write(
+            "Rendered {} object(s) from serializer '{}', best of {}:".format(
+                len(data), options["serializer"], options["repeat"]
+            )
+        )
+
+        reference = None
+        for klass in [JSONRenderer] + get_fast_renderer_classes():
+            duration, size = self.measure(klass(), data, options["repeat"])
+            reference = reference or duration
+            self.stdout.write(
+                "- {}: {:.3f}ms, {} bytes, {:.1f}x".format(
+                    klass.__name__,
+                    duration * 1000,
+                    size,
+                    reference / duration if duration else 0.0,
+                )
+            )
@@ -0,0 +1,129 @@
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...bulk.importer import FORMATS, BulkImporter, read_rows
+
+
+class Command(BaseCommand):
+    """
+    Import blogs or articles from a JSONL or CSV file.
+
+    Article rows expect keys ``blog``, ``title``, ``content`` and
+    ``publish_start``, blog rows only expect key ``title``.
+    """
+    help = (
+        "Import blogs or articles from a JSONL or CSV file by batches. Use '-' as "
+        "path to read from standard input."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "kind",
+            choices=["blogs", "articles"],
+            help="Kind of objects to import.",
+        )
+        parser.add_argument(
+            "path",
+            help="Path to the file to import.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default=None,
+            help=(
+                "Input format, guessed from file extension if not given, default to "
+                "'jsonl' for standard input."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to write per batch. Default to 1000.",
+        )
+        parser.add_argument(
+            "--blog-key",
+            choices=["auto", "id", "title"],
+            default="auto",
+            help=(
+                "How to resolve article blog: 'id' for blog ids, 'title' for blog "
+                "titles which are created when missing, 'auto' for id with integer "
+                "values else title. Default to 'auto'."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to import into. Default to 'default'.",
+        )
+
+    def get_format(self, path, format):
+        if format:
+            return format
+
+        if path == "-":
+            return "jsonl"
+
+        suffix = Path(path).suffix.lstrip(".").lower()
+        if suffix == "ndjson":
+            return "jsonl"
+        if suffix in FORMATS:
+            return suffix
+
+        raise CommandError(
+            "Unable to guess format from path, use '--format' option."
+        )
+
+    def report(self, stats):
+        if self.verbosity > 1:
+            self.stdout.write(
+                "- {read} rows read ({rate:.0f} rows/s)".format(
+                    read=stats.read,
+                    rate=stats.rate,
+                )
+            )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        path = options["path"]
+        format = self.get_format(path, options["format"])
+
+        if options["batch_size"] < 1:
+            raise CommandError("Batch size must be a positive integer.")
+
+        importer = BulkImporter(
+            batch_size=options["batch_size"],
+            blog_key=options["blog_key"],
+            using=options["database"],
+        )
+        method = getattr(importer, "import_{}".format(options["kind"]))
+
+        try:
+            if path == "-":
+                stats = method(read_rows(sys.stdin, format), callback=self.report)
+            else:
+                with open(path, newline="", encoding="utf-8") as stream:
+                    stats = method(read_rows(stream, format), callback=self.report)
+        except OSError as e:
+            raise CommandError("Unable to open file: {}".format(e))
+        except ValueError as e:
+            # Previous batches have already been written
+            raise CommandError("Import aborted: {}".format(e))
+
+        for line, message in stats.errors:
+            self.stderr.write("Row {}: {}".format(line, message))
+
+        self.stdout.write(
+            (
+                "Imported {written} {kind} from {read} rows in {elapsed:.2f}s "
+                "({rate:.0f} rows/s)."
+            ).format(
+                written=stats.written,
+                kind=options["kind"],
+                read=stats.read,
+                elapsed=stats.elapsed,
+                rate=stats.rate,
+            )
+        )
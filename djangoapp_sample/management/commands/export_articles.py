@@ -0,0 +1,133 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ...bulk.exporter import CONTENT_TYPES, export_lines, filter_articles
+from ...models import Article
+
+
+class Command(BaseCommand):
+    """
+    Export articles to a NDJSON or CSV file.
+
+    Exported files can be imported back with the ``bulk_import`` command.
+    """
+    help = (
+        "Export articles to a NDJSON or CSV file without loading them all in "
+        "memory. Use '-' as path to write to standard output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="Path to the file to write.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=list(CONTENT_TYPES.keys()),
+            default=None,
+            help=(
+                "Output format, guessed from file extension if not given, default "
+                "to 'ndjson' for standard output."
+            ),
+        )
+        parser.add_argument(
+            "--blog",
+            type=int,
+            default=None,
+            help="Only export articles from this blog id.",
+        )
+        parser.add_argument(
+            "--publish-after",
+            default=None,
+            help="Only export articles published from this ISO datetime.",
+        )
+        parser.add_argument(
+            "--publish-before",
+            default=None,
+            help="Only export articles published before this ISO datetime.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help=(
+                "Number of rows fetched from database at once. Default to setting "
+                "'ARTICLE_EXPORT_CHUNK_SIZE'."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to export from. Default to 'default'.",
+        )
+
+    def get_format(self, path, format):
+        if format:
+            return format
+
+        if path == "-":
+            return "ndjson"
+
+        suffix = Path(path).suffix.lstrip(".").lower()
+        if suffix in ("ndjson", "jsonl"):
+            return "ndjson"
+        if suffix in CONTENT_TYPES:
+            return suffix
+
+        raise CommandError(
+            "Unable to guess format from path, use '--format' option."
+        )
+
+    def get_datetime(self, value, name):
+        if value is None:
+            return None
+
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise CommandError("Invalid datetime for '{}': {}".format(name, value))
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+
+        return parsed
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = self.get_format(path, options["format"])
+
+        if options["chunk_size"] is not None and options["chunk_size"] < 1:
+            raise CommandError("Chunk size must be a positive integer.")
+
+        queryset = filter_articles(
+            Article.objects.using(options["database"]),
+            blog=options["blog"],
+            publish_after=self.get_datetime(
+                options["publish_after"], "--publish-after"
+            ),
+            publish_before=self.get_datetime(
+                options["publish_before"], "--publish-before"
+            ),
+        )
+        lines = export_lines(queryset, format, chunk_size=options["chunk_size"])
+
+        if path == "-":
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        count = 0
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as stream:
+                for line in lines:
+                    stream.write(line)
+                    count += 1
+        except OSError as e:
+            raise CommandError("Unable to write file: {}".format(e))
+
+        # CSV has a header line
+        if format == "csv":
+            count -= 1
+
+        self.stdout.write("Exported {} articles to {}.".format(max(count, 0), path))
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ...models import Blog
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the denormalized article counter of blogs.
+
+    Blogs are processed by chunks of primary keys, each chunk in its own
+    transaction so the command does not lock the whole blog table on large
+    databases.
+    """
+    help = (
+        "Rebuild the article counter of every blog from the real article rows. "
+        "Only the drifted counters are written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of blogs to process per transaction. Default to 500.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("Chunk size must be a positive integer.")
+
+        processed = 0
+        corrected = 0
+        last_pk = 0
+
+        while True:
+            pks = list(
+                Blog.objects.filter(pk__gt=last_pk).order_by("pk").values_list(
+                    "pk", flat=True
+                )[:chunk_size]
+            )
+            if not pks:
+                break
+
+            with transaction.atomic():
+                corrected += Blog.objects.filter(pk__in=pks).recount_articles()
+
+            processed += len(pks)
+            last_pk = pks[-1]
+
+        self.stdout.write(
+            "Processed {processed} blog(s), corrected {corrected} counter(s).".format(
+                processed=processed,
+                corrected=corrected,
+            )
+        )
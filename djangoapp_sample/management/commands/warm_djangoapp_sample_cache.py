@@ -0,0 +1,107 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ...cache.warming import CacheWarmer
+
+
+class Command(BaseCommand):
+    """
+    Render blog pages, article pages, API lists and blog plugin article lists into
+    the caches.
+
+    Only content from enabled caches is kept, see settings ``VIEW_CACHE_ENABLED``,
+    ``REPRESENTATION_CACHE_ENABLED`` and ``BLOG_PLUGIN_CACHE_TIMEOUT``.
+    """
+    help = (
+        "Warm application caches by rendering the blog index, the first pages of "
+        "each blog, the most recent articles, the API lists and every blog plugin "
+        "article list."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=1,
+            help=(
+                "Number of pages to warm for the blog index and each blog. Only the "
+                "first page is warmed with cursor pagination. Default to 1."
+            ),
+        )
+        parser.add_argument(
+            "--articles",
+            type=int,
+            default=20,
+            help="Number of most recent published articles to warm. Default to 20.",
+        )
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            default=None,
+            help=(
+                "Language code to warm pages for, can be given many times. Default "
+                "to setting 'LANGUAGE_CODE'."
+            ),
+        )
+        parser.add_argument(
+            "--host",
+            default=None,
+            help=(
+                "Host name to request pages with. Default to the first host from "
+                "setting 'ALLOWED_HOSTS' or 'localhost'."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of targets rendered at the same time. Default to 4.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=None,
+            help=(
+                "Maximum number of targets started per second to bound the "
+                "database load. Default to no limit."
+            ),
+        )
+
+    def get_host(self, host):
+        if host:
+            return host
+
+        for allowed in settings.ALLOWED_HOSTS:
+            if allowed and allowed != "*" and not allowed.startswith("."):
+                return allowed
+
+        return "localhost"
+
+    def handle(self, *args, **options):
+        if options["pages"] < 1:
+            raise CommandError("Pages must be a positive integer.")
+        if options["articles"] < 0:
+            raise CommandError("Articles can not be negative.")
+        if options["workers"] < 1:
+            raise CommandError("Workers must be a positive integer.")
+        if options["rate"] is not None and options["rate"] <= 0:
+            raise CommandError("Rate must be a positive number.")
+
+        if not settings.VIEW_CACHE_ENABLED:
+            self.stdout.write(
+                "View cache is disabled, HTML pages are rendered but not cached."
+            )
+
+        warmer = CacheWarmer(
+            pages=options["pages"],
+            articles=options["articles"],
+            languages=options["languages"],
+            host=self.get_host(options["host"]),
+            workers=options["workers"],
+            rate=options["rate"],
+        )
+        statistics = warmer.run()
+
+        for line in statistics.lines():
+            self.stdout.write(line)
@@ -0,0 +1,16 @@
+from .cached import CachedQuerySetMixin, invalidate_tables
+from .blog import BlogManager, BlogQuerySet
+from .article import ArticleManager, ArticleQuerySet
+from .plugin import BlogPluginManager, BlogPluginQuerySet
+
+
+__all__ = [
+    "ArticleManager",
+    "ArticleQuerySet",
+    "BlogManager",
+    "BlogPluginManager",
+    "BlogPluginQuerySet",
+    "BlogQuerySet",
+    "CachedQuerySetMixin",
+    "invalidate_tables",
+]
@@ -0,0 +1,249 @@
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from ..cache import invalidate_blogs
+
+from .cached import CachedQuerySetMixin, invalidate_tables
+
+
+def freshness_aggregates(prefix="", now=None):
+    """
+    Return aggregates over articles which change whenever a published article list
+    would change: article edits, additions and removals, but also articles which
+    have been published or ended since.
+
+    Keyword Arguments:
+        prefix (string): Lookup prefix to aggregate articles from a relation,
+            like ``article__``.
+        now (datetime.datetime): Current date, default to current date.
+
+    Returns:
+        dict: Aggregate expressions.
+    """
+    now = now or timezone.now()
+
+    return {
+        "updated": Max(prefix + "updated_at"),
+        "started": Max(
+            prefix + "publish_start",
+            filter=Q(**{prefix + "publish_start__lte": now}),
+        ),
+        "ended": Max(
+            prefix + "publish_end",
+            filter=Q(**{prefix + "publish_end__lte": now}),
+        ),
+        "count": Count(prefix + "pk", distinct=bool(prefix)),
+    }
+
+
+class ArticleQuerySet(CachedQuerySetMixin, models.QuerySet):
+    """
+    Article queryset with named projections for common usages and which keeps the
+    ``Blog.article_count`` counter correct and invalidates cached blog content and
+    cached queryset results on bulk operations that do not trigger model signals.
+    """
+    def for_listing(self):
+        """
+        Projection for article lists which only display titles, dates and links.
+
+        The related blog is not loaded, only its id is needed to build article
+        URL.
+        """
+        return self.only("id", "blog", "title", "publish_start")
+
+    def for_feed(self):
+        """
+        Projection for article lists which display a resume of the related blog,
+        like the API list endpoint.
+
+        Last update dates are loaded since they are the versions of cached
+        representations.
+        """
+        return self.select_related("blog").only(
+            "id", "blog", "title", "publish_start", "updated_at",
+            "blog__id", "blog__title", "blog__updated_at",
+        )
+
+    def for_detail(self):
+        """
+        Projection for a complete article with its related blog.
+        """
+        return self.select_related("blog")
+
+    def published(self, now=None):
+        """
+        Filter articles which are currently published, their publication has
+        started and is not ended yet.
+
+        Blog article lists are served by the composite indexes starting with blog
+        and publication start, the publication end is only checked on the rows
+        they return.
+
+        Keyword Arguments:
+            now (datetime.datetime): Date to filter on, default to current date.
+        """
+        now = now or timezone.now()
+
+        return self.filter(publish_start__lte=now).filter(
+            Q(publish_end__isnull=True) | Q(publish_end__gt=now)
+        )
+
+    def visible_to(self, user, now=None):
+        """
+        Filter articles visible to an user, users with the article change
+        permission see every article else only the published ones.
+
+        Arguments:
+            user (django.contrib.auth.models.User): User, may be anonymous.
+
+        Keyword Arguments:
+            now (datetime.datetime): Date to filter on, default to current date.
+        """
+        opts = self.model._meta
+        if user is not None and user.has_perm(
+            "{}.change_{}".format(opts.app_label, opts.model_name)
+        ):
+            return self
+
+        return self.published(now=now)
+
+    def next_visibility_change(self, now=None):
+        """
+        Return the date of the next article publication start or end from this
+        queryset, it is when the published articles will change.
+
+        Each date is an indexed lookup of the first upcoming value.
+
+        Keyword Arguments:
+            now (datetime.datetime): Date to search from, default to current date.
+
+        Returns:
+            datetime.datetime: The next change date or ``None`` if there is no
+            scheduled change.
+        """
+        now = now or timezone.now()
+        queryset = self.order_by()
+
+        changes = [
+            queryset.filter(**{"{}__gt".format(name): now}).order_by(
+                name
+            ).values_list(name, flat=True).first()
+            for name in ("publish_start", "publish_end")
+        ]
+        changes = [item for item in changes if item is not None]
+
+        return min(changes) if changes else None
+
+    def freshness(self, now=None):
+        """
+        Aggregate values to build cache validators for this queryset articles and
+        their blogs.
+
+        Keyword Arguments:
+            now (datetime.datetime): Current date, default to current date.
+
+        Returns:
+            dict: Last article update, last started and ended publications, the
+            article count and the last blog update.
+        """
+        return self.order_by().aggregate(
+            blog_updated=Max("blog__updated_at"),
+            **freshness_aggregates(now=now),
+        )
+
+    def _blog_queryset(self):
+        return self.model._meta.get_field("blog").related_model.objects.using(
+            self.db
+        )
+
+    def _count_by_blog(self):
+        """
+        Return the number of articles per blog from this queryset.
+
+        Returns:
+            collections.Counter: Blog ids as keys and their article count as values.
+        """
+        return Counter(dict(
+            self.order_by().values_list("blog_id").annotate(
+                total=models.Count("pk")
+            )
+        ))
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            created = super().bulk_create(objs, *args, **kwargs)
+
+            # On conflict some rows may have been ignored or updated, we can not
+            # know what have been inserted so related blogs are recounted
+            if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+                self._blog_queryset().filter(
+                    pk__in={obj.blog_id for obj in objs}
+                ).recount_articles()
+            else:
+                self._blog_queryset().adjust_article_count(
+                    Counter(obj.blog_id for obj in objs)
+                )
+
+            invalidate_blogs({obj.blog_id for obj in objs}, using=self.db)
+            invalidate_tables([self.model], using=self.db)
+
+        return created
+
+    def update(self, **kwargs):
+        # Like 'auto_now' on save
+        kwargs.setdefault("updated_at", timezone.now())
+
+        if "blog" not in kwargs and "blog_id" not in kwargs:
+            blog_ids = list(
+                self.order_by().values_list("blog_id", flat=True).distinct()
+            )
+            updated = super().update(**kwargs)
+            invalidate_blogs(blog_ids, using=self.db)
+            invalidate_tables([self.model], using=self.db)
+
+            return updated
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            rows = list(self.order_by().values_list("pk", "blog_id"))
+            updated = super().update(**kwargs)
+
+            # Blogs that lost articles and blogs that received them, a blog
+            # assignment may be an expression (like from 'bulk_update') so we can
+            # not guess the target blogs
+            blog_ids = {blog_id for pk, blog_id in rows}
+            blog_ids.update(
+                self.model._base_manager.using(self.db).filter(
+                    pk__in=[pk for pk, blog_id in rows]
+                ).order_by().values_list("blog_id", flat=True).distinct()
+            )
+            self._blog_queryset().filter(pk__in=blog_ids).recount_articles()
+            invalidate_blogs(blog_ids, using=self.db)
+            invalidate_tables([self.model], using=self.db)
+
+        return updated
+
+    update.alters_data = True
+
+    def delete(self):
+        with transaction.atomic(using=self.db, savepoint=False):
+            deltas = self._count_by_blog()
+            deleted = super().delete()
+            self._blog_queryset().adjust_article_count(
+                {pk: -total for pk, total in deltas.items()}
+            )
+            invalidate_blogs(deltas.keys(), using=self.db)
+            invalidate_tables([self.model], using=self.db)
+
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
+    pass
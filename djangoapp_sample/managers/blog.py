@@ -0,0 +1,156 @@
+from collections import defaultdict
+
+from django.db import models
+from django.db.models import Count, F, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ..cache import invalidate_blogs
+
+from .article import freshness_aggregates
+from .cached import CachedQuerySetMixin, invalidate_tables
+
+
+class BlogQuerySet(CachedQuerySetMixin, models.QuerySet):
+    """
+    Blog queryset with helpers to maintain the denormalized article counter.
+
+    Bulk creations and updates invalidate the cached content of their blogs and
+    cached queryset results since they do not trigger model signals, updates also
+    change the last update date.
+    """
+    def _article_model(self):
+        """
+        Return the Article model from the reverse relation so we do not need to
+        import it (which would be a circular import).
+        """
+        return self.model._meta.get_field("article").related_model
+
+    def _real_article_count(self):
+        """
+        Return a subquery expression which counts the articles of the outer blog.
+        """
+        counts = self._article_model().objects.filter(
+            blog=OuterRef("pk")
+        ).order_by().values("blog").annotate(total=Count("pk")).values("total")
+
+        return Coalesce(Subquery(counts), 0)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        created = super().bulk_create(objs, *args, **kwargs)
+        invalidate_blogs({obj.pk for obj in created}, using=self.db)
+        invalidate_tables([self.model], using=self.db)
+
+        return created
+
+    def update(self, **kwargs):
+        kwargs.setdefault("updated_at", timezone.now())
+        pks = list(self.order_by().values_list("pk", flat=True))
+
+        return self._update_blogs(pks, **kwargs)
+
+    update.alters_data = True
+
+    def _update_blogs(self, pks, **kwargs):
+        """
+        Update the queryset blogs and invalidate them, for callers which already
+        know the blog ids so they are not queried again.
+
+        Arguments:
+            pks (iterable): Ids of the blogs the queryset matches.
+
+        Returns:
+            int: Number of updated blog rows.
+        """
+        kwargs.setdefault("updated_at", timezone.now())
+        updated = super().update(**kwargs)
+        invalidate_blogs(pks, using=self.db)
+        invalidate_tables([self.model], using=self.db)
+
+        return updated
+
+    _update_blogs.alters_data = True
+
+    def freshness(self, articles=False, now=None):
+        """
+        Aggregate values to build cache validators for this queryset blogs.
+
+        Keyword Arguments:
+            articles (boolean): Include aggregates over blog articles, for
+                content displaying blog articles.
+            now (datetime.datetime): Current date, default to current date.
+
+        Returns:
+            dict: Last blog update and the blog count, with article aggregates
+            prefixed by ``articles_`` if enabled.
+        """
+        aggregates = {
+            "blog_updated": Max("updated_at"),
+            "blog_count": Count("pk", distinct=True),
+        }
+        if articles:
+            aggregates.update({
+                "articles_" + name: aggregate
+                for name, aggregate in freshness_aggregates(
+                    prefix="article__", now=now
+                ).items()
+            })
+
+        return self.order_by().aggregate(**aggregates)
+
+    def adjust_article_count(self, deltas):
+        """
+        Apply relative changes to the article counter of some blogs.
+
+        Changes are made with ``F()`` expressions so they are safe against
+        concurrent writes. Blogs sharing the same delta are updated with a single
+        query. Blog last update date is changed since its article list changed.
+
+        Arguments:
+            deltas (dict): Blog ids as keys and value to add to their counter as
+                values, negative values decrement the counter.
+
+        Returns:
+            int: Number of updated blog rows.
+        """
+        by_delta = defaultdict(list)
+        for pk, delta in deltas.items():
+            if pk is not None and delta:
+                by_delta[delta].append(pk)
+
+        updated = 0
+        for delta, pks in by_delta.items():
+            updated += self.filter(pk__in=pks)._update_blogs(
+                pks, article_count=F("article_count") + delta
+            )
+
+        return updated
+
+    def recount_articles(self):
+        """
+        Recompute the article counter of blogs from this queryset from their real
+        article rows.
+
+        Only the blogs with a drifted counter are written.
+
+        Returns:
+            int: Number of blogs which have been corrected.
+        """
+        real_count = self._real_article_count()
+
+        drifted = list(
+            self.annotate(real_count=real_count)
+            .exclude(article_count=F("real_count"))
+            .order_by()
+            .values_list("pk", flat=True)
+        )
+        if not drifted:
+            return 0
+
+        return self.model.objects.filter(pk__in=drifted)._update_blogs(
+            drifted, article_count=real_count
+        )
+
+
+class BlogManager(models.Manager.from_queryset(BlogQuerySet)):
+    pass
@@ -0,0 +1,145 @@
+import hashlib
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+from ..cache import get_cache, get_versions, invalidate
+
+
+TABLE_SCOPE_PREFIX = "table:"
+
+
+def table_scope(table):
+    return "{}{}".format(TABLE_SCOPE_PREFIX, table)
+
+
+def invalidate_tables(models, using=None):
+    """
+    Invalidate cached queryset results which depend on the tables of some models,
+    once the current transaction is committed.
+
+    Arguments:
+        models (iterable): Model classes.
+
+    Keyword Arguments:
+        using (string): Database alias of the transaction.
+    """
+    invalidate({table_scope(model._meta.db_table) for model in models}, using=using)
+
+
+class CachedQuerySetMixin:
+    """
+    Add an opt-in result cache to a queryset with method ``cache()``.
+
+    Evaluated results are cached with a key from the compiled SQL and its
+    parameters, and the versions of the application tables the SQL reads from. A
+    table version is bumped whenever one of its rows is written (from model
+    signals and from bulk queryset methods), so results are invalidated as soon
+    as any table they depend on is changed. Tables from other applications are
+    not tracked, their changes are only seen once the results expire.
+
+    Results are not cached inside a transaction, since they could come from
+    uncommitted writes, nor for locking querysets. Only the queryset evaluation
+    is cached, ``count()``, ``exists()``, ``aggregate()`` and ``iterator()``
+    always query the database.
+    """
+    cache_key_prefix = "djangoapp_sample:queryset:"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache_timeout = None
+        self._cache_results = False
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._cache_timeout = self._cache_timeout
+        clone._cache_results = self._cache_results
+
+        return clone
+
+    def cache(self, timeout=None):
+        """
+        Return a queryset which caches its results.
+
+        Keyword Arguments:
+            timeout (integer): Lifetime in seconds of cached results, default to
+                setting ``QUERYSET_CACHE_TIMEOUT``.
+
+        Returns:
+            QuerySet: A new queryset.
+        """
+        clone = self._chain()
+        clone._cache_results = True
+        clone._cache_timeout = (
+            settings.QUERYSET_CACHE_TIMEOUT if timeout is None else timeout
+        )
+
+        return clone
+
+    def get_tracked_tables(self):
+        """
+        Return the tables of application models, they are the tables whose writes
+        invalidate cached results.
+        """
+        return [
+            model._meta.db_table
+            for model in self.model._meta.app_config.get_models()
+        ]
+
+    def get_result_cache_key(self):
+        """
+        Return the cache key of queryset results.
+
+        Returns:
+            string: The cache key, ``None`` if the queryset can not be cached.
+        """
+        connection = connections[self.db]
+        try:
+            sql, params = self.query.get_compiler(using=self.db).as_sql()
+        except EmptyResultSet:
+            return None
+
+        scopes = sorted(
+            table_scope(table)
+            for table in self.get_tracked_tables()
+            if connection.ops.quote_name(table) in sql
+        )
+        versions = get_versions(scopes)
+        digest = hashlib.md5(
+            repr((
+                self.db,
+                sql,
+                params,
+                self._iterable_class.__name__,
+                self._fields,
+            )).encode("utf-8")
+        ).hexdigest()
+
+        return "{prefix}{label}:{versions}:{digest}".format(
+            prefix=self.cache_key_prefix,
+            label=self.model._meta.label_lower,
+            versions=".".join(versions[scope] for scope in scopes),
+            digest=digest,
+        )
+
+    def is_result_cacheable(self):
+        return (
+            self._cache_results
+            and self._cache_timeout != 0
+            and not self.query.select_for_update
+            and not connections[self.db].in_atomic_block
+        )
+
+    def _fetch_all(self):
+        if self._result_cache is None and self.is_result_cacheable():
+            key = self.get_result_cache_key()
+            if key is not None:
+                cache = get_cache()
+                results = cache.get(key)
+                if results is None:
+                    results = list(self._iterable_class(self))
+                    cache.set(key, results, self._cache_timeout)
+                self._result_cache = list(results)
+
+        super()._fetch_all()
@@ -0,0 +1,34 @@
+from django.db import models
+
+from .cached import CachedQuerySetMixin, invalidate_tables
+
+
+class BlogPluginQuerySet(CachedQuerySetMixin, models.QuerySet):
+    """
+    Blog plugin queryset which invalidates cached queryset results from bulk
+    updates and deletions.
+
+    CMS plugin models use the default Django manager, so this queryset extends the
+    default queryset. There is no ``bulk_create()`` to cover since Django does not
+    allow it for multi-table inherited models like plugin models.
+    """
+    def update(self, **kwargs):
+        updated = super().update(**kwargs)
+        invalidate_tables([self.model], using=self.db)
+
+        return updated
+
+    update.alters_data = True
+
+    def delete(self):
+        deleted = super().delete()
+        invalidate_tables([self.model], using=self.db)
+
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class BlogPluginManager(models.Manager.from_queryset(BlogPluginQuerySet)):
+    pass
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:32
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_article_count(apps, schema_editor):
+    """
+    Compute the initial article counter of every existing blog.
+    """
+    Article = apps.get_model("djangoapp_sample", "Article")
+    Blog = apps.get_model("djangoapp_sample", "Blog")
+
+    counts = Article.objects.filter(
+        blog=OuterRef("pk")
+    ).order_by().values("blog").annotate(total=Count("pk")).values("total")
+
+    Blog.objects.using(schema_editor.connection.alias).update(
+        article_count=Coalesce(Subquery(counts), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp_sample", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blog",
+            name="article_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="article count"
+            ),
+        ),
+        migrations.RunPython(
+            populate_article_count,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
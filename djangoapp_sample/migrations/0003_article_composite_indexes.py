@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+from djangoapp_sample.utils.migrations import ConcurrentAddIndex
+
+
+class Migration(migrations.Migration):
+    # Required for concurrent index build on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ("djangoapp_sample", "0002_blog_article_count"),
+    ]
+
+    operations = [
+        ConcurrentAddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["blog", "-publish_start", "title"],
+                name="article_blog_pub_title_idx",
+            ),
+        ),
+        ConcurrentAddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["blog", "-publish_start", "id"],
+                name="article_blog_pub_id_idx",
+            ),
+        ),
+    ]
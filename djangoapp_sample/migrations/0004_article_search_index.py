@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from djangoapp_sample.search.operations import InstallSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp_sample", "0003_article_composite_indexes"),
+    ]
+
+    operations = [
+        InstallSearchIndex(),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:47
+
+from django.db import migrations, models
+
+from djangoapp_sample.utils.migrations import ConcurrentAddIndex
+
+
+class Migration(migrations.Migration):
+    # Required for concurrent index build on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ("djangoapp_sample", "0004_article_search_index"),
+    ]
+
+    operations = [
+        # Nullable without default so it does not rewrite the table
+        migrations.AddField(
+            model_name="article",
+            name="publish_end",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Leave it empty to keep the article published forever.",
+                null=True,
+                verbose_name="publication end",
+            ),
+        ),
+        ConcurrentAddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("publish_end__isnull", False)),
+                fields=["publish_end"],
+                name="article_publish_end_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:54
+
+from django.db import migrations, models
+
+from djangoapp_sample.search.operations import ReinstallSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp_sample", "0005_article_publish_end"),
+    ]
+
+    operations = [
+        # Adding these fields rebuilds tables on SQLite which drops the search
+        # index triggers
+        ReinstallSearchIndex(direction="backwards"),
+        migrations.AddField(
+            model_name="article",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="last update"),
+        ),
+        migrations.AddField(
+            model_name="blog",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="last update"),
+        ),
+        ReinstallSearchIndex(direction="forwards"),
+    ]
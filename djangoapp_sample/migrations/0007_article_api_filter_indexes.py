@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:40
+
+from django.db import migrations, models
+
+from djangoapp_sample.utils.migrations import ConcurrentAddIndex
+
+
+class Migration(migrations.Migration):
+    # Required for concurrent index build on PostgreSQL
+    atomic = False
+
+    dependencies = [
+        ("djangoapp_sample", "0006_updated_at"),
+    ]
+
+    operations = [
+        ConcurrentAddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["-publish_start", "id"],
+                name="article_pub_id_idx",
+            ),
+        ),
+        ConcurrentAddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["title", "id"],
+                name="article_title_id_idx",
+            ),
+        ),
+    ]
@@ -1,7 +1,10 @@
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, router, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.urls import reverse
+
+from ..managers import ArticleManager
+from ..utils.urlbuilder import article_detail_url
 
 from .blog import Blog
 
@@ -16,6 +19,9 @@ class Article(models.Model):
         content (models.TextField): Optionnal text content.
         publish_start (models.DateTimeField): Required publication date determine
             when article will be available.
+        publish_end (models.DateTimeField): Optional date determine when article
+            will stop to be available.
+        updated_at (models.DateTimeField): Date of the last article change.
     """
     blog = models.ForeignKey(
         Blog,
@@ -42,24 +48,147 @@ class Article(models.Model):
         default=timezone.now,
     )
 
+    publish_end = models.DateTimeField(
+        _("publication end"),
+        blank=True,
+        null=True,
+        help_text=_("Leave it empty to keep the article published forever."),
+    )
+
+    updated_at = models.DateTimeField(
+        _("last update"),
+        auto_now=True,
+    )
+
+    objects = ArticleManager()
+
+    # Blog id as loaded from database, used to detect blog reassignment on save
+    _loaded_blog_id = None
+
     class Meta:
         verbose_name = _("Article")
         verbose_name_plural = _("Articles")
         ordering = [
             "-publish_start",
         ]
+        indexes = [
+            # For blog article lists ordered like in the blog plugin
+            models.Index(
+                fields=["blog", "-publish_start", "title"],
+                name="article_blog_pub_title_idx",
+            ),
+            # For blog article lists ordered like in blog detail view
+            models.Index(
+                fields=["blog", "-publish_start", "id"],
+                name="article_blog_pub_id_idx",
+            ),
+            # For article lists from all blogs, like the API list endpoint
+            models.Index(
+                fields=["-publish_start", "id"],
+                name="article_pub_id_idx",
+            ),
+            # For the API list filtered on a title prefix, in title order
+            models.Index(
+                fields=["title", "id"],
+                name="article_title_id_idx",
+            ),
+            # For the next publication end lookup, most articles never end so
+            # they are left out from index
+            models.Index(
+                fields=["publish_end"],
+                condition=models.Q(publish_end__isnull=False),
+                name="article_publish_end_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def clean(self):
+        if self.publish_end and self.publish_start and (
+            self.publish_end <= self.publish_start
+        ):
+            raise ValidationError({
+                "publish_end": _("Publication end must be after publication start."),
+            })
+
+    def is_published(self, now=None):
+        """
+        Return if article is currently published.
+
+        Keyword Arguments:
+            now (datetime.datetime): Date to check against, default to current
+                date.
+
+        Returns:
+            bool: True if article is published.
+        """
+        now = now or timezone.now()
+
+        return self.publish_start <= now and (
+            self.publish_end is None or self.publish_end > now
+        )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_blog_id = instance.__dict__.get("blog_id")
+
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save article and update the article counter of its blog (and of its
+        previous blog on reassignment) within the same transaction.
+        """
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        track_blog = (
+            not adding and (
+                update_fields is None
+                or "blog" in update_fields
+                or "blog_id" in update_fields
+            )
+        )
+        using = kwargs.get("using") or router.db_for_write(
+            self.__class__, instance=self
+        )
+
+        with transaction.atomic(using=using, savepoint=False):
+            previous_blog_id = self._loaded_blog_id
+            # Blog id has been deferred from loading, we need to get it to know
+            # about reassignment
+            if track_blog and previous_blog_id is None:
+                previous_blog_id = self.__class__._base_manager.using(
+                    using
+                ).filter(pk=self.pk).values_list("blog_id", flat=True).first()
+
+            super().save(*args, **kwargs)
+
+            deltas = {}
+            if adding:
+                deltas[self.blog_id] = 1
+            elif track_blog and previous_blog_id != self.blog_id:
+                deltas[previous_blog_id] = -1
+                deltas[self.blog_id] = 1
+
+            if deltas:
+                Blog.objects.using(using).adjust_article_count(deltas)
+                # Keep the counter right on the possible blog instance in memory
+                if self.__class__.blog.is_cached(self):
+                    self.blog.article_count += 1
+
+        self._loaded_blog_id = self.blog_id
+
+    save.alters_data = True
+
     def get_absolute_url(self):
         """
         Return absolute URL to the article detail view.
 
+        It only uses the blog id so the related blog is never loaded.
+
         Returns:
             string: An URL.
         """
-        return reverse("djangoapp_sample:article-detail", args=[
-            str(self.blog.id),
-            str(self.id)
-        ])
+        return article_detail_url(self.blog_id, self.id)
@@ -1,9 +1,11 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django.urls import reverse
 
 from cms.models.pluginmodel import CMSPlugin
 
+from ..managers import BlogManager, BlogPluginManager
+from ..utils.urlbuilder import blog_detail_url
+
 
 class Blog(models.Model):
     """
@@ -11,6 +13,12 @@ class Blog(models.Model):
 
     Attributes:
         title (models.CharField): Required unique title string.
+        article_count (models.PositiveIntegerField): Denormalized number of related
+            articles. It is maintained from Article writes and should never be
+            edited directly, use command ``rebuild_article_counts`` to fix it if it
+            ever drifts.
+        updated_at (models.DateTimeField): Date of the last blog change, including
+            article additions and removals.
     """
     title = models.CharField(
         _("title"),
@@ -20,6 +28,19 @@ class Blog(models.Model):
         unique=True,
     )
 
+    article_count = models.PositiveIntegerField(
+        _("article count"),
+        default=0,
+        editable=False,
+    )
+
+    updated_at = models.DateTimeField(
+        _("last update"),
+        auto_now=True,
+    )
+
+    objects = BlogManager()
+
     class Meta:
         verbose_name = _("Blog")
         verbose_name_plural = _("Blogs")
@@ -30,6 +51,25 @@ class Blog(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        """
+        Save blog without its article counter on updates, so saving an instance
+        loaded before some article changes does not reset the stored counter.
+
+        The counter is only written on updates when it is explicitly given in
+        ``update_fields``, like ``blog.save(update_fields=["article_count"])``.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name != "article_count"
+            ]
+
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         """
         Return absolute URL to the blog detail view.
@@ -37,9 +77,7 @@ class Blog(models.Model):
         Returns:
             string: An URL.
         """
-        return reverse("djangoapp_sample:blog-detail", args=[
-            str(self.id)
-        ])
+        return blog_detail_url(self.id)
 
 
 class BlogPluginModel(CMSPlugin):
@@ -63,6 +101,8 @@ class BlogPluginModel(CMSPlugin):
         help_text=_("Using 0 as limit means no limit.")
     )
 
+    objects = BlogPluginManager()
+
     def __str__(self):
         return self.blog.title
 
@@ -0,0 +1,11 @@
+from .counted import ApproximatePage, CachedCountPaginator
+from .keyset import InvalidCursor, KeysetPage, KeysetPaginator
+
+
+__all__ = [
+    "ApproximatePage",
+    "CachedCountPaginator",
+    "InvalidCursor",
+    "KeysetPage",
+    "KeysetPaginator",
+]
@@ -0,0 +1,51 @@
+"""
+Pagination classes for API viewsets.
+"""
+from django.conf import settings
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Page number pagination for ranked search results which can not be paginated
+    on a cursor.
+    """
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        self.page_size = settings.ARTICLE_PAGINATION
+        return super().get_page_size(request)
+
+
+class ArticleCursorPagination(CursorPagination):
+    """
+    Cursor pagination for article lists, from the most recent publication.
+
+    Default page size is from setting ``ARTICLE_PAGINATION``, clients can choose
+    another one with the ``page_size`` query argument up to ``max_page_size``.
+    """
+    ordering = ("-publish_start", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        self.page_size = settings.ARTICLE_PAGINATION
+        return super().get_page_size(request)
+
+
+class BlogCursorPagination(CursorPagination):
+    """
+    Cursor pagination for blog lists, in title order.
+
+    Default page size is from setting ``BLOG_PAGINATION``, clients can choose
+    another one with the ``page_size`` query argument up to ``max_page_size``.
+    """
+    ordering = ("title", "id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        self.page_size = settings.BLOG_PAGINATION
+        return super().get_page_size(request)
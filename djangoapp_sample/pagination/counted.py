@@ -0,0 +1,189 @@
+"""
+Page number pagination with cached counts for HTML views.
+
+The Django paginator runs a ``COUNT(*)`` on every page to know the number of
+pages, which is the costliest query of a page on large article tables. The
+paginator from this module caches the count under a versioned key, so it is
+recomputed only once the content it depends on has changed, like when an article
+is created or deleted.
+
+Above a threshold it can also trust the row estimate from the database planner
+statistics instead of counting rows. The count is then approximate so pages do not
+rely on it to know if there is a next page.
+"""
+import json
+
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from ..cache import get_cache, get_versions
+
+
+class ApproximatePage(Page):
+    """
+    A page from a paginator with an approximate count.
+
+    Arguments:
+        object_list (list): Objects for this page.
+        number (integer): Page number.
+        paginator (CachedCountPaginator): The paginator which built this page.
+        has_next (boolean): If there is a page after this one.
+    """
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Django paginator which caches its count.
+
+    Arguments:
+        object_list (QuerySet): Queryset to paginate.
+        per_page (integer): Maximum number of objects per page.
+
+    Keyword Arguments:
+        cache_key (string): Name of the count in cache, it must be unique for
+            each distinct queryset. If empty the count is not cached.
+        cache_scopes (list): Content scopes the count depends on, their versions
+            are part of the cache key so count is invalidated with them.
+        timeout (integer): Lifetime in seconds of cached count, zero disables the
+            cache.
+        approximate_threshold (integer): Minimal row estimate from the database
+            statistics to use it as an approximate count instead of counting
+            rows. ``None`` to always count rows. Estimates are only supported
+            with PostgreSQL.
+        *args: Other positional arguments for ``Paginator``.
+        **kwargs: Other keyword arguments for ``Paginator``.
+    """
+    cache_key_prefix = "djangoapp_sample:count:"
+
+    def __init__(self, object_list, per_page, *args, cache_key=None,
+                 cache_scopes=None, timeout=None, approximate_threshold=None,
+                 **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.cache_key = cache_key
+        self.cache_scopes = sorted(cache_scopes or [])
+        self.timeout = timeout
+        self.approximate_threshold = approximate_threshold
+        self._approximate = False
+
+    def get_count_cache_key(self):
+        versions = get_versions(self.cache_scopes)
+
+        return "{prefix}{key}:{versions}".format(
+            prefix=self.cache_key_prefix,
+            key=self.cache_key,
+            versions=".".join(versions[scope] for scope in self.cache_scopes),
+        )
+
+    def estimate_count(self):
+        """
+        Return the row estimate of the database planner for the paginated
+        queryset.
+
+        Returns:
+            integer: Estimated number of rows or ``None`` when the database does
+            not support it.
+        """
+        queryset = self.object_list
+        if not hasattr(queryset, "query"):
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def compute_count(self):
+        """
+        Return the count from the planner estimate when over the threshold, else
+        count rows.
+
+        Returns:
+            tuple: The count and a boolean for an approximate count.
+        """
+        if self.approximate_threshold is not None:
+            estimate = self.estimate_count()
+            if estimate is not None and estimate >= self.approximate_threshold:
+                return estimate, True
+
+        return Paginator.count.func(self), False
+
+    @cached_property
+    def count(self):
+        if not self.cache_key or self.timeout == 0:
+            count, self._approximate = self.compute_count()
+            return count
+
+        cache = get_cache()
+        key = self.get_count_cache_key()
+
+        cached = cache.get(key)
+        if cached is None:
+            cached = self.compute_count()
+            cache.set(key, cached, self.timeout)
+
+        count, self._approximate = cached
+
+        return count
+
+    @property
+    def is_approximate(self):
+        """
+        If the count is an estimate, the real number of pages may differ.
+        """
+        self.count
+
+        return self._approximate
+
+    def validate_number(self, number):
+        if not self.is_approximate:
+            return super().validate_number(number)
+
+        # The last page is unknown, only pages before the first one are invalid
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+
+        return number
+
+    def page(self, number):
+        if not self.is_approximate:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        items = list(self.object_list[bottom:bottom + self.per_page + 1])
+
+        if not items and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+
+        return ApproximatePage(
+            items[:self.per_page],
+            number,
+            self,
+            has_next=len(items) > self.per_page,
+        )
@@ -0,0 +1,236 @@
+"""
+Keyset (also known as cursor) pagination for HTML views.
+
+Opposed to the Django paginator which does a ``COUNT(*)`` then an ``OFFSET`` scan
+growing with page numbers, the keyset paginator filters rows from the ordering
+values of the last row from previous page so every page costs the same whatever
+its depth. The price is there is no page numbers, only previous and next links
+with opaque cursor tokens.
+"""
+import base64
+import binascii
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(InvalidPage):
+    """
+    Raised when a cursor token can not be decoded.
+    """
+    pass
+
+
+class KeysetPage:
+    """
+    A page of results from a ``KeysetPaginator``.
+
+    It mimics the part of the Django ``Page`` API used in templates.
+
+    Arguments:
+        object_list (list): Objects for this page.
+        paginator (KeysetPaginator): The paginator which built this page.
+        has_next (boolean): If there is a page after this one.
+        has_previous (boolean): If there is a page before this one.
+    """
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return "<KeysetPage of {} items>".format(len(self.object_list))
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @cached_property
+    def next_cursor(self):
+        """
+        Cursor token to reach the next page, ``None`` if there is none.
+        """
+        if not self._has_next or not self.object_list:
+            return None
+
+        return self.paginator.encode_cursor(self.object_list[-1], reverse=False)
+
+    @cached_property
+    def previous_cursor(self):
+        """
+        Cursor token to reach the previous page, ``None`` if there is none.
+        """
+        if not self._has_previous or not self.object_list:
+            return None
+
+        return self.paginator.encode_cursor(self.object_list[0], reverse=True)
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset on a total ordering of model fields.
+
+    Arguments:
+        object_list (QuerySet): Queryset to paginate.
+        per_page (integer): Maximum number of objects per page.
+        ordering (list): Model field names to order on, a name prefixed with ``-``
+            is a descending order. The ordering must be total so the last field
+            should be unique (like the primary key) or be the only field.
+
+    Attributes:
+        is_keyset (boolean): Always true, it is a marker for templates to know
+            they can not use page numbers.
+    """
+    is_keyset = True
+
+    def __init__(self, object_list, per_page, ordering):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = [
+            (name[1:], True) if name.startswith("-") else (name, False)
+            for name in ordering
+        ]
+
+    def _get_field(self, name):
+        if name == "pk":
+            return self.object_list.model._meta.pk
+
+        return self.object_list.model._meta.get_field(name)
+
+    def get_values(self, obj):
+        """
+        Return ordering values from given object.
+        """
+        return [
+            getattr(obj, self._get_field(name).attname)
+            for name, descending in self.ordering
+        ]
+
+    def encode_cursor(self, obj, reverse=False):
+        """
+        Build a cursor token from ordering values of given object.
+
+        Arguments:
+            obj (Model): Object which ordering values are the cursor position.
+
+        Keyword Arguments:
+            reverse (boolean): If true, the cursor targets the objects before the
+                position instead of the ones after.
+
+        Returns:
+            string: URL safe cursor token.
+        """
+        values = [
+            self._get_field(name).value_to_string(obj)
+            for name, descending in self.ordering
+        ]
+        payload = json.dumps({"v": values, "r": reverse}, separators=(",", ":"))
+
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """
+        Decode a cursor token.
+
+        Arguments:
+            cursor (string): Cursor token as built from ``encode_cursor``.
+
+        Returns:
+            tuple: The list of ordering values converted to Python and a boolean
+            for reverse direction.
+        """
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            payload = json.loads(
+                base64.urlsafe_b64decode((cursor + padding).encode()).decode()
+            )
+            values = payload["v"]
+            reverse = bool(payload["r"])
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeDecodeError,
+            ValueError,
+        ):
+            raise InvalidCursor("Invalid cursor.")
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor("Invalid cursor.")
+
+        try:
+            values = [
+                self._get_field(name).to_python(value)
+                for (name, descending), value in zip(self.ordering, values)
+            ]
+        except (FieldDoesNotExist, ValidationError):
+            raise InvalidCursor("Invalid cursor.")
+
+        return values, reverse
+
+    def _seek_filter(self, values, reverse):
+        """
+        Build the filter to select rows after (or before when reversed) the given
+        ordering values.
+
+        For an ordering ``(a, b)`` this is ``a > x OR (a = x AND b > y)`` where
+        comparisons are flipped for descending fields or reverse direction.
+        """
+        condition = Q()
+        equals = {}
+
+        for (name, descending), value in zip(self.ordering, values):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= Q(**equals, **{"{}__{}".format(name, lookup): value})
+            equals[name] = value
+
+        return condition
+
+    def page(self, cursor=None):
+        """
+        Return the page at given cursor position.
+
+        Keyword Arguments:
+            cursor (string): Cursor token, if empty the first page is returned.
+
+        Returns:
+            KeysetPage: The page object.
+        """
+        reverse = False
+        queryset = self.object_list
+
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._seek_filter(values, reverse))
+
+        queryset = queryset.order_by(*[
+            ("-" if descending != reverse else "") + name
+            for name, descending in self.ordering
+        ])
+
+        items = list(queryset[:self.per_page + 1])
+        has_more = len(items) > self.per_page
+        items = items[:self.per_page]
+
+        if reverse:
+            items.reverse()
+            return KeysetPage(items, self, has_next=True, has_previous=has_more)
+
+        return KeysetPage(
+            items, self, has_next=has_more, has_previous=bool(cursor)
+        )
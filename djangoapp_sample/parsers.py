@@ -0,0 +1,37 @@
+"""
+API parsers.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .renderers import MessagePackRenderer, msgpack
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parse a MessagePack request body, it requires the ``msgpack`` library.
+    """
+    media_type = MessagePackRenderer.media_type
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImproperlyConfigured(
+                "MessagePackParser requires the 'msgpack' library."
+            )
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (TypeError, ValueError, msgpack.UnpackException) as exc:
+            raise ParseError("MessagePack parse error - {}".format(exc))
+
+
+def get_fast_parser_classes():
+    """
+    Return the fast parser classes whose library is installed.
+
+    Returns:
+        list: Parser classes.
+    """
+    return [MessagePackParser] if msgpack is not None else []
@@ -1,14 +1,26 @@
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
+from cms.models import Placeholder
 from cms.plugin_base import CMSPluginBase
 
+from ..cache import blog_scope, get_or_compute, get_versions
 from ..forms import BlogPluginForm
 from ..models import BlogPluginModel
+from ..views.mixins import seconds_until
 
 
 class BlogPlugin(CMSPluginBase):
     """
-    Blog plugin select a blog to list its X last articles.
+    Blog plugin select a blog to list its X last published articles.
+
+    Plugin output depends on its blog and the blog articles, the placeholder caches
+    of plugins are cleared when their blog content changes (see
+    ``clear_cache_for_blogs``) and expire when the next blog article is published
+    or ended.
+
+    Article lists are also cached with stampede protection, so placeholder cache
+    expiration does not make every request query them at once.
     """
     module = _("sveetch-djangoapp-sample")
     name = _("Blog last articles")
@@ -17,19 +29,80 @@ class BlogPlugin(CMSPluginBase):
     render_template = "djangoapp_sample/blog_plugin.html"
     cache = True
 
-    def render(self, context, instance, placeholder):
-        context = super().render(context, instance, placeholder)
+    @classmethod
+    def clear_cache_for_blogs(cls, blog_ids):
+        """
+        Clear caches of placeholders which contain a plugin for some blogs.
+
+        Arguments:
+            blog_ids (iterable): Blog ids.
+
+        Returns:
+            int: Number of cleared placeholder caches (one per language).
+        """
+        targets = set(
+            cls.model.objects.filter(
+                blog_id__in=blog_ids, placeholder__isnull=False,
+            ).values_list("placeholder_id", "language")
+        )
+        if not targets:
+            return 0
+
+        placeholders = Placeholder.objects.in_bulk(
+            {pk for pk, language in targets}
+        )
+        cleared = 0
+        for pk, language in targets:
+            if pk in placeholders:
+                # This clears the CMS page cache also
+                placeholders[pk].clear_cache(language)
+                cleared += 1
+
+        return cleared
+
+    def get_cache_expiration(self, request, instance, placeholder):
+        return instance.blog.article_set.next_visibility_change()
 
+    def get_articles(self, instance):
+        """
+        Return the last published articles of plugin blog.
+
+        Returns:
+            list: Article objects.
+        """
         # Base queryset for blog articles
-        articles = instance.blog.article_set.all().order_by("-publish_start", "title")
+        articles = instance.blog.article_set.published().for_listing().order_by(
+            "-publish_start", "title"
+        )
 
         # Limit article queryset if there is any limit upper to zero
         if instance.limit:
             articles = articles[0:instance.limit]
 
+        timeout = settings.BLOG_PLUGIN_CACHE_TIMEOUT
+        if not timeout:
+            return list(articles)
+
+        def compute():
+            change = instance.blog.article_set.next_visibility_change()
+            if change is not None:
+                return list(articles), min(timeout, seconds_until(change))
+
+            return list(articles), timeout
+
+        scope = blog_scope(instance.blog_id)
+        key = "djangoapp_sample:plugin:{}:{}:{}".format(
+            instance.blog_id, instance.limit, get_versions([scope])[scope]
+        )
+
+        return get_or_compute(key, compute)
+
+    def render(self, context, instance, placeholder):
+        context = super().render(context, instance, placeholder)
+
         context.update({
             "instance": instance,
-            "articles": articles,
+            "articles": self.get_articles(instance),
         })
 
         return context
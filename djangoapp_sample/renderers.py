@@ -0,0 +1,120 @@
+"""
+API renderers.
+
+Fast renderers need optional libraries (``orjson`` and ``msgpack``), they are
+installed with the ``fast`` extra requirements.
+"""
+import json
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class StreamRenderer(BaseRenderer):
+    """
+    Renderer for actions which stream their own response content.
+
+    It only exists for content negotiation to accept its media type, a streaming
+    action returns a ``StreamingHttpResponse`` that is not rendered. Other
+    responses like errors are rendered as JSON.
+    """
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return json.dumps(data).encode(self.charset)
+
+
+class NDJSONStreamRenderer(StreamRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class CSVStreamRenderer(StreamRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+def encode_default(obj):
+    """
+    Encode what fast libraries do not support natively (like lazy translation
+    strings or decimals) the same way the DRF JSON encoder does.
+    """
+    return JSONEncoder().default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer with ``orjson`` which is many times faster than the standard
+    library.
+
+    Output only differs from ``JSONRenderer`` in indentation which is always two
+    spaces when requested and in not finite floats which are rendered as ``null``.
+    """
+    def __init__(self):
+        if orjson is None:
+            raise ImproperlyConfigured(
+                "ORJSONRenderer requires the 'orjson' library."
+            )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=encode_default, option=option)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Binary MessagePack renderer, a more compact and faster format than JSON.
+    """
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImproperlyConfigured(
+                "MessagePackRenderer requires the 'msgpack' library."
+            )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
+
+
+def get_fast_renderer_classes():
+    """
+    Return the fast renderer classes whose library is installed.
+
+    Returns:
+        list: Renderer classes.
+    """
+    classes = []
+    if orjson is not None:
+        classes.append(ORJSONRenderer)
+    if msgpack is not None:
+        classes.append(MessagePackRenderer)
+
+    return classes
@@ -0,0 +1,71 @@
+"""
+Full-text search on articles.
+"""
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from .backends import (
+    BaseSearchBackend, PostgreSQLSearchBackend, SQLiteSearchBackend
+)
+
+
+VENDOR_BACKENDS = {
+    "postgresql": PostgreSQLSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_search_backend_class(vendor):
+    """
+    Return the search backend class to use for a database vendor.
+
+    Setting ``ARTICLE_SEARCH_BACKEND`` takes precedence when defined.
+
+    Arguments:
+        vendor (string): Database vendor name as given from a connection.
+
+    Returns:
+        class: A search backend class.
+    """
+    if settings.ARTICLE_SEARCH_BACKEND:
+        return import_string(settings.ARTICLE_SEARCH_BACKEND)
+
+    return VENDOR_BACKENDS.get(vendor, BaseSearchBackend)
+
+
+def get_search_backend(using="default"):
+    """
+    Return the search backend for a database connection.
+
+    Keyword Arguments:
+        using (string): Database alias. Default to ``default``.
+
+    Returns:
+        BaseSearchBackend: Search backend instance.
+    """
+    connection = connections[using]
+
+    return get_search_backend_class(connection.vendor)(connection)
+
+
+def search_articles(queryset, query):
+    """
+    Search articles from given queryset.
+
+    Arguments:
+        queryset (QuerySet): Article queryset to search in.
+        query (string): User query.
+
+    Returns:
+        QuerySet: Matching articles annotated with ``search_rank`` and ordered by
+        relevance.
+    """
+    return get_search_backend(queryset.db).search(queryset, query)
+
+
+__all__ = [
+    "get_search_backend",
+    "get_search_backend_class",
+    "search_articles",
+]
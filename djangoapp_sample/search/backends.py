@@ -0,0 +1,261 @@
+"""
+Full-text search backends for articles.
+
+Each backend implements the search on a specific database engine using its
+native full-text index. The index is installed from migrations with operation
+``InstallSearchIndex``.
+"""
+from django.conf import settings
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+
+class BaseSearchBackend:
+    """
+    Fallback backend for database engines without supported full-text index.
+
+    It performs a naive search with ``icontains`` lookups on every term, so it
+    should only be used on small datasets. Results are not ranked.
+
+    Arguments:
+        connection (django.db.backends.base.base.BaseDatabaseWrapper): Database
+            connection the backend works with.
+    """
+    vendor = None
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @property
+    def table(self):
+        from ..models import Article
+
+        return Article._meta.db_table
+
+    def get_terms(self, query):
+        """
+        Split a user query into terms.
+
+        Arguments:
+            query (string): User query.
+
+        Returns:
+            list: Terms.
+        """
+        return (query or "").split()
+
+    def install_sql(self):
+        """
+        Return SQL statements to install the search index.
+
+        Statements must be idempotent since installation may be replayed to
+        restore parts lost when a migration rebuilds the article table.
+
+        Returns:
+            list: SQL statements.
+        """
+        return []
+
+    def uninstall_sql(self):
+        """
+        Return SQL statements to remove the search index.
+
+        Returns:
+            list: SQL statements.
+        """
+        return []
+
+    def search(self, queryset, query):
+        """
+        Filter an article queryset on given query and annotate it with a
+        ``search_rank`` value where higher is more relevant.
+
+        Arguments:
+            queryset (QuerySet): Article queryset to search in.
+            query (string): User query.
+
+        Returns:
+            QuerySet: Queryset ordered by relevance.
+        """
+        terms = self.get_terms(query)
+        if not terms:
+            return queryset.none()
+
+        condition = Q()
+        for term in terms:
+            condition &= Q(title__icontains=term) | Q(content__icontains=term)
+
+        return queryset.filter(condition).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        ).order_by("-publish_start", "id")
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Search with a SQLite FTS5 virtual table.
+
+    The virtual table is an external content table over the article table and is
+    kept in sync by triggers, ranking is done with the ``bm25`` function where
+    title matches weigh more than content matches.
+    """
+    vendor = "sqlite"
+    title_weight = 10.0
+    content_weight = 1.0
+
+    @property
+    def fts_table(self):
+        return "{}_fts".format(self.table)
+
+    def install_sql(self):
+        params = {"table": self.table, "fts": self.fts_table}
+
+        return [
+            (
+                "CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                "title, content, content='{table}', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            ).format(**params),
+            (
+                "CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+                "BEGIN "
+                "INSERT INTO {fts}(rowid, title, content) "
+                "VALUES (new.id, new.title, new.content); "
+                "END"
+            ).format(**params),
+            (
+                "CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+                "BEGIN "
+                "INSERT INTO {fts}({fts}, rowid, title, content) "
+                "VALUES ('delete', old.id, old.title, old.content); "
+                "END"
+            ).format(**params),
+            (
+                "CREATE TRIGGER IF NOT EXISTS {fts}_au "
+                "AFTER UPDATE OF title, content ON {table} "
+                "BEGIN "
+                "INSERT INTO {fts}({fts}, rowid, title, content) "
+                "VALUES ('delete', old.id, old.title, old.content); "
+                "INSERT INTO {fts}(rowid, title, content) "
+                "VALUES (new.id, new.title, new.content); "
+                "END"
+            ).format(**params),
+            "INSERT INTO {fts}({fts}) VALUES ('rebuild')".format(**params),
+        ]
+
+    def uninstall_sql(self):
+        params = {"fts": self.fts_table}
+
+        return [
+            "DROP TRIGGER IF EXISTS {fts}_ai".format(**params),
+            "DROP TRIGGER IF EXISTS {fts}_ad".format(**params),
+            "DROP TRIGGER IF EXISTS {fts}_au".format(**params),
+            "DROP TABLE IF EXISTS {fts}".format(**params),
+        ]
+
+    def get_match_expression(self, query):
+        """
+        Build a FTS5 match expression where every term is quoted so user input
+        can not use the FTS5 query syntax.
+        """
+        return " ".join(
+            '"{}"'.format(term.replace('"', '""'))
+            for term in self.get_terms(query)
+        )
+
+    def search(self, queryset, query):
+        match = self.get_match_expression(query)
+        if not match:
+            return queryset.none()
+
+        params = {
+            "table": self.connection.ops.quote_name(self.table),
+            "fts": self.fts_table,
+        }
+
+        return queryset.filter(
+            RawSQL(
+                "{table}.id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)".format(
+                    **params
+                ),
+                [match],
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                (
+                    "SELECT -bm25({fts}, %s, %s) FROM {fts} "
+                    "WHERE {fts} MATCH %s AND rowid = {table}.id"
+                ).format(**params),
+                [self.title_weight, self.content_weight, match],
+                output_field=FloatField(),
+            )
+        ).order_by("-search_rank", "-publish_start", "id")
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """
+    Search with a PostgreSQL ``tsvector`` expression served by a GIN index.
+
+    The index is built on the same expression used in queries so it does not need
+    any trigger to be kept in sync. The text search configuration comes from
+    setting ``ARTICLE_SEARCH_CONFIG``, changing it requires to reinstall the
+    index.
+    """
+    vendor = "postgresql"
+
+    @property
+    def index_name(self):
+        return "article_search_idx"
+
+    @property
+    def config(self):
+        return settings.ARTICLE_SEARCH_CONFIG
+
+    def get_document_sql(self, table=None):
+        """
+        Return the ``tsvector`` SQL expression for an article row.
+        """
+        prefix = "{}.".format(table) if table else ""
+
+        return (
+            "to_tsvector('{config}'::regconfig, "
+            "coalesce({prefix}title, '') || ' ' || coalesce({prefix}content, ''))"
+        ).format(config=self.config, prefix=prefix)
+
+    def install_sql(self):
+        return [
+            (
+                "CREATE INDEX IF NOT EXISTS {name} ON {table} "
+                "USING GIN ({document})"
+            ).format(
+                name=self.index_name,
+                table=self.table,
+                document=self.get_document_sql(),
+            ),
+        ]
+
+    def uninstall_sql(self):
+        return ["DROP INDEX IF EXISTS {}".format(self.index_name)]
+
+    def search(self, queryset, query):
+        if not self.get_terms(query):
+            return queryset.none()
+
+        document = self.get_document_sql(
+            table=self.connection.ops.quote_name(self.table)
+        )
+        tsquery = "websearch_to_tsquery('{}'::regconfig, %s)".format(self.config)
+
+        return queryset.filter(
+            RawSQL(
+                "{} @@ {}".format(document, tsquery),
+                [query],
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                "ts_rank({}, {})".format(document, tsquery),
+                [query],
+                output_field=FloatField(),
+            )
+        ).order_by("-search_rank", "-publish_start", "id")
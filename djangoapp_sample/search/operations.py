@@ -0,0 +1,76 @@
+from django.db.migrations.operations.base import Operation
+
+
+class InstallSearchIndex(Operation):
+    """
+    Install the article search index for the database backend.
+
+    Installation is idempotent, it is also used in migrations which rebuild the
+    article table on SQLite since triggers are dropped along with the old table.
+    """
+    reduces_to_sql = True
+    reversible = True
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _get_backend(self, schema_editor):
+        from . import get_search_backend_class
+
+        return get_search_backend_class(schema_editor.connection.vendor)(
+            schema_editor.connection
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if self.allow_migrate_model(
+            schema_editor.connection.alias,
+            to_state.apps.get_model(app_label, "article"),
+        ):
+            for sql in self._get_backend(schema_editor).install_sql():
+                schema_editor.execute(sql, params=None)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self.allow_migrate_model(
+            schema_editor.connection.alias,
+            from_state.apps.get_model(app_label, "article"),
+        ):
+            for sql in self._get_backend(schema_editor).uninstall_sql():
+                schema_editor.execute(sql, params=None)
+
+    def describe(self):
+        return "Install article full-text search index"
+
+
+class ReinstallSearchIndex(InstallSearchIndex):
+    """
+    Reinstall the article search index after operations which rebuild the article
+    table, without ever uninstalling it.
+
+    Since operations are reversed when unapplying a migration, use it after these
+    operations with ``direction="forwards"`` and before them with
+    ``direction="backwards"``.
+
+    Keyword Arguments:
+        direction (string): Either ``forwards`` or ``backwards``, the migration
+            direction which reinstalls the index, the other one does nothing.
+    """
+    def __init__(self, direction="forwards"):
+        if direction not in ("forwards", "backwards"):
+            raise ValueError(
+                "Direction must be either 'forwards' or 'backwards'."
+            )
+        self.direction = direction
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if self.direction == "forwards":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self.direction == "backwards":
+            # Install from the state the migration is reverted to
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return "Reinstall article full-text search index ({})".format(
+            self.direction
+        )
@@ -1,5 +1,9 @@
 from .blog import BlogSerializer, BlogResumeSerializer
 from .article import ArticleSerializer, ArticleResumeSerializer
+from .batch import ArticleBatchItemSerializer
+from .export import ArticleExportFilterSerializer
+from .filters import ArticleFilterSerializer
+from .planning import plan_queryset
 
 
 __all__ = [
@@ -7,4 +11,8 @@ __all__ = [
     "BlogResumeSerializer",
     "ArticleSerializer",
     "ArticleResumeSerializer",
+    "ArticleBatchItemSerializer",
+    "ArticleExportFilterSerializer",
+    "ArticleFilterSerializer",
+    "plan_queryset",
 ]
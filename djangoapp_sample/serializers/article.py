@@ -2,16 +2,27 @@ from rest_framework import serializers
 
 from ..models import Article
 from .blog import BlogIdField, BlogResumeSerializer
+from .fields import FastHyperlinkedIdentityField
+from .mixins import (
+    CachedRepresentationListSerializer, CachedRepresentationMixin,
+    SparseFieldsetMixin,
+)
 
 
-class ArticleSerializer(serializers.HyperlinkedModelSerializer):
+class ArticleSerializer(SparseFieldsetMixin, CachedRepresentationMixin,
+                        serializers.HyperlinkedModelSerializer):
     """
     Complete representation for detail and writing usage.
 
     Blog relation have two serializer fields, one for read only to return resumed
     details and another one for write only with complete detail and which expect a
     blog ID.
+
+    Serialized fields can be restricted with query arguments ``fields`` and
+    ``omit``.
     """
+    serializer_url_field = FastHyperlinkedIdentityField
+
     id = serializers.ReadOnlyField()
     view_url = serializers.SerializerMethodField()
     blog = BlogResumeSerializer(read_only=True)
@@ -20,6 +31,7 @@ class ArticleSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Article
         fields = '__all__'
+        list_serializer_class = CachedRepresentationListSerializer
         extra_kwargs = {
             "url": {
                 "view_name": "djangoapp_sample:api-article-detail"
@@ -31,6 +43,41 @@ class ArticleSerializer(serializers.HyperlinkedModelSerializer):
             },
         }
 
+    def validate(self, data):
+        start = data.get(
+            "publish_start", getattr(self.instance, "publish_start", None)
+        )
+        end = data.get("publish_end", getattr(self.instance, "publish_end", None))
+
+        if start and end and end <= start:
+            raise serializers.ValidationError({
+                "publish_end": "Publication end must be after publication start.",
+            })
+
+        return data
+
+    def get_plan_fields(self):
+        """
+        Return the model fields read by the view URL and the representation
+        version.
+        """
+        fields = ["updated_at"]
+        if "view_url" in self.fields:
+            fields.append("blog")
+        if "blog" in self.fields:
+            fields.append("blog__updated_at")
+
+        return fields
+
+    def get_representation_version(self, instance):
+        if "blog" not in self.fields:
+            return instance.updated_at.timestamp()
+
+        # Representation includes a blog resume
+        return "{}-{}".format(
+            instance.updated_at.timestamp(), instance.blog.updated_at.timestamp()
+        )
+
     def get_view_url(self, obj):
         """
         Return the HTML detail view URL.
@@ -55,4 +102,5 @@ class ArticleResumeSerializer(ArticleSerializer):
     class Meta:
         model = ArticleSerializer.Meta.model
         fields = ["id", "url", "view_url", "blog", "publish_start", "title"]
+        list_serializer_class = ArticleSerializer.Meta.list_serializer_class
         extra_kwargs = ArticleSerializer.Meta.extra_kwargs
@@ -0,0 +1,36 @@
+from rest_framework import serializers
+
+from ..models import Article
+
+
+class ArticleBatchItemSerializer(serializers.ModelSerializer):
+    """
+    Flat Article representation for batch writing.
+
+    Blog is a plain integer so there is no query per item, blog ids are validated
+    all at once by the batch.
+    """
+    id = serializers.IntegerField(required=False, min_value=1)
+    blog = serializers.IntegerField(source="blog_id", min_value=1)
+
+    class Meta:
+        model = Article
+        fields = ["id", "blog", "title", "content", "publish_start", "publish_end"]
+        extra_kwargs = {
+            "title": {
+                "required": True
+            },
+        }
+
+    def validate(self, data):
+        # Partial updates with a single date are checked by the batch against
+        # the stored dates
+        start = data.get("publish_start")
+        end = data.get("publish_end")
+
+        if start and end and end <= start:
+            raise serializers.ValidationError({
+                "publish_end": "Publication end must be after publication start.",
+            })
+
+        return data
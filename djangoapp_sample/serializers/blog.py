@@ -1,24 +1,59 @@
 from rest_framework import serializers
 
+from ..cache import get_blog
 from ..models import Blog
+from .fields import FastHyperlinkedIdentityField
+from .mixins import (
+    CachedRepresentationListSerializer, CachedRepresentationMixin,
+    SparseFieldsetMixin,
+)
 
 
 class BlogIdField(serializers.PrimaryKeyRelatedField):
+    """
+    Blog relation from its id, blogs are validated from the blog lookup cache.
+    """
     def get_queryset(self):
         return Blog.objects.all()
 
+    def to_internal_value(self, data):
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+
+        try:
+            if isinstance(data, bool):
+                raise TypeError
+            blog = get_blog(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        if blog is None:
+            self.fail("does_not_exist", pk_value=data)
+
+        return blog
+
 
-class BlogSerializer(serializers.HyperlinkedModelSerializer):
+class BlogSerializer(SparseFieldsetMixin, CachedRepresentationMixin,
+                     serializers.HyperlinkedModelSerializer):
     """
     Complete representation for detail and writing usage.
+
+    Serialized fields can be restricted with query arguments ``fields`` and
+    ``omit``.
     """
+    serializer_url_field = FastHyperlinkedIdentityField
+
     id = serializers.ReadOnlyField()
     view_url = serializers.SerializerMethodField()
-    article_count = serializers.SerializerMethodField()
+    article_count = serializers.ReadOnlyField()
+
+    # Model field read by the representation version
+    plan_fields = ["updated_at"]
 
     class Meta:
         model = Blog
         fields = '__all__'
+        list_serializer_class = CachedRepresentationListSerializer
         extra_kwargs = {
             "url": {
                 "view_name": "djangoapp_sample:api-blog-detail"
@@ -40,12 +75,6 @@ class BlogSerializer(serializers.HyperlinkedModelSerializer):
 
         return url
 
-    def get_article_count(self, obj):
-        """
-        Return count of related articles.
-        """
-        return obj.article_set.count()
-
 
 class BlogResumeSerializer(BlogSerializer):
     """
@@ -55,4 +84,5 @@ class BlogResumeSerializer(BlogSerializer):
     class Meta:
         model = BlogSerializer.Meta.model
         fields = ["id", "url", "view_url", "title"]
+        list_serializer_class = BlogSerializer.Meta.list_serializer_class
         extra_kwargs = BlogSerializer.Meta.extra_kwargs
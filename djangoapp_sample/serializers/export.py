@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+
+class ArticleExportFilterSerializer(serializers.Serializer):
+    """
+    Validate the query arguments of article export endpoints.
+    """
+    blog = serializers.IntegerField(required=False, min_value=1)
+    publish_after = serializers.DateTimeField(required=False)
+    publish_before = serializers.DateTimeField(required=False)
+
+    def validate(self, data):
+        after = data.get("publish_after")
+        before = data.get("publish_before")
+
+        if after and before and after >= before:
+            raise serializers.ValidationError(
+                "'publish_after' must be earlier than 'publish_before'."
+            )
+
+        return data
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from ..utils.urlbuilder import get_url_builder
+
+
+class FastHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """
+    Hyperlinked identity field which builds URLs with the application URL builder
+    instead of reversing the route for each object.
+
+    It fallbacks to the common DRF behavior when the URL depends on something else
+    than the object primary key, like a format suffix or an API versioning scheme.
+    """
+    def get_url(self, obj, view_name, request, format):
+        if (
+            format
+            or self.lookup_field != "pk"
+            or self.lookup_url_kwarg != "pk"
+            or getattr(request, "versioning_scheme", None) is not None
+            or (request and api_settings.URL_FORMAT_OVERRIDE in request.GET)
+        ):
+            return super().get_url(obj, view_name, request, format)
+
+        if obj.pk in (None, ""):
+            return None
+
+        url = get_url_builder(view_name)(obj.pk)
+
+        if request:
+            return request.build_absolute_uri(url)
+
+        return url
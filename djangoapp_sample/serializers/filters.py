@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from .export import ArticleExportFilterSerializer
+
+
+class ArticleFilterSerializer(ArticleExportFilterSerializer):
+    """
+    Validate the query arguments of the article API list filters.
+    """
+    ORDERINGS = ["-publish_start", "publish_start", "title", "-title"]
+
+    title_prefix = serializers.CharField(required=False, max_length=150)
+    ordering = serializers.ChoiceField(choices=ORDERINGS, required=False)
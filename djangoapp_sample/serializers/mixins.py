@@ -0,0 +1,247 @@
+import hashlib
+
+from django.conf import settings
+from rest_framework import permissions, serializers
+from rest_framework.settings import api_settings
+
+from ..cache import get_cache
+
+
+class CachedRepresentationListSerializer(serializers.ListSerializer):
+    """
+    List serializer which gets cached item representations with a single
+    ``get_many`` call and only serializes the missing ones.
+
+    Its child serializer must use ``CachedRepresentationMixin``.
+    """
+    def to_representation(self, data):
+        iterable = data.all() if hasattr(data, "all") else data
+        items = list(iterable)
+
+        if not items or not self.child.is_representation_cached():
+            return [self.child.to_representation(item) for item in items]
+
+        cache = get_cache()
+        base = self.child.get_representation_base_url()
+        keys = [self.child.get_representation_key(item) for item in items]
+        found = cache.get_many(keys)
+
+        representations = []
+        missing = {}
+        for key, item in zip(keys, items):
+            if key in found:
+                representations.append(
+                    self.child.absolutize_representation(found[key], base)
+                )
+            else:
+                data = self.child.to_uncached_representation(item)
+                missing[key] = self.child.relativize_representation(data, base)
+                representations.append(data)
+
+        if missing:
+            cache.set_many(missing, settings.REPRESENTATION_CACHE_TIMEOUT)
+
+        return representations
+
+
+class CachedRepresentationMixin:
+    """
+    Cache the representation of objects when setting
+    ``REPRESENTATION_CACHE_ENABLED`` is enabled.
+
+    Representations are cached per model, object primary key, serializer class,
+    serializer fields and object version, so an updated object always gets a new
+    entry and entries never need to be invalidated. Object version is given by
+    ``get_representation_version()``, default to the object last update date.
+
+    Cached representations store relative URLs, URL fields named in
+    ``representation_url_fields`` (including in nested objects) are turned to
+    absolute URLs for the current request host on output.
+
+    Only root serializers use the cache, a nested serializer is cached as a part of
+    its parent representation. Serializer ``Meta`` should set ``list_serializer_class``
+    to ``CachedRepresentationListSerializer`` to get many representations at once.
+    """
+    representation_url_fields = ("url", "view_url")
+
+    def is_representation_cached(self):
+        if not settings.REPRESENTATION_CACHE_ENABLED:
+            return False
+
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+
+        return parent is None
+
+    def get_representation_version(self, instance):
+        """
+        Return a value which changes whenever the object representation changes.
+        """
+        return instance.updated_at.timestamp()
+
+    def get_representation_variant(self):
+        """
+        Return the request values which change built URLs beside the host.
+        """
+        request = self.context.get("request")
+        if request is None:
+            return ""
+
+        return "{}|{}|{}".format(
+            self.context.get("format") or "",
+            getattr(request, "version", None) or "",
+            request.GET.get(api_settings.URL_FORMAT_OVERRIDE) or "",
+        )
+
+    def get_representation_key(self, instance):
+        opts = instance._meta
+        signature = hashlib.md5(
+            "{}|{}".format(
+                ",".join(self.fields.keys()), self.get_representation_variant()
+            ).encode("utf-8")
+        ).hexdigest()
+
+        return "djangoapp_sample:repr:{}.{}:{}:{}.{}:{}:{}".format(
+            opts.app_label,
+            opts.model_name,
+            instance.pk,
+            self.__class__.__module__,
+            self.__class__.__name__,
+            self.get_representation_version(instance),
+            signature,
+        )
+
+    def get_representation_base_url(self):
+        """
+        Return the scheme and host prefix of absolute URLs for the current request,
+        an empty string without request.
+        """
+        request = self.context.get("request")
+        if request is None:
+            return ""
+
+        return request.build_absolute_uri("/")[:-1]
+
+    def _walk_urls(self, data, convert):
+        """
+        Return a copy of representation with URL fields converted.
+        """
+        if isinstance(data, list):
+            return [self._walk_urls(item, convert) for item in data]
+
+        if not isinstance(data, dict):
+            return data
+
+        return {
+            name: (
+                convert(value)
+                if name in self.representation_url_fields and isinstance(value, str)
+                else self._walk_urls(value, convert)
+            )
+            for name, value in data.items()
+        }
+
+    def relativize_representation(self, data, base):
+        if not base:
+            return data
+
+        return self._walk_urls(
+            data,
+            lambda value: (
+                value[len(base):] if value.startswith(base + "/") else value
+            ),
+        )
+
+    def absolutize_representation(self, data, base):
+        if not base:
+            return data
+
+        return self._walk_urls(
+            data,
+            lambda value: base + value if value.startswith("/") else value,
+        )
+
+    def to_uncached_representation(self, instance):
+        return super().to_representation(instance)
+
+    def to_representation(self, instance):
+        if not self.is_representation_cached():
+            return self.to_uncached_representation(instance)
+
+        cache = get_cache()
+        base = self.get_representation_base_url()
+        key = self.get_representation_key(instance)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return self.absolutize_representation(cached, base)
+
+        data = self.to_uncached_representation(instance)
+        cache.set(
+            key,
+            self.relativize_representation(data, base),
+            settings.REPRESENTATION_CACHE_TIMEOUT,
+        )
+
+        return data
+
+
+class SparseFieldsetMixin:
+    """
+    Restrict serialized fields from request query arguments.
+
+    Argument ``fields`` lists the only fields to serialize and argument ``omit`` the
+    fields to remove, both as comma separated field names. Fields not serialized
+    are not computed at all (like method fields) and are not loaded from database
+    when the queryset is planned with ``plan_queryset()``.
+
+    Only root serializers are restricted and only for read requests, so nested
+    serializers keep their fields and writing is not affected. An unknown field
+    name is a validation error.
+    """
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def is_root_serializer(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+
+        return parent is None
+
+    def get_requested_names(self, request, param):
+        value = request.GET.get(param, "")
+
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        request = self.context.get("request")
+        if (
+            request is None
+            or request.method not in permissions.SAFE_METHODS
+            or not self.is_root_serializer()
+        ):
+            return fields
+
+        only = self.get_requested_names(request, self.fields_query_param)
+        omit = self.get_requested_names(request, self.omit_query_param)
+
+        errors = {}
+        for param, names in ((self.fields_query_param, only),
+                             (self.omit_query_param, omit)):
+            unknown = [name for name in names if name not in fields]
+            if unknown:
+                errors[param] = [
+                    "Unknown field(s): {}.".format(", ".join(unknown))
+                ]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return {
+            name: field
+            for name, field in fields.items()
+            if (not only or name in only) and name not in omit
+        }
@@ -0,0 +1,227 @@
+"""
+Query planning from serializer fields.
+
+``plan_queryset()`` inspects the readable fields of a serializer to derive the
+``select_related()``, ``prefetch_related()``, ``annotate()`` and ``only()`` a
+queryset needs so serializing any number of objects runs a constant number of
+queries.
+
+Serializers can declare what their fields can not tell:
+
+* ``plan_fields``: model field paths (with ``__`` for relations) read by methods,
+  like ``get_view_url()``. A serializer can also implement ``get_plan_fields()``
+  when these paths depend on its fields;
+* ``plan_annotations``: annotations as a dictionary of expressions for fields
+  which are not model fields, they are only applied if the field is serialized.
+
+When a field source can not be resolved to a model field or an annotation (like
+a model property), the queryset is not restricted with ``only()``.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+class QueryPlan:
+    """
+    Lookups collected for a queryset.
+
+    Attributes:
+        select (set): Lookups for ``select_related()``.
+        prefetch (dict): Lookups for ``prefetch_related()`` with their planned
+            queryset.
+        only (set): Field paths for ``only()``.
+        annotations (dict): Expressions for ``annotate()``.
+        complete (boolean): If every field source has been resolved, else
+            ``only()`` can not be used.
+    """
+    def __init__(self):
+        self.select = set()
+        self.prefetch = {}
+        self.only = set()
+        self.annotations = {}
+        self.complete = True
+
+    def apply(self, queryset):
+        if self.select:
+            queryset = queryset.select_related(*sorted(self.select))
+        if self.prefetch:
+            queryset = queryset.prefetch_related(*[
+                Prefetch(lookup, queryset=self.prefetch[lookup])
+                for lookup in sorted(self.prefetch)
+            ])
+        if self.annotations:
+            queryset = queryset.annotate(**self.annotations)
+        if self.complete:
+            queryset = queryset.only(*sorted(self.only))
+
+        return queryset
+
+
+def get_child_serializer(field):
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+
+    return field
+
+
+def get_plan_fields(serializer):
+    if hasattr(serializer, "get_plan_fields"):
+        return serializer.get_plan_fields()
+
+    return getattr(serializer, "plan_fields", [])
+
+
+def get_model_field(model, attr):
+    """
+    Return the model field for an attribute name, reverse relations are found from
+    their accessor name (like ``article_set``).
+
+    Raises:
+        FieldDoesNotExist: When the attribute is not a model field.
+    """
+    try:
+        return model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        for relation in model._meta.related_objects:
+            if relation.get_accessor_name() == attr:
+                return relation
+        raise
+
+
+def add_path(plan, model, prefix, path):
+    """
+    Add a field path declared by a serializer, relations along the path are
+    selected.
+    """
+    names = path.split("__")
+    for name in names[:-1]:
+        field = model._meta.get_field(name)
+        plan.select.add(prefix + name)
+        plan.only.add(prefix + name)
+        model = field.related_model
+        prefix += name + "__"
+
+    plan.only.add(prefix + names[-1])
+
+
+def plan_relation(plan, field, model_field, lookup, is_last):
+    """
+    Plan a relation from a field source.
+
+    Returns:
+        boolean: If the source path continues through the relation.
+    """
+    related_model = model_field.related_model
+
+    if model_field.many_to_many or model_field.one_to_many:
+        child = get_child_serializer(field)
+        queryset = related_model._default_manager.all()
+        if is_last and isinstance(child, serializers.BaseSerializer):
+            required = []
+            if model_field.one_to_many:
+                # Prefetch needs the foreign key to its parent
+                required.append(model_field.field.name)
+            queryset = plan_queryset(queryset, child, required=required)
+        plan.prefetch[lookup] = queryset
+
+        return False
+
+    if not is_last or isinstance(field, serializers.BaseSerializer):
+        plan.select.add(lookup)
+        plan.only.add(lookup)
+        return True
+
+    # A related field only needs the foreign key
+    plan.only.add(lookup)
+
+    return False
+
+
+def plan_serializer(plan, serializer, model, prefix="", annotate=True):
+    """
+    Collect lookups for the readable fields of a serializer.
+
+    Arguments:
+        plan (QueryPlan): Plan to fill.
+        serializer (rest_framework.serializers.Serializer): Serializer to plan.
+        model (django.db.models.Model): Model serialized at this level.
+
+    Keyword Arguments:
+        prefix (string): Lookup prefix from the planned queryset model.
+        annotate (boolean): If annotations can be added at this level, they can
+            not be added on a selected relation.
+    """
+    serializer = get_child_serializer(serializer)
+    annotations = getattr(serializer, "plan_annotations", {})
+
+    plan.only.add(prefix + model._meta.pk.name)
+    for path in get_plan_fields(serializer):
+        add_path(plan, model, prefix, path)
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if field.source == "*":
+            if isinstance(field, serializers.BaseSerializer):
+                plan_serializer(plan, field, model, prefix, annotate)
+            # Identity fields only need the primary key, method fields declare
+            # their needs with 'plan_fields'
+            continue
+
+        if field.source_attrs[0] in annotations:
+            if annotate:
+                plan.annotations[field.source_attrs[0]] = (
+                    annotations[field.source_attrs[0]]
+                )
+            else:
+                plan.complete = False
+            continue
+
+        current, lookup = model, prefix
+        for index, attr in enumerate(field.source_attrs):
+            is_last = index == len(field.source_attrs) - 1
+            try:
+                model_field = get_model_field(current, attr)
+            except FieldDoesNotExist:
+                plan.complete = False
+                break
+
+            if not model_field.is_relation:
+                plan.only.add(lookup + attr)
+                break
+
+            if not plan_relation(plan, field, model_field, lookup + attr, is_last):
+                break
+
+            if is_last:
+                plan_serializer(
+                    plan, field, model_field.related_model, lookup + attr + "__",
+                    annotate=False,
+                )
+            current, lookup = model_field.related_model, lookup + attr + "__"
+
+
+def plan_queryset(queryset, serializer, required=None):
+    """
+    Return a queryset planned to serialize its objects with a serializer.
+
+    Arguments:
+        queryset (QuerySet): Queryset to plan.
+        serializer (rest_framework.serializers.Serializer): Serializer which will
+            serialize the queryset objects, a list serializer is planned from its
+            child.
+
+    Keyword Arguments:
+        required (list): Field paths to load whatever the serializer needs.
+
+    Returns:
+        QuerySet: The planned queryset.
+    """
+    plan = QueryPlan()
+    plan_serializer(plan, serializer, queryset.model)
+    for path in required or []:
+        add_path(plan, queryset.model, "", path)
+
+    return plan.apply(queryset)
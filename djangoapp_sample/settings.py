@@ -17,3 +17,172 @@ ARTICLE_PAGINATION = 6
 Article entry per page limit for pagination, set it to ``None`` to disable
 pagination.
 """
+
+LISTING_PAGINATION_MODE = "offset"
+"""
+Pagination mode for blog index and blog detail views. Either ``offset`` for the
+default Django pagination with page numbers or ``cursor`` for a keyset pagination
+with only previous and next links which costs the same whatever the page depth.
+"""
+
+LISTING_COUNT_CACHE_TIMEOUT = 300
+"""
+Lifetime in seconds of cached item counts for the page numbers of blog index and
+blog detail views. Counts are invalidated on blog and article changes, a value of
+``0`` disables the cache.
+"""
+
+LISTING_APPROXIMATE_COUNT_THRESHOLD = None
+"""
+Minimal number of rows estimated from database statistics to display an
+approximate count instead of counting rows for page numbers of blog index and
+blog detail views. ``None`` always counts rows. Estimates are only supported
+with PostgreSQL.
+"""
+
+ARTICLE_SEARCH_BACKEND = None
+"""
+Python path to the article search backend class. When ``None`` the backend is
+selected from the database engine, a native full-text index is used for SQLite
+(FTS5) and PostgreSQL (GIN index on ``tsvector``), other engines fallback to a
+naive and slow search.
+"""
+
+ARTICLE_SEARCH_CONFIG = "english"
+"""
+Text search configuration used by the PostgreSQL search backend. Changing it
+requires to reinstall the search index.
+"""
+
+ARTICLE_EXPORT_CHUNK_SIZE = 2000
+"""
+Number of rows fetched from database at once when streaming an article export.
+"""
+
+ARTICLE_BATCH_MAX_SIZE = 1000
+"""
+Maximum number of items (created, updated and deleted) accepted in a single
+article batch request.
+"""
+
+CONTENT_CACHE_ALIAS = "default"
+"""
+Name of the cache from ``CACHES`` setting used to store application content
+caches and their versions.
+"""
+
+CONTENT_CACHE_STALE_TIMEOUT = 60
+"""
+Number of seconds an expired view or plugin cache entry is kept to be served while
+a single request recomputes it.
+"""
+
+CONTENT_CACHE_LOCK_TIMEOUT = 10
+"""
+Maximum number of seconds a request can hold the lock to recompute a view or
+plugin cache entry. It is also the maximum time other requests wait for it before
+computing the entry themselves.
+"""
+
+CONTENT_CACHE_EARLY_BETA = 1.0
+"""
+Factor of the probabilistic early recomputation of view and plugin cache entries
+before they expire. Greater values recompute earlier, ``0`` disables it.
+"""
+
+VIEW_CACHE_ENABLED = False
+"""
+Enable the full response cache of blog index, blog detail and article detail
+views for anonymous users. Cached responses are invalidated on blog and article
+changes.
+"""
+
+VIEW_CACHE_TIMEOUT = 300
+"""
+Lifetime in seconds of cached view responses. It is shortened to the next
+article publication change when there is one.
+"""
+
+BLOG_PLUGIN_CACHE_TIMEOUT = 300
+"""
+Lifetime in seconds of cached article lists of the blog plugin. They are
+invalidated on blog and article changes and expire on the next article
+publication change, a value of ``0`` disables the cache.
+"""
+
+QUERYSET_CACHE_TIMEOUT = 300
+"""
+Default lifetime in seconds of queryset results cached with ``cache()`` method
+from Blog and Article querysets. They are invalidated on any write to the
+application tables they read from.
+"""
+
+LOCAL_CACHE_ENABLED = False
+"""
+Enable the in-process cache tier in front of the content cache, so each process
+keeps its most used cache entries in memory.
+"""
+
+LOCAL_CACHE_MAX_ENTRIES = 1000
+"""
+Maximum number of entries kept in the in-process cache tier of each process.
+"""
+
+LOCAL_CACHE_MAX_BYTES = 16 * 1024 * 1024
+"""
+Maximum total size in bytes (from pickled values) of entries kept in the
+in-process cache tier of each process.
+"""
+
+LOCAL_CACHE_TIMEOUT = 30
+"""
+Maximum lifetime in seconds of an entry in the in-process cache tier. It bounds
+how long a content cache entry which expired by itself (like on a publication
+date) can still be served by a process.
+"""
+
+LOCAL_CACHE_SYNC_INTERVAL = 1
+"""
+Maximum number of seconds between two checks of the invalidation generation by a
+process, it bounds how long an invalidated entry can still be served by another
+process than the one which invalidated it.
+"""
+
+LOCAL_CACHE_GENERATION_FILE = None
+"""
+Path to a file used to share the invalidation generation between processes of a
+same host instead of the content cache. It is required when the content cache is
+not shared between processes (like the local memory backend).
+"""
+
+BLOG_LOOKUP_CACHE_TIMEOUT = 300
+"""
+Lifetime in seconds of cached blogs looked up by views and API from their id. They
+are invalidated on blog and article changes, a value of ``0`` disables the cache.
+"""
+
+BLOG_LOOKUP_MISS_TIMEOUT = 10
+"""
+Lifetime in seconds of cached lookups on unknown blog ids, so repeated requests
+on them do not query the database each time. It should stay short since blogs
+created outside of the ORM do not invalidate them.
+"""
+
+REPRESENTATION_CACHE_ENABLED = False
+"""
+Enable the cache of API object representations. Representations are cached per
+object version (from its last update date) so they never need to be invalidated.
+"""
+
+REPRESENTATION_CACHE_TIMEOUT = 3600
+"""
+Lifetime in seconds of cached API object representations.
+"""
+
+API_FAST_RENDERERS_ENABLED = False
+"""
+Enable fast renderers and parsers on API viewsets when their library is installed:
+the JSON renderer is replaced by an ``orjson`` renderer and MessagePack is
+available with content negotiation (``application/msgpack`` media type or
+``msgpack`` format). Disabled by default since it changes the API renderers.
+"""
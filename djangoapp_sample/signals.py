@@ -0,0 +1,109 @@
+"""
+Signal receivers to keep application data in sync with model changes.
+"""
+from django.db.models.query import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import (
+    blog_ids_from_scopes, content_invalidated, forget_blogs, invalidate_blogs,
+)
+from .managers import invalidate_tables
+from .models import Article, Blog, BlogPluginModel
+from .plugins.blog import BlogPlugin
+
+
+def is_bulk_article_deletion(origin):
+    """
+    Return if an article deletion comes from an ``ArticleQuerySet`` or cascades
+    from a blog, these cases already update blog data in bulk.
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model in (Article, Blog)
+
+    return isinstance(origin, Blog)
+
+
+@receiver(post_delete, sender=Article, dispatch_uid="djangoapp_sample_article_count")
+def decrement_article_count(sender, instance, origin=None, using=None, **kwargs):
+    """
+    Decrement the article counter of the blog from a deleted article.
+
+    Deletion from an ``ArticleQuerySet`` already updates counters in bulk and
+    deletion cascading from a blog does not need it, so both are ignored.
+    """
+    if is_bulk_article_deletion(origin):
+        return
+
+    Blog.objects.using(using).adjust_article_count({instance.blog_id: -1})
+
+
+@receiver(post_save, sender=Article, dispatch_uid="djangoapp_sample_article_saved")
+def invalidate_saved_article(sender, instance, using=None, **kwargs):
+    """
+    Invalidate cached content of the article blog and its previous blog on
+    reassignment.
+    """
+    invalidate_blogs({instance.blog_id, instance._loaded_blog_id}, using=using)
+
+
+@receiver(
+    post_delete, sender=Article, dispatch_uid="djangoapp_sample_article_deleted"
+)
+def invalidate_deleted_article(sender, instance, origin=None, using=None,
+                               **kwargs):
+    """
+    Invalidate cached content of the deleted article blog.
+    """
+    if is_bulk_article_deletion(origin):
+        return
+
+    invalidate_blogs({instance.blog_id}, using=using)
+
+
+@receiver(post_save, sender=Blog, dispatch_uid="djangoapp_sample_blog_saved")
+@receiver(post_delete, sender=Blog, dispatch_uid="djangoapp_sample_blog_deleted")
+def invalidate_blog(sender, instance, using=None, **kwargs):
+    """
+    Invalidate cached content of a saved or deleted blog.
+    """
+    invalidate_blogs({instance.pk}, using=using)
+
+
+@receiver(content_invalidated, dispatch_uid="djangoapp_sample_blog_plugins")
+def clear_blog_plugin_caches(sender, scopes, **kwargs):
+    """
+    Clear placeholder caches of blog plugins depending on invalidated content.
+    """
+    blog_ids = blog_ids_from_scopes(scopes)
+    if blog_ids:
+        BlogPlugin.clear_cache_for_blogs(blog_ids)
+
+
+@receiver(content_invalidated, dispatch_uid="djangoapp_sample_blog_lookups")
+def forget_blog_lookups(sender, scopes, **kwargs):
+    """
+    Delete cached lookups of blogs with invalidated content.
+    """
+    forget_blogs(blog_ids_from_scopes(scopes))
+
+
+@receiver(post_save, sender=Article, dispatch_uid="djangoapp_sample_article_table_save")
+@receiver(
+    post_delete, sender=Article, dispatch_uid="djangoapp_sample_article_table_delete"
+)
+@receiver(post_save, sender=Blog, dispatch_uid="djangoapp_sample_blog_table_save")
+@receiver(post_delete, sender=Blog, dispatch_uid="djangoapp_sample_blog_table_delete")
+@receiver(
+    post_save, sender=BlogPluginModel, dispatch_uid="djangoapp_sample_plugin_table_save"
+)
+@receiver(
+    post_delete,
+    sender=BlogPluginModel,
+    dispatch_uid="djangoapp_sample_plugin_table_delete",
+)
+def invalidate_model_table(sender, using=None, **kwargs):
+    """
+    Invalidate cached queryset results depending on the table of a written row.
+    """
+    invalidate_tables([sender], using=using)
@@ -2,7 +2,7 @@ from django.urls import path, include
 
 from .views import (
     BlogIndexView, BlogDetailView,
-    ArticleDetailView,
+    ArticleDetailView, ArticleSearchView,
 )
 from .routers import router
 
@@ -13,6 +13,7 @@ app_name = "djangoapp_sample"
 urlpatterns = [
     path("", BlogIndexView.as_view(), name="blog-index"),
     path("api/", include(router.urls)),
+    path("search/", ArticleSearchView.as_view(), name="article-search"),
     path("<int:blog_pk>/", BlogDetailView.as_view(), name="blog-detail"),
     path(
         "<int:blog_pk>/<int:article_pk>/",
@@ -0,0 +1,95 @@
+"""
+Helpers for conditional GET with ETag and Last-Modified validators.
+
+Validators are computed from a cheap aggregate query (named a freshness) instead
+of the rendered content, so a client revalidating an unchanged resource gets a
+``304 Not Modified`` response without any rendering nor serialization.
+"""
+import datetime
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def build_etag(*parts):
+    """
+    Build a strong quoted ETag from some values.
+
+    Arguments:
+        *parts: Values which identify a resource representation, they are
+            turned to strings.
+
+    Returns:
+        string: Quoted ETag.
+    """
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+
+    return quote_etag(digest)
+
+
+def build_validators(freshness, *parts):
+    """
+    Build validators from a freshness.
+
+    Arguments:
+        freshness (dict): Values that change when the resource changes, datetime
+            values are used to determine the last modification.
+        *parts: Other values which identify the representation, like request path
+            or language.
+
+    Returns:
+        tuple: The ETag and the last modification datetime which may be ``None``
+        if there is no datetime in freshness.
+    """
+    dates = [
+        value for value in freshness.values()
+        if isinstance(value, datetime.datetime)
+    ]
+
+    return (
+        build_etag(*parts, *sorted(freshness.items())),
+        max(dates) if dates else None,
+    )
+
+
+def conditional_response(request, etag, last_modified):
+    """
+    Return a response for a conditional request if its validators match.
+
+    Arguments:
+        request (django.http.HttpRequest): The request.
+        etag (string): Quoted ETag of the current resource.
+        last_modified (datetime.datetime): Last modification of the current
+            resource, may be ``None``.
+
+    Returns:
+        django.http.HttpResponse: A ``304 Not Modified`` (or ``412 Precondition
+        Failed``) response or ``None`` if the request has to be processed.
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=(
+            int(last_modified.timestamp()) if last_modified else None
+        ),
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    """
+    Set validator headers on a response, existing headers are kept.
+    """
+    if etag and not response.has_header("ETag"):
+        response["ETag"] = etag
+
+    if last_modified and not response.has_header("Last-Modified"):
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+
+    return response
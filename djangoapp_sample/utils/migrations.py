@@ -0,0 +1,67 @@
+"""
+=====================
+Migration operations
+=====================
+
+Custom migration operations which adapt to the database backend.
+
+"""
+from django.db import NotSupportedError
+from django.db.migrations.operations import AddIndex
+
+
+class ConcurrentAddIndex(AddIndex):
+    """
+    Add an index without locking table writes when the database supports it.
+
+    On PostgreSQL the index is built with ``CREATE INDEX CONCURRENTLY`` so it can be
+    added on large live tables, this requires the migration to be non atomic
+    (``atomic = False``). Other backends like SQLite fallback to the common
+    ``AddIndex`` behavior.
+
+    .. Warning::
+        If a concurrent build fails, PostgreSQL leaves an ``INVALID`` index that you
+        need to drop before retrying the migration.
+    """
+    def describe(self):
+        return "Create index %s on field(s) %s of model %s (concurrently if " \
+            "supported)" % (
+                self.index.name,
+                ", ".join(self.index.fields),
+                self.model_name,
+            )
+
+    def _is_concurrent(self, schema_editor):
+        """
+        Return if the operation can build index concurrently.
+        """
+        if schema_editor.connection.vendor != "postgresql":
+            return False
+
+        if schema_editor.connection.in_atomic_block:
+            raise NotSupportedError(
+                "The %s operation cannot be executed inside a transaction "
+                "(set atomic = False on the migration)." % self.__class__.__name__
+            )
+
+        return True
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not self._is_concurrent(schema_editor):
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not self._is_concurrent(schema_editor):
+            return super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
@@ -5,7 +5,7 @@ Test utilities
 
 """
 from django.contrib.sites.models import Site
-from django.template.response import TemplateResponse
+from django.http import HttpResponse
 from django.test.html import parse_html
 from django.urls import reverse
 
@@ -132,19 +132,19 @@ def get_admin_list_url(model):
 
 def decode_response_or_string(content):
     """
-    Shortand to get HTML string from either a TemplateResponse (as returned
-    from Django test client) or a simple string so you can blindly give a
-    response or a string without to care about content type.
+    Shortand to get HTML string from either a response (as returned from Django
+    test client, like a TemplateResponse) or a simple string so you can blindly
+    give a response or a string without to care about content type.
 
     Arguments:
-        content (TemplateResponse or string): If content is a string it will
-            just return it. If content is a TemplateResponse it will decode byte
+        content (HttpResponse or string): If content is a string it will
+            just return it. If content is a response it will decode byte
             string from its ``content`` attribute.
 
     Returns:
         string: HTML string.
     """
-    if isinstance(content, TemplateResponse):
+    if isinstance(content, HttpResponse):
         return content.content.decode()
     return content
 
@@ -211,6 +211,21 @@ def queryset_values(queryset, names=["slug", "language"],
     )
 
 
+def drf_datetime(value):
+    """
+    Return the representation of a datetime as serialized by DRF.
+
+    Arguments:
+        value (datetime.datetime): Datetime to represent.
+
+    Returns:
+        string: Datetime in ISO format converted to the current timezone.
+    """
+    from rest_framework.fields import DateTimeField
+
+    return DateTimeField().to_representation(value)
+
+
 def compact_form_errors(form):
     """
     Build a compact dict of field errors without messages.
@@ -0,0 +1,122 @@
+"""
+===========
+URL builder
+===========
+
+Build URLs for application routes without going through the URL resolver on each
+call.
+
+A route is reversed once with sentinel arguments to get a template, then URLs are
+just formatted from this template. Templates are cached per URL configuration,
+script prefix and active language so they stay correct when a project mounts the
+application urls behind a script prefix or ``i18n_patterns``.
+
+"""
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils.translation import get_language
+
+
+# Arbitrary big numbers unlikely to appear in any URL prefix
+SENTINEL_BASE = 918273645501
+
+
+class URLBuilder:
+    """
+    URL builder for a named route with positional integer arguments.
+
+    Arguments:
+        viewname (string): Route name including its namespace.
+        argcount (integer): Number of positional arguments for the route.
+
+    Example:
+        >>> builder = URLBuilder("djangoapp_sample:article-detail", 2)
+        >>> builder(1, 42)
+        '/djangoapp_sample/1/42/'
+    """
+    def __init__(self, viewname, argcount):
+        self.viewname = viewname
+        self.argcount = argcount
+        self._templates = {}
+
+    def __repr__(self):
+        return "<URLBuilder {}>".format(self.viewname)
+
+    def clear(self):
+        self._templates = {}
+
+    def get_template(self):
+        """
+        Return the URL template for current URL configuration.
+
+        Returns:
+            string: An URL template with ``%s`` placeholders for arguments or
+            ``None`` if the route can not be turned into a template.
+        """
+        key = (get_urlconf(), get_script_prefix(), get_language())
+
+        try:
+            return self._templates[key]
+        except KeyError:
+            pass
+
+        sentinels = [str(SENTINEL_BASE + i) for i in range(self.argcount)]
+        template = reverse(self.viewname, args=sentinels).replace("%", "%%")
+
+        for sentinel in sentinels:
+            if template.count(sentinel) != 1:
+                template = None
+                break
+            template = template.replace(sentinel, "%s")
+
+        self._templates[key] = template
+
+        return template
+
+    def __call__(self, *args):
+        template = self.get_template()
+
+        # Unexpected route pattern, fallback to the common reverse
+        if template is None:
+            return reverse(self.viewname, args=args)
+
+        return template % tuple(int(arg) for arg in args)
+
+
+_BUILDERS = {}
+
+
+def get_url_builder(viewname, argcount=1):
+    """
+    Return the shared builder for a route, creating it if needed.
+
+    Arguments:
+        viewname (string): Route name including its namespace.
+
+    Keyword Arguments:
+        argcount (integer): Number of positional arguments for the route.
+
+    Returns:
+        URLBuilder: The builder for the route.
+    """
+    key = (viewname, argcount)
+
+    try:
+        return _BUILDERS[key]
+    except KeyError:
+        return _BUILDERS.setdefault(key, URLBuilder(viewname, argcount))
+
+
+@receiver(setting_changed, dispatch_uid="djangoapp_sample_urlbuilder")
+def clear_url_builders(*, setting, **kwargs):
+    """
+    Clear templates when URL configuration changes, like from tests.
+    """
+    if setting == "ROOT_URLCONF":
+        for builder in _BUILDERS.values():
+            builder.clear()
+
+
+blog_detail_url = get_url_builder("djangoapp_sample:blog-detail")
+article_detail_url = get_url_builder("djangoapp_sample:article-detail", 2)
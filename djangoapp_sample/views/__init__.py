@@ -1,9 +1,10 @@
 from .blog import BlogIndexView, BlogDetailView
-from .article import ArticleDetailView
+from .article import ArticleDetailView, ArticleSearchView
 
 
 __all__ = [
     "BlogIndexView",
     "BlogDetailView",
     "ArticleDetailView",
+    "ArticleSearchView",
 ]
@@ -1,13 +1,24 @@
-from django.shortcuts import get_object_or_404
-from django.views.generic import DetailView
+from urllib.parse import urlencode
 
+from django.conf import settings
+from django.utils import timezone
+from django.views.generic import DetailView, ListView
 
-from ..models import Blog, Article
 
+from ..cache import blog_scope, get_blog_or_404
+from ..models import Article
+from ..search import search_articles
 
-class ArticleDetailView(DetailView):
+from .mixins import (
+    CachedResponseMixin, ConditionalResponseMixin, PublicationExpiryMixin,
+)
+
+
+class ArticleDetailView(ConditionalResponseMixin, CachedResponseMixin,
+                        PublicationExpiryMixin, DetailView):
     """
-    Article detail
+    Article detail, unpublished articles are only visible to users with the article
+    change permission.
     """
     pk_url_kwarg = "article_pk"
     template_name = "djangoapp_sample/article_detail.html"
@@ -19,15 +30,68 @@ class ArticleDetailView(DetailView):
         query argument and set the blog object as an attribute for template
         context.
         """
-        self.blog_object = get_object_or_404(
-            Blog,
-            pk=self.kwargs.get("blog_pk"),
+        self.blog_object = get_blog_or_404(self.kwargs.get("blog_pk"))
+
+        return Article.objects.filter(blog=self.blog_object).visible_to(
+            self.request.user
         )
 
-        return Article.objects.filter(blog=self.blog_object)
+    def get_cache_scopes(self):
+        return [blog_scope(self.kwargs.get("blog_pk"))]
+
+    def get_freshness(self):
+        return Article.objects.filter(
+            pk=self.kwargs.get(self.pk_url_kwarg),
+            blog_id=self.kwargs.get("blog_pk"),
+        ).freshness()
+
+    def get_visibility_change(self):
+        # Avoid queries since the article is already loaded
+        now = timezone.now()
+
+        return next(
+            (
+                moment
+                for moment in (self.object.publish_start, self.object.publish_end)
+                if moment is not None and moment > now
+            ),
+            None,
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["blog_object"] = self.blog_object
 
         return context
+
+
+class ArticleSearchView(PublicationExpiryMixin, ListView):
+    """
+    Article full-text search results ordered by relevance, only published articles
+    are searched except for users with the article change permission.
+    """
+    template_name = "djangoapp_sample/article_search.html"
+    paginate_by = settings.ARTICLE_PAGINATION
+    query_kwarg = "q"
+
+    def get_search_query(self):
+        return self.request.GET.get(self.query_kwarg, "").strip()
+
+    def get_queryset(self):
+        return search_articles(
+            Article.objects.visible_to(self.request.user).for_listing(),
+            self.get_search_query(),
+        )
+
+    def get_visibility_queryset(self):
+        return Article.objects.all()
+
+    def get_context_data(self, **kwargs):
+        query = self.get_search_query()
+
+        context = super().get_context_data(**kwargs)
+        context["search_query"] = query
+        # Keep the query in pagination links
+        context["pagination_query"] = urlencode({self.query_kwarg: query}) + "&"
+
+        return context
@@ -2,10 +2,17 @@ from django.conf import settings
 from django.views.generic import ListView
 from django.views.generic.detail import SingleObjectMixin
 
+from ..cache import blog_scope, get_blog_or_404
 from ..models import Blog
 
+from .mixins import (
+    CachedCountPaginationMixin, CachedResponseMixin, ConditionalResponseMixin,
+    KeysetPaginationMixin, PublicationExpiryMixin,
+)
 
-class BlogIndexView(ListView):
+
+class BlogIndexView(CachedResponseMixin, KeysetPaginationMixin,
+                    CachedCountPaginationMixin, ListView):
     """
     List of blogs
     """
@@ -13,21 +20,50 @@ class BlogIndexView(ListView):
     queryset = Blog.objects.order_by("title")
     template_name = "djangoapp_sample/blog_index.html"
     paginate_by = settings.BLOG_PAGINATION
+    keyset_ordering = ["title"]
+
+    def get_cache_scopes(self):
+        return ["blogs"]
 
 
-class BlogDetailView(SingleObjectMixin, ListView):
+class BlogDetailView(ConditionalResponseMixin, CachedResponseMixin,
+                     PublicationExpiryMixin, KeysetPaginationMixin,
+                     CachedCountPaginationMixin, SingleObjectMixin, ListView):
     """
-    Blog detail and its related article list
+    Blog detail and its related article list, only published articles are listed
+    except for users with the article change permission.
     """
     pk_url_kwarg = "blog_pk"
     template_name = "djangoapp_sample/blog_detail.html"
     paginate_by = settings.ARTICLE_PAGINATION
     context_object_name = "blog_object"
+    keyset_ordering = ["-publish_start", "id"]
 
     def get_queryset(self):
-        return self.object.article_set.order_by("-publish_start")
+        return self.object.article_set.visible_to(
+            self.request.user
+        ).for_listing().order_by("-publish_start", "id")
+
+    def get_visibility_queryset(self):
+        return self.object.article_set.all()
+
+    def get_cache_scopes(self):
+        return [blog_scope(self.kwargs[self.pk_url_kwarg])]
+
+    def get_count_cache_key(self):
+        # Users allowed to change articles see the unpublished ones too
+        return "{}:{}:{}".format(
+            self.__class__.__name__,
+            self.kwargs[self.pk_url_kwarg],
+            self.request.user.has_perm("djangoapp_sample.change_article"),
+        )
+
+    def get_freshness(self):
+        return Blog.objects.filter(pk=self.kwargs[self.pk_url_kwarg]).freshness(
+            articles=True
+        )
 
     def get(self, request, *args, **kwargs):
-        self.object = self.get_object(queryset=Blog.objects.all())
+        self.object = get_blog_or_404(self.kwargs[self.pk_url_kwarg])
 
         return super().get(request, *args, **kwargs)
@@ -0,0 +1,303 @@
+import hashlib
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_max_age, patch_cache_control
+from django.utils.translation import gettext as _
+
+from ..cache import get_or_compute, get_versions
+from ..pagination import CachedCountPaginator, KeysetPaginator
+from ..utils.conditional import (
+    build_validators, conditional_response, set_validators,
+)
+
+
+class KeysetPaginationMixin:
+    """
+    Enable keyset pagination on a ``ListView`` when setting
+    ``LISTING_PAGINATION_MODE`` is ``cursor``, else the default Django pagination
+    is used.
+
+    Set attribute ``keyset_ordering`` on your view with a total ordering of model
+    fields to paginate on.
+    """
+    keyset_ordering = None
+    cursor_kwarg = "cursor"
+
+    def get_pagination_mode(self):
+        return settings.LISTING_PAGINATION_MODE
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.get_pagination_mode() != "cursor":
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as e:
+            raise Http404(_("Invalid page: %(message)s") % {"message": str(e)})
+
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+
+class CachedCountPaginationMixin:
+    """
+    Paginate a ``ListView`` with ``CachedCountPaginator`` so the item count is
+    cached instead of counting rows on every page.
+
+    Cache key is built from ``get_count_cache_key()``, default to the view class
+    name, and from the versions of content scopes from ``get_cache_scopes()``
+    (like for ``CachedResponseMixin``). When view has a ``get_cache_timeout()``
+    method (like from ``PublicationExpiryMixin``) it is used to shorten the
+    timeout from setting ``LISTING_COUNT_CACHE_TIMEOUT``.
+    """
+    paginator_class = CachedCountPaginator
+
+    def get_count_cache_key(self):
+        return self.__class__.__name__
+
+    def get_count_cache_timeout(self):
+        timeout = settings.LISTING_COUNT_CACHE_TIMEOUT
+        if timeout != 0 and hasattr(self, "get_cache_timeout"):
+            timeout = self.get_cache_timeout(timeout)
+
+        return timeout
+
+    def get_paginator(self, *args, **kwargs):
+        kwargs.update(
+            cache_key=self.get_count_cache_key(),
+            cache_scopes=self.get_cache_scopes(),
+            timeout=self.get_count_cache_timeout(),
+            approximate_threshold=settings.LISTING_APPROXIMATE_COUNT_THRESHOLD,
+        )
+
+        return super().get_paginator(*args, **kwargs)
+
+
+def seconds_until(moment, now=None):
+    """
+    Return the number of seconds until a date, never less than zero.
+
+    Arguments:
+        moment (datetime.datetime): The date to reach.
+
+    Keyword Arguments:
+        now (datetime.datetime): Date to start from, default to current date.
+
+    Returns:
+        int: Number of seconds, rounded up.
+    """
+    delta = (moment - (now or timezone.now())).total_seconds()
+
+    return max(0, int(delta) + (1 if delta % 1 else 0))
+
+
+class PublicationExpiryMixin:
+    """
+    Bound the lifetime of cached responses to the next article visibility change,
+    so a page is not served from caches after an article goes live or ends.
+
+    When response has a ``Cache-Control`` max age (set by the view or a cache
+    decorator), it is lowered to the number of seconds until the next change.
+
+    Views must implement ``get_visibility_queryset()`` to return the articles
+    their content depends on.
+    """
+    def get_visibility_queryset(self):
+        raise NotImplementedError(
+            "Views using PublicationExpiryMixin must implement "
+            "get_visibility_queryset()."
+        )
+
+    def get_visibility_change(self):
+        """
+        Return the date of the next visibility change of view articles.
+
+        Returns:
+            datetime.datetime: The next change or ``None``.
+        """
+        if not hasattr(self, "_visibility_change"):
+            self._visibility_change = (
+                self.get_visibility_queryset().next_visibility_change()
+            )
+
+        return self._visibility_change
+
+    def get_cache_timeout(self, timeout):
+        """
+        Return the given cache timeout capped to the next visibility change.
+
+        Arguments:
+            timeout (int): Cache timeout in seconds, ``None`` means forever.
+
+        Returns:
+            int: Cache timeout in seconds.
+        """
+        change = self.get_visibility_change()
+        if change is None:
+            return timeout
+
+        remaining = seconds_until(change)
+
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+
+        max_age = get_max_age(response)
+        if max_age is not None:
+            patch_cache_control(response, max_age=self.get_cache_timeout(max_age))
+
+        return response
+
+
+class CachedResponseMixin:
+    """
+    Cache the whole response of a view for anonymous users when setting
+    ``VIEW_CACHE_ENABLED`` is enabled.
+
+    Cache keys include the current versions of the content scopes the view
+    depends on, so responses are invalidated as soon as a related blog or article
+    is changed. Views must implement ``get_cache_scopes()`` to return these
+    scopes, they can only rely on URL arguments since it is called before the
+    view processing.
+
+    Only successful ``GET`` and ``HEAD`` responses without cookies are cached with
+    their headers (like ``Cache-Control``, ``Expires`` or ``Vary``), they are
+    recomputed with stampede protection (see ``get_or_compute()``).
+    When view has a ``get_cache_timeout()`` method (like from
+    ``PublicationExpiryMixin``) it is used to shorten the timeout from setting
+    ``VIEW_CACHE_TIMEOUT``.
+    """
+    cache_key_prefix = "djangoapp_sample:view:"
+
+    def get_cache_scopes(self):
+        raise NotImplementedError(
+            "Views using CachedResponseMixin must implement get_cache_scopes()."
+        )
+
+    def is_cacheable_request(self, request):
+        return (
+            settings.VIEW_CACHE_ENABLED
+            and request.method in ("GET", "HEAD")
+            and not request.user.is_authenticated
+        )
+
+    def get_response_cache_key(self, request):
+        """
+        Return the cache key for the response of a request, including the content
+        versions, the full path and the current language.
+        """
+        scopes = sorted(self.get_cache_scopes())
+        versions = get_versions(scopes)
+        digest = hashlib.md5(
+            "{}|{}".format(
+                request.get_full_path(), getattr(request, "LANGUAGE_CODE", "")
+            ).encode("utf-8")
+        ).hexdigest()
+
+        return "{prefix}{view}:{versions}:{digest}".format(
+            prefix=self.cache_key_prefix,
+            view=self.__class__.__name__,
+            versions=".".join(versions[scope] for scope in scopes),
+            digest=digest,
+        )
+
+    def get_response_cache_timeout(self):
+        timeout = settings.VIEW_CACHE_TIMEOUT
+        if hasattr(self, "get_cache_timeout"):
+            timeout = self.get_cache_timeout(timeout)
+
+        return timeout
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.is_cacheable_request(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        response = None
+
+        def compute():
+            nonlocal response
+
+            response = super(CachedResponseMixin, self).dispatch(
+                request, *args, **kwargs
+            )
+            if (
+                response.status_code != 200
+                or response.streaming
+                or response.cookies
+            ):
+                return None, 0
+
+            if hasattr(response, "render"):
+                response.render()
+
+            return (
+                (response.content, dict(response.items())),
+                self.get_response_cache_timeout(),
+            )
+
+        cached = get_or_compute(self.get_response_cache_key(request), compute)
+        if response is not None:
+            return response
+
+        content, headers = cached
+        return HttpResponse(content, headers=headers)
+
+
+class ConditionalResponseMixin:
+    """
+    Emit ``ETag`` and ``Last-Modified`` validators and answer conditional ``GET``
+    and ``HEAD`` requests with a ``304 Not Modified`` response when the content
+    has not changed, without processing the view.
+
+    Views must implement ``get_freshness()`` which returns aggregated values that
+    change whenever view content changes, they can only rely on URL arguments since
+    it is called before the view processing. The ETag also depends on the request
+    path, the language and the user.
+    """
+    def get_freshness(self):
+        raise NotImplementedError(
+            "Views using ConditionalResponseMixin must implement get_freshness()."
+        )
+
+    def get_validators(self):
+        """
+        Return the view validators.
+
+        Returns:
+            tuple: The ETag and the last modification date, both are ``None`` if
+            there is no content (like for a missing object).
+        """
+        freshness = self.get_freshness()
+        if not freshness or not any(freshness.values()):
+            return None, None
+
+        return build_validators(
+            freshness,
+            self.__class__.__name__,
+            self.request.get_full_path(),
+            getattr(self.request, "LANGUAGE_CODE", ""),
+            self.request.user.pk,
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validators()
+        if etag is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        response = conditional_response(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, last_modified)
+
+        return response
@@ -1,18 +1,127 @@
-from rest_framework import viewsets
+from django.contrib.auth import get_permission_codename
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
+from ..bulk.batch import OPERATIONS, ArticleBatch
+from ..filters import IndexedArticleFilterBackend
 from ..models import Article
+from ..pagination.api import ArticleCursorPagination, SearchPagination
+from ..search import search_articles
 from ..serializers import ArticleSerializer, ArticleResumeSerializer
+from ..utils.urlbuilder import get_url_builder
 
-from .mixins import ConditionalResumedSerializerMixin
+from .mixins import (
+    ArticleExportMixin, ConditionalResumedSerializerMixin, ConditionalViewSetMixin,
+    FastRenderersMixin, SerializerQueryPlanMixin,
+)
 
 
-class ArticleViewSet(ConditionalResumedSerializerMixin, viewsets.ModelViewSet):
+class ArticleViewSet(ConditionalViewSetMixin, ArticleExportMixin,
+                     ConditionalResumedSerializerMixin, SerializerQueryPlanMixin,
+                     FastRenderersMixin, viewsets.ModelViewSet):
     """
     Viewset for all HTTP methods on Article model.
+
+    Read methods only return published articles except for users with the article
+    change permission, their queryset is planned from the serializer. List is
+    paginated with a cursor and can be filtered and ordered on indexed
+    combinations only.
     """
     model = Article
     serializer_class = ArticleSerializer
+    pagination_class = ArticleCursorPagination
+    filter_backends = [IndexedArticleFilterBackend]
     resumed_serializer_class = ArticleResumeSerializer
+    resumed_actions = ["list", "search"]
 
     def get_queryset(self):
-        return self.model.objects.all()
+        queryset = self.model.objects.all()
+        if self.request.method in permissions.SAFE_METHODS:
+            queryset = queryset.visible_to(self.request.user)
+
+        return queryset
+
+    def get_freshness(self):
+        queryset = self.model.objects.all()
+        if self.action == "retrieve":
+            queryset = queryset.filter(pk=self.kwargs["pk"])
+
+        return queryset.freshness()
+
+    @action(detail=False, methods=["get"], pagination_class=SearchPagination)
+    def search(self, request):
+        """
+        Full-text search on article title and content with the ``q`` query
+        argument. Results are ordered by relevance and paginated.
+        """
+        queryset = search_articles(
+            self.filter_queryset(self.get_queryset()), request.GET.get("q", "")
+        )
+
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Stream all articles as NDJSON or CSV, without pagination.
+        """
+        return self.export_response(
+            self.model.objects.visible_to(request.user), "articles"
+        )
+
+    def check_batch_permissions(self, request):
+        """
+        Check the user has model permissions for every operation in the batch
+        payload, the common permission check only requires the add permission for
+        a POST request.
+
+        It is checked before the payload validation since validation errors tell
+        which article and blog ids exist. A payload which is not an object is left
+        to the validation.
+        """
+        data = request.data
+        if not isinstance(data, dict):
+            return
+
+        opts = self.model._meta
+        actions = {"create": "add", "update": "change", "delete": "delete"}
+
+        for name in OPERATIONS:
+            if data.get(name) and not request.user.has_perm(
+                "{}.{}".format(
+                    opts.app_label, get_permission_codename(actions[name], opts)
+                )
+            ):
+                self.permission_denied(request)
+
+    @action(detail=False, methods=["post"])
+    def batch(self, request):
+        """
+        Create, update and delete many articles at once.
+
+        The payload is an object with optional lists ``create``, ``update`` (items
+        with an ``id``) and ``delete`` (article ids). The batch is written in a
+        single transaction, if any item is invalid nothing is written and errors
+        are returned for each item.
+        """
+        self.check_batch_permissions(request)
+
+        batch = ArticleBatch(request.data)
+        if not batch.is_valid():
+            return Response(batch.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        results = batch.save()
+        url_builder = get_url_builder("djangoapp_sample:api-article-detail")
+
+        return Response({
+            "create": [
+                {"id": pk, "url": request.build_absolute_uri(url_builder(pk))}
+                for pk in results["create"]
+            ],
+            "update": [{"id": pk} for pk in results["update"]],
+            "delete": [{"id": pk} for pk in results["delete"]],
+        })
@@ -1,15 +1,47 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
 
 from ..models import Blog
+from ..pagination.api import BlogCursorPagination
 from ..serializers import BlogSerializer
 
+from .mixins import (
+    ArticleExportMixin, ConditionalViewSetMixin, FastRenderersMixin,
+    SerializerQueryPlanMixin,
+)
 
-class BlogViewSet(viewsets.ModelViewSet):
+
+class BlogViewSet(ConditionalViewSetMixin, ArticleExportMixin,
+                  SerializerQueryPlanMixin, FastRenderersMixin,
+                  viewsets.ModelViewSet):
     """
-    Viewset for all HTTP methods on Blog model.
+    Viewset for all HTTP methods on Blog model, list is paginated with a cursor.
+
+    Queryset of read methods is planned from the serializer.
     """
     model = Blog
     serializer_class = BlogSerializer
+    pagination_class = BlogCursorPagination
 
     def get_queryset(self):
         return self.model.objects.all()
+
+    def get_freshness(self):
+        queryset = self.model.objects.all()
+        if self.action == "retrieve":
+            queryset = queryset.filter(pk=self.kwargs["pk"])
+
+        return queryset.freshness()
+
+    @action(detail=True, methods=["get"])
+    def export(self, request, pk=None):
+        """
+        Stream all articles from a blog as NDJSON or CSV, without pagination.
+        """
+        blog = self.get_object()
+
+        return self.export_response(
+            blog.article_set.visible_to(request.user),
+            "blog-{}-articles".format(blog.id),
+            blog=blog.id,
+        )
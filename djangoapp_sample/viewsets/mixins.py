@@ -1,10 +1,28 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import permissions
+from rest_framework.renderers import JSONRenderer
+
+from ..bulk.exporter import CONTENT_TYPES, export_lines, filter_articles
+from ..parsers import get_fast_parser_classes
+from ..renderers import (
+    CSVStreamRenderer, NDJSONStreamRenderer, ORJSONRenderer,
+    get_fast_renderer_classes,
+)
+from ..serializers import ArticleExportFilterSerializer, plan_queryset
+from ..utils.conditional import (
+    build_validators, conditional_response, set_validators,
+)
+
 
 class ConditionalResumedSerializerMixin(object):
     """
     Overrides get_serializer_class to use a resumed Serializer in list.
 
     Set ``resumed_serializer_class`` attribute on your viewset to enable this behavior
-    else the default serializer from ``serializer_class`` is always used.
+    else the default serializer from ``serializer_class`` is always used. Actions
+    which use the resumed serializer can be changed with attribute
+    ``resumed_actions``, default to the ``list`` action only.
 
     This won't work with classes which does not set attribute ``action`` like
     ``APIView``.
@@ -12,7 +30,173 @@ class ConditionalResumedSerializerMixin(object):
     The goal of this behavior is to have lighter payload on lists which does not need
     to return everything from an object.
     """
+    resumed_actions = ["list"]
+
     def get_serializer_class(self):
-        if self.action == "list":
+        if self.action in self.resumed_actions:
             return self.resumed_serializer_class
         return super().get_serializer_class()
+
+
+class SerializerQueryPlanMixin(object):
+    """
+    Plan the queryset of read actions from the fields of the action serializer.
+
+    Related objects serialized by nested serializers are selected or prefetched,
+    serializer annotations are applied and only the fields to serialize are
+    loaded, so list and detail actions run a constant number of queries whatever
+    the page size. See ``djangoapp_sample.serializers.planning``.
+
+    Planning is done in ``filter_queryset()`` so viewsets keep defining their
+    ``get_queryset()``, custom actions must filter their queryset to get it planned.
+    Writing actions are not planned since they save the whole object.
+    """
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        if self.request.method in permissions.SAFE_METHODS:
+            return plan_queryset(queryset, self.get_serializer())
+
+        return queryset
+
+
+class FastRenderersMixin(object):
+    """
+    Use the fast renderers and parsers whose library is installed when setting
+    ``API_FAST_RENDERERS_ENABLED`` is enabled.
+
+    The default JSON renderer is replaced by ``ORJSONRenderer`` at the same
+    position so JSON stays the default format, other fast renderers and parsers
+    are added after the default ones and are selected with content negotiation.
+    """
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if not settings.API_FAST_RENDERERS_ENABLED:
+            return renderers
+
+        classes = get_fast_renderer_classes()
+        if ORJSONRenderer in classes:
+            classes.remove(ORJSONRenderer)
+            renderers = [
+                ORJSONRenderer() if type(renderer) is JSONRenderer else renderer
+                for renderer in renderers
+            ]
+
+        return renderers + [klass() for klass in classes]
+
+    def get_parsers(self):
+        parsers = super().get_parsers()
+        if not settings.API_FAST_RENDERERS_ENABLED:
+            return parsers
+
+        return parsers + [klass() for klass in get_fast_parser_classes()]
+
+
+class ArticleExportMixin(object):
+    """
+    Provide the streamed article export response for an ``export`` action.
+
+    Export format is negotiated like any other DRF response, either from the
+    ``Accept`` header or the ``format`` query argument, with ``ndjson`` and
+    ``csv`` as choices. Default renderer (JSON) leads to NDJSON.
+
+    Articles can be filtered with query arguments ``blog``, ``publish_after`` and
+    ``publish_before``.
+    """
+    export_renderer_classes = [NDJSONStreamRenderer, CSVStreamRenderer]
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+
+        if self.action == "export":
+            renderers += [klass() for klass in self.export_renderer_classes]
+
+        return renderers
+
+    def export_response(self, queryset, filename, **filters):
+        """
+        Build the streaming response for an article export.
+
+        Arguments:
+            queryset (QuerySet): Article queryset to export.
+            filename (string): Filename without extension for the attachment.
+
+        Keyword Arguments:
+            **filters: Enforced filter values which override the query arguments.
+
+        Returns:
+            django.http.StreamingHttpResponse: The export response.
+        """
+        serializer = ArticleExportFilterSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        options = dict(serializer.validated_data, **filters)
+
+        format = self.request.accepted_renderer.format
+        if format not in CONTENT_TYPES:
+            format = "ndjson"
+
+        response = StreamingHttpResponse(
+            export_lines(filter_articles(queryset, **options), format),
+            content_type="{}; charset=utf-8".format(CONTENT_TYPES[format]),
+        )
+        response["Content-Disposition"] = 'attachment; filename="{}.{}"'.format(
+            filename, format
+        )
+
+        return response
+
+
+class ConditionalViewSetMixin(object):
+    """
+    Emit ``ETag`` and ``Last-Modified`` validators on ``list`` and ``retrieve``
+    actions and answer conditional requests with a ``304 Not Modified`` response
+    without any serialization when the content has not changed.
+
+    Viewsets must implement ``get_freshness()`` which returns aggregated values
+    that change whenever the action content changes. Validators are checked after
+    authentication and permissions.
+    """
+    def get_freshness(self):
+        raise NotImplementedError(
+            "Viewsets using ConditionalViewSetMixin must implement "
+            "get_freshness()."
+        )
+
+    def get_validators(self):
+        try:
+            freshness = self.get_freshness()
+        except (TypeError, ValueError):
+            # Invalid lookup value, the action will respond with a 404
+            return None, None
+
+        if not freshness or not any(freshness.values()):
+            return None, None
+
+        return build_validators(
+            freshness,
+            self.action,
+            self.request.get_full_path(),
+            self.request.accepted_media_type,
+            self.request.user.pk,
+        )
+
+    def conditional(self, handler, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        response = conditional_response(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, last_modified)
+
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
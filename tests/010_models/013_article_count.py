@@ -0,0 +1,136 @@
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article, Blog
+
+
+def get_counts(*blogs):
+    """
+    Return the stored article counter of given blogs, fresh from database.
+    """
+    return [Blog.objects.get(pk=blog.pk).article_count for blog in blogs]
+
+
+def test_counter_create_and_delete(db):
+    """
+    Counter should follow article creation and deletion.
+    """
+    blog = BlogFactory()
+    article = ArticleFactory(blog=blog)
+    ArticleFactory(blog=blog)
+
+    assert blog.article_count == 2
+    assert get_counts(blog) == [2]
+
+    article.delete()
+    assert get_counts(blog) == [1]
+
+
+def test_counter_reassignment(db):
+    """
+    Moving an article to another blog should update both counters, saving
+    without changing blog should not change anything.
+    """
+    foo = BlogFactory()
+    bar = BlogFactory()
+    article = ArticleFactory(blog=foo)
+
+    article.title = "Changed"
+    article.save()
+    assert get_counts(foo, bar) == [1, 0]
+
+    article.blog = bar
+    article.save()
+    assert get_counts(foo, bar) == [0, 1]
+
+    # Blog id is deferred from loading but reassignment is still detected
+    article = Article.objects.only("title").get(pk=article.pk)
+    article.blog = foo
+    article.save()
+    assert get_counts(foo, bar) == [1, 0]
+
+
+def test_counter_bulk_operations(db):
+    """
+    Bulk operations which do not trigger signals should maintain counters too.
+    """
+    foo = BlogFactory()
+    bar = BlogFactory()
+
+    articles = Article.objects.bulk_create(
+        [Article(blog=foo, title="foo-{}".format(i)) for i in range(3)]
+        + [Article(blog=bar, title="bar-{}".format(i)) for i in range(2)]
+    )
+    assert get_counts(foo, bar) == [3, 2]
+
+    Article.objects.filter(blog=bar).update(blog=foo)
+    assert get_counts(foo, bar) == [5, 0]
+
+    articles[0].blog = bar
+    articles[1].blog = bar
+    Article.objects.bulk_update(articles[:2], ["blog"])
+    assert get_counts(foo, bar) == [3, 2]
+
+    Article.objects.filter(title__startswith="foo-").delete()
+    assert get_counts(foo, bar) == [2, 0]
+
+
+def test_counter_cascade(db):
+    """
+    Deleting a blog cascades on its articles without disturbing other blogs.
+    """
+    foo = BlogFactory()
+    bar = BlogFactory()
+    ArticleFactory.create_batch(2, blog=foo)
+    ArticleFactory(blog=bar)
+
+    foo.delete()
+
+    assert Article.objects.count() == 1
+    assert get_counts(bar) == [1]
+
+
+def test_recount_articles(db):
+    """
+    Recount should only fix the drifted counters.
+    """
+    foo = BlogFactory()
+    bar = BlogFactory()
+    ArticleFactory.create_batch(2, blog=foo)
+    ArticleFactory(blog=bar)
+
+    Blog.objects.filter(pk=foo.pk).update(article_count=42)
+
+    assert Blog.objects.all().recount_articles() == 1
+    assert get_counts(foo, bar) == [2, 1]
+
+
+def test_counter_stale_blog_save(db):
+    """
+    Saving a blog instance loaded before article changes should not reset the
+    counter.
+    """
+    blog = BlogFactory()
+    stale = Blog.objects.get(pk=blog.pk)
+    ArticleFactory.create_batch(2, blog=blog)
+
+    stale.title = "Updated"
+    stale.save()
+
+    assert get_counts(blog) == [2]
+    assert Blog.objects.get(pk=blog.pk).title == "Updated"
+
+    # Counter is written when explicitly asked
+    stale.article_count = 5
+    stale.save(update_fields=["article_count"])
+    assert get_counts(blog) == [5]
+
+
+def test_counter_adjust_queries(db, django_assert_num_queries):
+    """
+    Counter changes should not query the blog ids they already know.
+    """
+    foo, bar = BlogFactory(), BlogFactory()
+
+    with django_assert_num_queries(1):
+        Blog.objects.adjust_article_count({foo.pk: 2, bar.pk: 2})
+
+    assert get_counts(foo, bar) == [2, 2]
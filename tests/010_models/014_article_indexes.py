@@ -0,0 +1,29 @@
+import pytest
+
+from django.db import connection
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article
+
+
+@pytest.mark.skipif(
+    connection.vendor != "sqlite",
+    reason="Query plan format is specific to SQLite",
+)
+@pytest.mark.parametrize("ordering, index", [
+    (["-publish_start", "title"], "article_blog_pub_title_idx"),
+    (["-publish_start", "id"], "article_blog_pub_id_idx"),
+])
+def test_blog_article_list_use_index(db, ordering, index):
+    """
+    Blog article lists should be served from a composite index without sorting
+    rows.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(3, blog=blog)
+
+    queryset = Article.objects.filter(blog=blog).order_by(*ordering)
+    plan = queryset.explain()
+
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,46 @@
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article
+
+
+def test_for_listing(db, django_assert_num_queries):
+    """
+    Listing projection should not load contents nor the related blog.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(3, blog=blog)
+
+    with django_assert_num_queries(1):
+        articles = list(Article.objects.for_listing())
+        for article in articles:
+            article.title
+            article.publish_start
+            article.get_absolute_url()
+
+    assert articles[0].get_deferred_fields() == {"content", "publish_end", "updated_at"}
+
+
+def test_for_feed(db, django_assert_num_queries):
+    """
+    Feed projection should load the blog resume in the same query without
+    contents.
+    """
+    ArticleFactory.create_batch(3)
+
+    with django_assert_num_queries(1):
+        articles = list(Article.objects.for_feed())
+        titles = [article.blog.title for article in articles]
+
+    assert len(titles) == 3
+    assert articles[0].get_deferred_fields() == {"content", "publish_end"}
+
+
+def test_for_detail(db, django_assert_num_queries):
+    """
+    Detail projection should load everything in a single query.
+    """
+    article = ArticleFactory()
+
+    with django_assert_num_queries(1):
+        loaded = Article.objects.for_detail().get(pk=article.pk)
+        assert loaded.content == article.content
+        assert loaded.blog.title == article.blog.title
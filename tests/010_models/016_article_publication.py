@@ -0,0 +1,74 @@
+import datetime
+
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+import pytest
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.models import Article
+
+
+def test_published(db):
+    """
+    Only articles with a started and not ended publication should be published.
+    """
+    now = timezone.now()
+    hour = datetime.timedelta(hours=1)
+
+    ArticleFactory(title="Scheduled", publish_start=now + hour)
+    ArticleFactory(title="Ended", publish_start=now - hour, publish_end=now)
+    ArticleFactory(title="Forever", publish_start=now - hour)
+    ArticleFactory(title="Ending", publish_start=now - hour, publish_end=now + hour)
+
+    assert sorted(Article.objects.published(now=now).values_list(
+        "title", flat=True
+    )) == ["Ending", "Forever"]
+    assert sorted(Article.objects.published(now=now + 2 * hour).values_list(
+        "title", flat=True
+    )) == ["Forever", "Scheduled"]
+    assert Article.objects.get(title="Ending").is_published(now=now) is True
+    assert Article.objects.get(title="Ended").is_published(now=now) is False
+
+    # Editors see everything
+    assert Article.objects.visible_to(
+        UserFactory(flag_is_superuser=True), now=now
+    ).count() == 4
+    assert Article.objects.visible_to(UserFactory(), now=now).count() == 2
+
+
+def test_next_visibility_change(db):
+    """
+    Next visibility change should be the closest upcoming publication start or end.
+    """
+    now = timezone.now()
+    hour = datetime.timedelta(hours=1)
+    blog = BlogFactory()
+
+    assert blog.article_set.next_visibility_change(now=now) is None
+
+    ArticleFactory(blog=blog, publish_start=now - hour)
+    ArticleFactory(blog=blog, publish_start=now + 3 * hour)
+    assert blog.article_set.next_visibility_change(now=now) == now + 3 * hour
+
+    ArticleFactory(blog=blog, publish_start=now - hour, publish_end=now + 2 * hour)
+    assert blog.article_set.next_visibility_change(now=now) == now + 2 * hour
+
+    # Other blogs are not involved
+    ArticleFactory(publish_start=now + datetime.timedelta(minutes=5))
+    assert blog.article_set.next_visibility_change(now=now) == now + 2 * hour
+
+
+def test_publication_end_validation(db):
+    """
+    Publication end before its start should be invalid.
+    """
+    now = timezone.now()
+    article = ArticleFactory.build(
+        blog=BlogFactory(), publish_start=now, publish_end=now,
+    )
+
+    with pytest.raises(ValidationError) as excinfo:
+        article.full_clean()
+
+    assert "publish_end" in excinfo.value.message_dict
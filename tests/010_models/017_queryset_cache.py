@@ -0,0 +1,111 @@
+from django.db import transaction
+
+from djangoapp_sample.factories import (
+    ArticleFactory, BlogFactory, BlogPluginModelFactory,
+)
+from djangoapp_sample.models import Article, Blog, BlogPluginModel
+
+
+def titles(queryset):
+    return list(queryset.values_list("title", flat=True))
+
+
+def test_queryset_cache(transactional_db, locmem_cache, rename_silently,
+                        django_assert_num_queries):
+    """
+    Cached queryset results should be reused for identical queries only.
+    """
+    blog = BlogFactory(title="Foo")
+    other = BlogFactory(title="Bar")
+
+    def lookups():
+        assert list(Blog.objects.cache().filter(pk=blog.pk)) == [blog]
+        assert list(Blog.objects.cache().filter(pk=blog.pk)) == [blog]
+        assert Blog.objects.cache().get(pk=blog.pk) == blog
+        assert Blog.objects.cache().filter(pk=other.pk).first() == other
+
+    # Each distinct SQL is cached apart
+    with django_assert_num_queries(3):
+        lookups()
+    with django_assert_num_queries(0):
+        lookups()
+
+    # Results keep their kind from values and values_list
+    assert titles(Blog.objects.cache()) == ["Bar", "Foo"]
+    assert list(Blog.objects.cache().values("title")) == [
+        {"title": "Bar"}, {"title": "Foo"},
+    ]
+
+    # Not cached querysets always query
+    rename_silently(Blog, blog.pk, "Silent")
+    assert titles(Blog.objects.cache()) == ["Bar", "Foo"]
+    assert titles(Blog.objects.all()) == ["Bar", "Silent"]
+
+    # Empty results are cached too, empty queries are not
+    with django_assert_num_queries(1):
+        assert list(Article.objects.cache().filter(title="Nope")) == []
+        assert list(Article.objects.cache().filter(title="Nope")) == []
+        assert list(Article.objects.cache().filter(pk__in=[])) == []
+
+
+def test_queryset_cache_invalidation(transactional_db, locmem_cache, rename_silently):
+    """
+    Cached results should be invalidated by any write to the tables they read,
+    including bulk operations.
+    """
+    blog = BlogFactory(title="Foo")
+    article = ArticleFactory(blog=blog, title="First")
+
+    articles = Article.objects.cache().filter(blog__title="Foo")
+    assert titles(articles) == ["First"]
+
+    # A write to a joined table invalidates
+    rename_silently(Article, article.pk, "Silent")
+    assert titles(articles) == ["First"]
+    Blog.objects.filter(pk=blog.pk).update(title="Foo")
+    assert titles(articles) == ["Silent"]
+
+    ArticleFactory(blog=blog, title="Second")
+    assert titles(articles.order_by("title")) == ["Second", "Silent"]
+
+    Article.objects.filter(pk=article.pk).update(title="Updated")
+    assert titles(articles.order_by("title")) == ["Second", "Updated"]
+
+    Article.objects.bulk_create([Article(blog=blog, title="Bulk")])
+    assert titles(articles.order_by("title")) == ["Bulk", "Second", "Updated"]
+
+    Article.objects.filter(title="Bulk").delete()
+    assert titles(articles.order_by("title")) == ["Second", "Updated"]
+
+    blog.delete()
+    assert titles(articles) == []
+
+
+def test_queryset_cache_plugin_invalidation(transactional_db, locmem_cache):
+    """
+    Cached results should be invalidated by bulk updates of blog plugins.
+    """
+    plugin = BlogPluginModelFactory(limit=2)
+
+    limits = BlogPluginModel.objects.cache().values_list("limit", flat=True)
+    assert list(limits) == [2]
+
+    BlogPluginModel.objects.filter(pk=plugin.pk).update(limit=5)
+    assert list(limits.all()) == [5]
+
+    BlogPluginModel.objects.filter(pk=plugin.pk).delete()
+    assert list(limits.all()) == []
+
+
+def test_queryset_cache_transaction(transactional_db, locmem_cache, rename_silently):
+    """
+    Results should not be cached inside a transaction.
+    """
+    blog = BlogFactory(title="Foo")
+
+    with transaction.atomic():
+        assert titles(Blog.objects.cache()) == ["Foo"]
+        rename_silently(Blog, blog.pk, "Silent")
+        assert titles(Blog.objects.cache()) == ["Silent"]
+
+    assert titles(Blog.objects.cache()) == ["Silent"]
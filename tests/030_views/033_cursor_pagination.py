@@ -0,0 +1,99 @@
+import datetime
+from urllib.parse import urljoin
+
+import pytest
+
+from djangoapp_sample.compat.import_zoneinfo import ZoneInfo
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.utils.tests import html_pyquery
+
+
+def browse(client, url, selector):
+    """
+    Follow every 'next' links from given URL then every 'previous' links from the
+    last page.
+
+    Returns:
+        tuple: List of item texts for each page forward then backward.
+    """
+    base_url = url
+
+    forward = []
+    while url:
+        dom = html_pyquery(client.get(url))
+        forward.append([item.text for item in dom.find(selector)])
+        link = dom.find(".pagination-cursor a.next")
+        url = urljoin(base_url, link.attr("href")) if link else None
+
+    backward = []
+    link = dom.find(".pagination-cursor a.previous")
+    url = urljoin(base_url, link.attr("href")) if link else None
+    while url:
+        dom = html_pyquery(client.get(url))
+        backward.append([item.text for item in dom.find(selector)])
+        link = dom.find(".pagination-cursor a.previous")
+        url = urljoin(base_url, link.attr("href")) if link else None
+
+    return forward, backward
+
+
+def test_blog_index_cursor(settings, db, client):
+    """
+    Blog index should be browsable forward and backward with cursor links.
+    """
+    settings.LISTING_PAGINATION_MODE = "cursor"
+
+    for i in range(settings.BLOG_PAGINATION * 2 + 1):
+        BlogFactory(title="blog-{:02d}".format(i))
+
+    forward, backward = browse(client, "/djangoapp_sample/", ".blog-list li a")
+
+    assert [len(page) for page in forward] == [
+        settings.BLOG_PAGINATION, settings.BLOG_PAGINATION, 1
+    ]
+    assert forward[0][0] == "blog-00"
+    assert forward[2] == ["blog-{:02d}".format(settings.BLOG_PAGINATION * 2)]
+    assert backward == [forward[1], forward[0]]
+
+
+def test_blog_detail_cursor_ties(settings, db, client):
+    """
+    Articles sharing the same publication date should never be skipped or
+    duplicated across pages.
+    """
+    settings.LISTING_PAGINATION_MODE = "cursor"
+    default_tz = ZoneInfo(settings.TIME_ZONE)
+    same_date = datetime.datetime(2012, 10, 15, 12, 00).replace(tzinfo=default_tz)
+
+    blog = BlogFactory()
+    articles = ArticleFactory.create_batch(
+        settings.ARTICLE_PAGINATION * 2,
+        blog=blog,
+        publish_start=same_date,
+    )
+    latest = ArticleFactory(
+        blog=blog,
+        publish_start=same_date + datetime.timedelta(days=1),
+    )
+
+    url = "/djangoapp_sample/{}/".format(blog.id)
+    forward, backward = browse(client, url, ".article-list li a")
+
+    expected = [latest.title] + [item.title for item in articles]
+    assert [title for page in forward for title in page] == expected
+    assert backward == list(reversed(forward[:-1]))
+
+
+@pytest.mark.parametrize("cursor", ["foo", "eyJ2IjpbXSwiciI6ZmFsc2V9"])
+def test_invalid_cursor(settings, db, client, cursor):
+    """
+    An invalid cursor should return a 404 response.
+    """
+    settings.LISTING_PAGINATION_MODE = "cursor"
+
+    response = client.get(
+        "/djangoapp_sample/?cursor={}".format(cursor),
+        follow=True
+    )
+
+    assert response.status_code == 404
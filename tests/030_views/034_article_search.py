@@ -0,0 +1,69 @@
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article
+from djangoapp_sample.search import search_articles
+from djangoapp_sample.utils.tests import html_pyquery
+
+
+def test_search_ranking(db):
+    """
+    Search should match on title and content with title matches ranked first.
+    """
+    blog = BlogFactory()
+    in_content = ArticleFactory(
+        blog=blog, title="Ping", content="About a yellow submarine"
+    )
+    in_title = ArticleFactory(blog=blog, title="Yellow submarine", content="Pong")
+    ArticleFactory(blog=blog, title="Nope", content="Nothing to see")
+
+    results = list(search_articles(Article.objects.all(), "yellow submarine"))
+
+    assert results == [in_title, in_content]
+    assert results[0].search_rank > results[1].search_rank
+
+
+def test_search_index_sync(db):
+    """
+    Index should follow article updates and deletions, including bulk ones.
+    """
+    article = ArticleFactory(title="Foo", content="Lorem")
+
+    assert list(search_articles(Article.objects.all(), "foo")) == [article]
+
+    Article.objects.filter(pk=article.pk).update(title="Bar")
+    assert list(search_articles(Article.objects.all(), "foo")) == []
+    assert list(search_articles(Article.objects.all(), "bar")) == [article]
+
+    Article.objects.all().delete()
+    assert list(search_articles(Article.objects.all(), "bar")) == []
+
+
+def test_search_query_syntax(db):
+    """
+    User input should never be interpreted as search engine syntax.
+    """
+    ArticleFactory(title="Foo", content="Lorem")
+
+    assert list(search_articles(Article.objects.all(), '" OR foo*')) == []
+    assert list(search_articles(Article.objects.all(), "   ")) == []
+
+
+def test_search_view(settings, db, client):
+    """
+    HTML view should list matching articles with pagination keeping the query.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(
+        settings.ARTICLE_PAGINATION + 1, blog=blog, title="Lorem ipsum"
+    )
+    ArticleFactory(blog=blog, title="Nope")
+
+    response = client.get("/djangoapp_sample/search/", {"q": "lorem"})
+    assert response.status_code == 200
+
+    dom = html_pyquery(response)
+    assert len(dom.find(".article-list li a")) == settings.ARTICLE_PAGINATION
+    assert dom.find(".pagination a").eq(1).attr("href") == "?q=lorem&page=2"
+
+    response = client.get("/djangoapp_sample/search/", {"q": "lorem", "page": 2})
+    dom = html_pyquery(response)
+    assert len(dom.find(".article-list li a")) == 1
@@ -0,0 +1,127 @@
+import datetime
+
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_max_age, patch_cache_control
+
+from rest_framework.test import APIClient
+
+from djangoapp_sample.cms_plugins import BlogPlugin
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.models import Article, BlogPluginModel
+from djangoapp_sample.utils.tests import html_pyquery
+from djangoapp_sample.views.mixins import PublicationExpiryMixin, seconds_until
+
+
+class MaxAgeView:
+    def render_to_response(self, context, **response_kwargs):
+        response = HttpResponse()
+        patch_cache_control(response, max_age=3600)
+
+        return response
+
+
+class ExpiryView(PublicationExpiryMixin, MaxAgeView):
+    def get_visibility_queryset(self):
+        return Article.objects.all()
+
+
+def test_seconds_until():
+    """
+    Remaining seconds should be rounded up and never negative.
+    """
+    now = timezone.now()
+
+    assert seconds_until(now + datetime.timedelta(seconds=2.5), now=now) == 3
+    assert seconds_until(now + datetime.timedelta(seconds=2), now=now) == 2
+    assert seconds_until(now - datetime.timedelta(seconds=2), now=now) == 0
+
+
+def test_publication_expiry_mixin(db):
+    """
+    Response max age should be capped to the next visibility change.
+    """
+    assert get_max_age(ExpiryView().render_to_response({})) == 3600
+
+    ArticleFactory(publish_start=timezone.now() + datetime.timedelta(minutes=10))
+    max_age = get_max_age(ExpiryView().render_to_response({}))
+    assert 590 <= max_age <= 600
+
+
+def test_blog_detail_scheduled_articles(db, client):
+    """
+    Blog detail should only list published articles except for editors.
+    """
+    now = timezone.now()
+    blog = BlogFactory()
+    ArticleFactory(blog=blog, title="Live", publish_start=now)
+    scheduled = ArticleFactory(
+        blog=blog, title="Scheduled",
+        publish_start=now + datetime.timedelta(hours=1),
+    )
+    ArticleFactory(
+        blog=blog, title="Ended",
+        publish_start=now - datetime.timedelta(hours=2),
+        publish_end=now - datetime.timedelta(hours=1),
+    )
+
+    response = client.get(blog.get_absolute_url())
+    titles = [item.text for item in html_pyquery(response).find(".article-list li a")]
+    assert titles == ["Live"]
+
+    response = client.get(scheduled.get_absolute_url(), follow=True)
+    assert response.status_code == 404
+
+    client.force_login(UserFactory(flag_is_superuser=True))
+    response = client.get(blog.get_absolute_url())
+    titles = [item.text for item in html_pyquery(response).find(".article-list li a")]
+    assert titles == ["Scheduled", "Live", "Ended"]
+
+    response = client.get(scheduled.get_absolute_url())
+    assert response.status_code == 200
+
+
+def test_api_scheduled_articles(db):
+    """
+    API should only return published articles except for editors.
+    """
+    live = ArticleFactory()
+    scheduled = ArticleFactory(
+        publish_start=timezone.now() + datetime.timedelta(hours=1),
+    )
+
+    client = APIClient()
+    response = client.get("/djangoapp_sample/api/articles/")
+    assert [item["id"] for item in response.json()["results"]] == [live.id]
+
+    response = client.get(
+        "/djangoapp_sample/api/articles/{}/".format(scheduled.id), follow=True,
+    )
+    assert response.status_code == 404
+
+    client.force_authenticate(user=UserFactory(flag_is_superuser=True))
+    response = client.get("/djangoapp_sample/api/articles/")
+    assert [item["id"] for item in response.json()["results"]] == [
+        scheduled.id, live.id
+    ]
+
+
+def test_plugin_scheduled_articles(db):
+    """
+    Plugin should only list published articles and expire at the next change.
+    """
+    now = timezone.now()
+    blog = BlogFactory()
+    ArticleFactory(blog=blog, title="Live", publish_start=now)
+    scheduled = ArticleFactory(
+        blog=blog, publish_start=now + datetime.timedelta(hours=1),
+    )
+
+    plugin = BlogPlugin()
+    instance = BlogPluginModel(blog=blog, limit=5)
+
+    context = plugin.render({}, instance, None)
+    assert [item.title for item in context["articles"]] == ["Live"]
+    assert plugin.get_cache_expiration(None, instance, None) == (
+        scheduled.publish_start
+    )
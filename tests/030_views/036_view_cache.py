@@ -0,0 +1,133 @@
+import datetime
+
+from django.utils import timezone
+from django.utils.cache import get_max_age, patch_cache_control, patch_vary_headers
+
+import pytest
+
+from djangoapp_sample.cache import blog_scope, get_cache, get_metrics, get_versions
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.models import Article, Blog
+from djangoapp_sample.utils.tests import html_pyquery
+from djangoapp_sample.views import BlogDetailView
+
+
+view_cache = pytest.mark.parametrize(
+    "locmem_cache", [{"VIEW_CACHE_ENABLED": True}], indirect=True
+)
+
+
+def get_title(client, url, selector):
+    return html_pyquery(client.get(url)).find(selector)[0].text
+
+
+@view_cache
+def test_article_detail_cache(transactional_db, client, locmem_cache,
+                              rename_silently):
+    """
+    Article detail should be served from cache until its blog content changes.
+    """
+    article = ArticleFactory(title="Original")
+    other = ArticleFactory()
+    url = article.get_absolute_url()
+
+    assert get_title(client, url, ".article-detail .title") == "Original"
+
+    rename_silently(Article, article.pk, "Silent")
+    assert get_title(client, url, ".article-detail .title") == "Original"
+
+    # Change from another blog does not invalidate
+    other.title = "Other"
+    other.save()
+    assert get_title(client, url, ".article-detail .title") == "Original"
+
+    # Any saved article from the same blog invalidate
+    ArticleFactory(blog=article.blog)
+    assert get_title(client, url, ".article-detail .title") == "Silent"
+
+    # Authenticated users are never served from cache
+    rename_silently(Article, article.pk, "Fresh")
+    client.force_login(UserFactory())
+    assert get_title(client, url, ".article-detail .title") == "Fresh"
+
+
+@view_cache
+def test_blog_views_cache_bulk_invalidation(transactional_db, client, locmem_cache,
+                                            rename_silently):
+    """
+    Blog views should be invalidated by queryset operations without signals.
+    """
+    blog = BlogFactory(title="Original")
+    ArticleFactory(blog=blog, title="First")
+    url = blog.get_absolute_url()
+
+    assert get_title(client, url, ".blog-detail h2") == "Original"
+    assert get_title(client, "/djangoapp_sample/", ".blog-list li a") == "Original"
+
+    rename_silently(Blog, blog.pk, "Silent")
+    assert get_title(client, url, ".blog-detail h2") == "Original"
+
+    version = get_versions([blog_scope(blog.pk)])
+    Article.objects.filter(blog=blog).update(title="Updated")
+    assert get_versions([blog_scope(blog.pk)]) != version
+    assert get_title(client, url, ".blog-detail h2") == "Silent"
+    assert get_title(client, "/djangoapp_sample/", ".blog-list li a") == "Silent"
+
+    rename_silently(Blog, blog.pk, "Deleted")
+    Article.objects.filter(blog=blog).delete()
+    assert get_title(client, url, ".blog-detail h2") == "Deleted"
+
+
+@view_cache
+def test_view_cache_timeout_publication(transactional_db, client, settings,
+                                        locmem_cache, monkeypatch):
+    """
+    Cache timeout should not go beyond the next article publication.
+    """
+    blog = BlogFactory()
+    ArticleFactory(
+        blog=blog, publish_start=timezone.now() + datetime.timedelta(seconds=60),
+    )
+
+    timeouts = []
+    cache = get_cache()
+    original_set = cache.set
+
+    def spy_set(key, value, timeout=None, **kwargs):
+        if key.startswith("djangoapp_sample:view:"):
+            # Entries are kept after their expiration to be served stale
+            timeouts.append(timeout - settings.CONTENT_CACHE_STALE_TIMEOUT)
+        return original_set(key, value, timeout, **kwargs)
+
+    monkeypatch.setattr(cache, "set", spy_set)
+
+    client.get(blog.get_absolute_url())
+    client.get("/djangoapp_sample/")
+    assert 55 <= timeouts[0] <= 60
+    assert timeouts[1] == 300
+
+
+@view_cache
+def test_view_cache_headers(transactional_db, client, locmem_cache, monkeypatch):
+    """
+    Responses served from cache should have the headers set by the view.
+    """
+    blog = BlogFactory()
+    ArticleFactory(blog=blog)
+    original = BlogDetailView.get
+
+    def get(self, request, *args, **kwargs):
+        response = original(self, request, *args, **kwargs)
+        patch_cache_control(response, max_age=600)
+        patch_vary_headers(response, ["Cookie"])
+        return response
+
+    monkeypatch.setattr(BlogDetailView, "get", get)
+
+    missed = client.get(blog.get_absolute_url())
+    hit = client.get(blog.get_absolute_url())
+
+    assert get_metrics()["hit"] == 1
+    assert hit.headers == missed.headers
+    assert get_max_age(hit) == 600
+    assert "Cookie" in hit["Vary"]
@@ -0,0 +1,62 @@
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article
+
+
+def test_blog_detail_conditional_get(db, client):
+    """
+    Blog detail should answer 304 for an unchanged blog and a new ETag once its
+    articles changed.
+    """
+    blog = BlogFactory()
+    article = ArticleFactory(blog=blog)
+    url = blog.get_absolute_url()
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert response.content == b""
+
+    # Bulk update still changes the validators
+    Article.objects.filter(pk=article.pk).update(title="Changed")
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+    # A new article in another blog does not
+    etag = response["ETag"]
+    ArticleFactory()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # Removing an article does
+    Article.objects.filter(pk=article.pk).delete()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_article_detail_conditional_get(db, client):
+    """
+    Article detail should answer 304 for unchanged article and blog.
+    """
+    article = ArticleFactory()
+    url = article.get_absolute_url()
+
+    response = client.get(url)
+    etag = response["ETag"]
+
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+    assert response.status_code == 304
+
+    article.blog.title = "Renamed"
+    article.blog.save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    # Missing article is not affected
+    response = client.get(
+        "/djangoapp_sample/{}/9999/".format(article.blog_id), follow=True
+    )
+    assert response.status_code == 404
+    assert not response.has_header("ETag")
@@ -0,0 +1,128 @@
+import datetime
+
+from django.utils import timezone
+
+import pytest
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.models import Article
+from djangoapp_sample.pagination import CachedCountPaginator
+from djangoapp_sample.utils.tests import html_pyquery
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """
+    Record every count computed by paginators.
+    """
+    calls = []
+    original = CachedCountPaginator.compute_count
+
+    def spy(self):
+        result = original(self)
+        calls.append(result)
+        return result
+
+    monkeypatch.setattr(CachedCountPaginator, "compute_count", spy)
+
+    return calls
+
+
+def page_links(response):
+    return [
+        item.text
+        for item in html_pyquery(response).find(".pagination a")
+    ]
+
+
+def test_cached_count_blog_detail(db, client, settings, locmem_cache, counted,
+                                  django_capture_on_commit_callbacks):
+    """
+    Article count should be cached until an article is created or deleted, with a
+    distinct count for users seeing unpublished articles.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(settings.ARTICLE_PAGINATION, blog=blog)
+    ArticleFactory(
+        blog=blog, publish_start=timezone.now() + datetime.timedelta(days=1)
+    )
+    url = blog.get_absolute_url()
+
+    assert page_links(client.get(url)) == []
+    assert page_links(client.get(url + "?page=1")) == []
+    assert counted == [(settings.ARTICLE_PAGINATION, False)]
+
+    client.force_login(UserFactory(flag_is_superuser=True))
+    assert page_links(client.get(url)) == ["1", "2"]
+    assert counted[-1] == (settings.ARTICLE_PAGINATION + 1, False)
+    client.logout()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        created = ArticleFactory(blog=blog)
+    assert page_links(client.get(url)) == ["1", "2"]
+    assert len(counted) == 3
+
+    with django_capture_on_commit_callbacks(execute=True):
+        created.delete()
+    assert page_links(client.get(url)) == []
+    assert len(counted) == 4
+
+    # Another blog have its own count
+    other = BlogFactory()
+    client.get(other.get_absolute_url())
+    assert counted[-1] == (0, False)
+
+
+def test_cached_count_blog_index(db, client, settings, locmem_cache, counted):
+    """
+    Blog index count should be cached.
+    """
+    BlogFactory.create_batch(settings.BLOG_PAGINATION + 1)
+
+    assert page_links(client.get("/djangoapp_sample/")) == ["1", "2"]
+    assert page_links(client.get("/djangoapp_sample/?page=2")) == ["1", "2"]
+    assert counted == [(settings.BLOG_PAGINATION + 1, False)]
+
+
+def test_approximate_count(db, client, settings, monkeypatch):
+    """
+    Above the threshold, the estimated count should be used and pages only link to
+    their previous and next pages which are known from their rows.
+    """
+    settings.LISTING_APPROXIMATE_COUNT_THRESHOLD = 100
+    monkeypatch.setattr(CachedCountPaginator, "estimate_count", lambda self: 600)
+
+    blog = BlogFactory()
+    ArticleFactory.create_batch(settings.ARTICLE_PAGINATION + 1, blog=blog)
+    url = blog.get_absolute_url()
+
+    dom = html_pyquery(client.get(url))
+    assert dom.find(".pagination-approximate .current").text() == (
+        "Page 1 of about 100"
+    )
+    assert dom.find(".pagination a.previous").length == 0
+    assert dom.find(".pagination a.next").attr("href") == "?page=2"
+
+    dom = html_pyquery(client.get(url + "?page=2"))
+    assert len(dom.find(".article-list li a")) == 1
+    assert dom.find(".pagination a.previous").attr("href") == "?page=1"
+    assert dom.find(".pagination a.next").length == 0
+
+    assert client.get(url + "?page=3", follow=True).status_code == 404
+    assert client.get(url + "?page=0", follow=True).status_code == 404
+
+    # Under the threshold rows are counted
+    settings.LISTING_APPROXIMATE_COUNT_THRESHOLD = 1000
+    dom = html_pyquery(client.get(url))
+    assert dom.find(".pagination-approximate").length == 0
+    assert page_links(client.get(url)) == ["1", "2"]
+
+
+def test_estimate_count_unsupported(db):
+    """
+    Row estimates are not supported on SQLite nor for lists.
+    """
+    assert CachedCountPaginator(
+        Article.objects.all(), 10, approximate_threshold=0
+    ).estimate_count() is None
+    assert CachedCountPaginator([1, 2, 3], 2).estimate_count() is None
@@ -0,0 +1,117 @@
+from django.http import Http404
+
+import pytest
+
+from djangoapp_sample.cache import get_blog, get_blog_or_404, get_cache
+from djangoapp_sample.cache.lookups import blog_lookup_key
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Blog
+from djangoapp_sample.serializers import ArticleSerializer
+
+
+def test_get_blog(db, locmem_cache, django_assert_num_queries,
+                  django_capture_on_commit_callbacks):
+    """
+    Blogs and missing blogs should be cached until a blog is saved or deleted.
+    """
+    blog = BlogFactory(title="Original")
+
+    with django_assert_num_queries(1):
+        assert get_blog(blog.id) == blog
+        assert get_blog(str(blog.id)).title == "Original"
+
+    with django_assert_num_queries(1):
+        assert get_blog(blog.id + 1) is None
+        assert get_blog(blog.id + 1) is None
+        with pytest.raises(Http404):
+            get_blog_or_404(blog.id + 1)
+
+    with pytest.raises(ValueError):
+        get_blog("nope")
+    with pytest.raises(Http404):
+        get_blog_or_404("nope")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog.title = "Changed"
+        blog.save()
+        created = BlogFactory(id=blog.id + 1)
+    assert get_blog(blog.id).title == "Changed"
+    assert get_blog(created.id) == created
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Blog.objects.bulk_create([Blog(id=blog.id + 2, title="Bulk")])
+    assert get_blog(blog.id + 2).title == "Bulk"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog.delete()
+    assert get_blog(created.id - 1) is None
+
+
+def test_get_blog_disabled(db, settings, locmem_cache, django_assert_num_queries):
+    """
+    Without timeout, blogs are always queried.
+    """
+    settings.BLOG_LOOKUP_CACHE_TIMEOUT = 0
+    blog = BlogFactory()
+
+    with django_assert_num_queries(2):
+        get_blog(blog.id)
+        get_blog(blog.id)
+
+
+def test_blog_id_field(db, locmem_cache, django_assert_num_queries):
+    """
+    Article serializer should validate the blog from cache.
+    """
+    blog = BlogFactory()
+    get_blog(blog.id)
+
+    with django_assert_num_queries(0):
+        serializer = ArticleSerializer(data={"blog_id": blog.id, "title": "Foo"})
+        assert serializer.is_valid() is True
+        assert serializer.validated_data["blog"] == blog
+
+    serializer = ArticleSerializer(data={"blog_id": blog.id + 1, "title": "Foo"})
+    assert serializer.is_valid() is False
+    assert serializer.errors["blog_id"][0].code == "does_not_exist"
+
+    serializer = ArticleSerializer(data={"blog_id": "nope", "title": "Foo"})
+    assert serializer.is_valid() is False
+    assert serializer.errors["blog_id"][0].code == "incorrect_type"
+
+
+def test_blog_id_field_copy(db, settings, locmem_cache):
+    """
+    Validated blog should not be the instance kept by the local cache tier, saving
+    an article must not change the cached blog.
+    """
+    settings.LOCAL_CACHE_ENABLED = True
+    blog = BlogFactory()
+
+    for i in range(2):
+        serializer = ArticleSerializer(data={"blog_id": blog.id, "title": "Foo"})
+        assert serializer.is_valid() is True
+        serializer.save()
+
+    cached = get_cache().get(blog_lookup_key(blog.id))
+    assert cached is not serializer.validated_data["blog"]
+    assert cached.article_count == 0
+    assert get_blog(blog.id) is not get_blog(blog.id)
+
+
+def test_views_blog_lookup(db, client, locmem_cache):
+    """
+    Views should answer from the cached blog or a 404 for unknown blogs.
+    """
+    article = ArticleFactory()
+
+    for i in range(2):
+        assert client.get(article.blog.get_absolute_url()).status_code == 200
+        assert client.get(article.get_absolute_url()).status_code == 200
+        assert client.get(
+            "/djangoapp_sample/{}/".format(article.blog_id + 1), follow=True
+        ).status_code == 404
+        assert client.get(
+            "/djangoapp_sample/{}/{}/".format(article.blog_id + 1, article.id),
+            follow=True,
+        ).status_code == 404
@@ -0,0 +1,77 @@
+from django.test import RequestFactory
+from django.urls import reverse, set_script_prefix
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article
+from djangoapp_sample.serializers import ArticleResumeSerializer
+from djangoapp_sample.utils.urlbuilder import (
+    URLBuilder, article_detail_url, blog_detail_url, get_url_builder
+)
+
+
+def test_builder_reverse_parity():
+    """
+    Builders should return the same URLs than Django reverse.
+    """
+    assert blog_detail_url(42) == reverse(
+        "djangoapp_sample:blog-detail", args=[42]
+    )
+    assert article_detail_url(1, 42) == reverse(
+        "djangoapp_sample:article-detail", args=[1, 42]
+    )
+    assert get_url_builder("djangoapp_sample:api-article-detail")(7) == (
+        "/djangoapp_sample/api/articles/7/"
+    )
+
+
+def test_builder_script_prefix():
+    """
+    Templates should be cached per script prefix.
+    """
+    builder = URLBuilder("djangoapp_sample:blog-detail", 1)
+
+    try:
+        set_script_prefix("/mounted/")
+        assert builder(1) == "/mounted/djangoapp_sample/1/"
+    finally:
+        set_script_prefix("/")
+
+    assert builder(1) == "/djangoapp_sample/1/"
+
+
+def test_article_urls_no_queries(db, django_assert_num_queries):
+    """
+    Article URLs should be built without loading the related blog.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(3, blog=blog)
+
+    articles = list(Article.objects.all())
+
+    with django_assert_num_queries(0):
+        urls = [item.get_absolute_url() for item in articles]
+
+    assert urls == [
+        "/djangoapp_sample/{}/{}/".format(blog.id, item.id) for item in articles
+    ]
+
+
+def test_serializer_hyperlinks(db):
+    """
+    Serializer hyperlinks should be built from the URL builder and be absolute
+    when a request is given.
+    """
+    article = ArticleFactory()
+    request = RequestFactory().get("/")
+
+    data = ArticleResumeSerializer(article, context={"request": request}).data
+
+    assert data["url"] == "http://testserver/djangoapp_sample/api/articles/{}/".format(
+        article.id
+    )
+    assert data["blog"]["url"] == (
+        "http://testserver/djangoapp_sample/api/blogs/{}/".format(article.blog_id)
+    )
+    assert data["view_url"] == "http://testserver/djangoapp_sample/{}/{}/".format(
+        article.blog_id, article.id
+    )
@@ -0,0 +1,143 @@
+import pytest
+
+from djangoapp_sample.cache import bump_versions, get_cache
+from djangoapp_sample.cache.local import LocalCacheTier
+
+
+def build_tier(**kwargs):
+    options = {
+        "max_entries": 10,
+        "max_bytes": 10000,
+        "timeout": 60,
+        "sync_interval": 60,
+    }
+    options.update(kwargs)
+
+    return LocalCacheTier("default", **options)
+
+
+def test_local_cache_lru(locmem_cache):
+    """
+    Local entries should be bounded in number and size, least recently used are
+    evicted first while shared entries are kept.
+    """
+    tier = build_tier(max_entries=2)
+    tier.set("a", 1)
+    tier.set("b", 2)
+    assert tier.get("a") == 1
+    tier.set("c", 3)
+
+    assert list(tier._entries) == ["a", "c"]
+    assert tier.get_many(["a", "b", "c", "d"]) == {"a": 1, "b": 2, "c": 3}
+    assert list(tier._entries) == ["c", "b"]
+
+    tier = build_tier(max_bytes=300)
+    tier.set("big", "x" * 500)
+    assert len(tier) == 0
+    assert tier.get("big") == "x" * 500
+
+    tier.set("first", "x" * 200)
+    tier.set("second", "x" * 100)
+    assert len(tier) == 1
+    assert 0 < tier.size <= 300
+    tier.set("second", "x" * 20)
+    assert list(tier._entries) == ["second"]
+
+    tier.delete("second")
+    assert len(tier) == 0 and tier.size == 0
+    assert tier.get("second") is None
+
+
+def test_local_cache_served_locally(locmem_cache):
+    """
+    Local entries should be served without reaching the shared cache, until they
+    expire.
+    """
+    tier = build_tier()
+    tier.set("key", "local")
+    locmem_cache.set("key", "shared")
+    assert tier.get("key") == "local"
+
+    # Entries from a timeout of 0 expire immediately, like in Django caches
+    tier.set("key", "immediate", 0)
+    assert len(tier) == 0
+
+    tier = build_tier(timeout=0)
+    tier.set("key", "local")
+    locmem_cache.set("key", "shared")
+    assert tier.get("key") == "shared"
+
+
+def test_local_cache_copies(locmem_cache):
+    """
+    Local entries should be returned as copies so modifying a value does not
+    change the entry.
+    """
+    tier = build_tier()
+    value = {"items": [1]}
+    tier.set("key", value)
+    value["items"].append(2)
+
+    hit = tier.get("key")
+    assert hit == {"items": [1]}
+    hit["items"].append(3)
+    assert tier.get("key") == {"items": [1]}
+    assert tier.get_many(["key"])["key"] is not tier.get_many(["key"])["key"]
+
+    # Entries filled from the shared cache too
+    locmem_cache.set("shared", {"items": [1]})
+    tier.get("shared")["items"].append(2)
+    assert tier.get("shared") == {"items": [1]}
+
+
+@pytest.mark.parametrize("use_file", [False, True])
+def test_local_cache_generation(locmem_cache, tmp_path, use_file):
+    """
+    Invalidation from a process should clear local entries of other processes once
+    they check the generation.
+    """
+    generation_file = str(tmp_path / "generation") if use_file else None
+    first = build_tier(generation_file=generation_file)
+    second = build_tier(generation_file=generation_file)
+
+    first.set("key", "old")
+    assert second.get("key") == "old"
+
+    locmem_cache.set("key", "new")
+    first.broadcast_invalidation()
+    assert first.get("key") == "new"
+    assert len(first) == 1
+
+    # Not checked yet, the second process can still serve its entry
+    assert second.get("key") == "old"
+    second.sync(force=True)
+    assert second.get("key") == "new"
+
+    # Interval elapsed
+    second.sync_interval = 0
+    locmem_cache.set("key", "newer")
+    first.broadcast_invalidation()
+    assert second.get("key") == "newer"
+
+    if use_file:
+        assert locmem_cache.get("djangoapp_sample:local-generation") is None
+
+
+def test_local_cache_content_invalidation(db, settings, locmem_cache):
+    """
+    Content cache should use the local tier when enabled and broadcast
+    invalidations when content versions are bumped.
+    """
+    assert not isinstance(get_cache(), LocalCacheTier)
+
+    settings.LOCAL_CACHE_ENABLED = True
+    tier = get_cache()
+    assert isinstance(tier, LocalCacheTier)
+    assert get_cache() is tier
+
+    tier.set("key", "value")
+    generation = tier.read_generation()
+
+    bump_versions(["blog:1"])
+    assert tier.read_generation() != generation
+    assert list(tier._entries) == []
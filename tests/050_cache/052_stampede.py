@@ -0,0 +1,166 @@
+import threading
+import time
+
+from django.contrib import admin
+
+from djangoapp_sample.cache import get_cache, get_metrics, get_or_compute
+from djangoapp_sample.cache.local import LocalCacheTier
+from djangoapp_sample.cms_plugins import BlogPlugin
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import BlogPluginModel
+
+
+def run_concurrently(function, workers=8):
+    """
+    Run a function from many threads started at the same time.
+
+    Returns:
+        list: Function results.
+    """
+    barrier = threading.Barrier(workers)
+    results = [None] * workers
+
+    def target(index):
+        barrier.wait()
+        results[index] = function()
+
+    threads = [
+        threading.Thread(target=target, args=(index,)) for index in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def slow_compute(calls, value, timeout=60, duration=0.3):
+    def compute():
+        calls.append(value)
+        time.sleep(duration)
+        return value, timeout
+
+    return compute
+
+
+def metrics(**kwargs):
+    expected = dict.fromkeys(
+        ("hit", "early", "miss", "expired", "stale", "wait", "fallback"), 0
+    )
+    expected.update(kwargs)
+
+    return expected
+
+
+def test_single_flight_miss(locmem_cache):
+    """
+    Only a single thread should compute a missing entry, the other ones wait for
+    it.
+    """
+    calls = []
+    results = run_concurrently(
+        lambda: get_or_compute("key", slow_compute(calls, "value"))
+    )
+
+    assert results == ["value"] * 8
+    assert calls == ["value"]
+    assert get_metrics() == metrics(miss=1, wait=7)
+
+    assert get_or_compute("key", slow_compute(calls, "other")) == "value"
+    assert get_metrics()["hit"] == 1
+
+
+def test_stale_while_revalidate(settings, locmem_cache):
+    """
+    An expired entry should be served while a single thread recomputes it.
+    """
+    settings.CONTENT_CACHE_EARLY_BETA = 0
+    locmem_cache.set("key", ("old", time.time() - 1, 0.1), 60)
+
+    calls = []
+    results = run_concurrently(
+        lambda: get_or_compute("key", slow_compute(calls, "new"))
+    )
+
+    assert sorted(results) == ["new"] + ["old"] * 7
+    assert calls == ["new"]
+    assert get_metrics() == metrics(expired=1, stale=7)
+    assert get_or_compute("key", slow_compute(calls, "newer")) == "new"
+
+
+def test_early_expiration(settings, locmem_cache):
+    """
+    An entry may be recomputed before its expiration depending on beta factor.
+    """
+    calls = []
+    locmem_cache.set("key", ("old", time.time() + 10, 1.0), 60)
+
+    settings.CONTENT_CACHE_EARLY_BETA = 0
+    assert get_or_compute("key", slow_compute(calls, "new", duration=0)) == "old"
+
+    settings.CONTENT_CACHE_EARLY_BETA = 1000
+    assert get_or_compute("key", slow_compute(calls, "new", duration=0)) == "new"
+
+    assert calls == ["new"]
+    assert get_metrics() == metrics(hit=1, early=1)
+
+
+def test_not_cached_and_fallback(settings, locmem_cache):
+    """
+    Values with a timeout of 0 are not cached and a waiting thread computes the
+    value itself once the lock holder took too long.
+    """
+    calls = []
+    assert get_or_compute("key", slow_compute(calls, "a", 0, 0)) == "a"
+    assert get_or_compute("key", slow_compute(calls, "b", 0, 0)) == "b"
+    assert locmem_cache.get("key") is None
+    assert locmem_cache.get("key:lock") is None
+
+    settings.CONTENT_CACHE_LOCK_TIMEOUT = 0.1
+    locmem_cache.add("key:lock", "someone", 60)
+    assert get_or_compute("key", slow_compute(calls, "c", duration=0)) == "c"
+    assert locmem_cache.get("key")[0] == "c"
+
+    assert get_metrics() == metrics(miss=2, fallback=1)
+
+
+def test_local_tier_locks(settings, locmem_cache, monkeypatch):
+    """
+    With the local cache tier, locks should be taken and released in the shared
+    cache only.
+    """
+    settings.LOCAL_CACHE_ENABLED = True
+    tier = get_cache()
+    local_keys = []
+    original = LocalCacheTier._local_get
+
+    def spy(self, key):
+        local_keys.append(key)
+        return original(self, key)
+
+    monkeypatch.setattr(LocalCacheTier, "_local_get", spy)
+
+    assert get_or_compute("key", slow_compute([], "a", duration=0)) == "a"
+
+    assert tier.get("key")[0] == "a"
+    assert locmem_cache.get("key:lock") is None
+    assert "key:lock" not in local_keys
+
+
+def test_blog_plugin_articles(db, locmem_cache, django_assert_num_queries):
+    """
+    Plugin article lists should be cached with stampede protection.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(3, blog=blog)
+    plugin = BlogPlugin(BlogPluginModel, admin.site)
+    instance = BlogPluginModel(blog=blog, limit=2)
+
+    articles = plugin.get_articles(instance)
+    assert len(articles) == 2
+
+    with django_assert_num_queries(0):
+        assert plugin.get_articles(instance) == articles
+
+    assert get_metrics() == metrics(miss=1, hit=1)
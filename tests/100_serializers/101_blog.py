@@ -1,5 +1,6 @@
 from djangoapp_sample.factories import ArticleFactory, BlogFactory
 from djangoapp_sample.serializers import BlogSerializer
+from djangoapp_sample.utils.tests import drf_datetime
 
 
 def test_blog_serialize_single(db):
@@ -18,6 +19,7 @@ def test_blog_serialize_single(db):
         "view_url": "/djangoapp_sample/{}/".format(blog.id),
         "title": "Foo",
         "article_count": 0,
+        "updated_at": drf_datetime(blog.updated_at),
     }
 
     assert expected == serializer.data
@@ -44,6 +46,7 @@ def test_blog_serialize_many(db):
             "view_url": "/djangoapp_sample/{}/".format(foo.id),
             "title": "Foo",
             "article_count": 1,
+            "updated_at": drf_datetime(foo.updated_at),
         },
         {
             "id": bar.id,
@@ -51,6 +54,7 @@ def test_blog_serialize_many(db):
             "view_url": "/djangoapp_sample/{}/".format(bar.id),
             "title": "Bar",
             "article_count": 0,
+            "updated_at": drf_datetime(bar.updated_at),
         },
     ]
 
@@ -3,6 +3,7 @@ import datetime
 from djangoapp_sample.compat.import_zoneinfo import ZoneInfo
 from djangoapp_sample.factories import ArticleFactory, BlogFactory
 from djangoapp_sample.serializers import ArticleSerializer
+from djangoapp_sample.utils.tests import drf_datetime
 
 
 def test_article_serialize_single(db, settings):
@@ -40,6 +41,8 @@ def test_article_serialize_single(db, settings):
         "title": "Lorem",
         "content": "Ipsume salace nec vergiture",
         "publish_start": "2012-10-15T12:00:00-05:00",
+        "publish_end": None,
+        "updated_at": drf_datetime(lorem.updated_at),
     }
 
     assert expected == serializer.data
@@ -94,6 +97,8 @@ def test_article_serialize_many(db, settings):
             "title": "Lorem",
             "content": "Ipsume salace nec vergiture",
             "publish_start": "2012-10-15T12:00:00-05:00",
+            "publish_end": None,
+            "updated_at": drf_datetime(lorem.updated_at),
         },
         {
             "id": bonorum.id,
@@ -108,6 +113,8 @@ def test_article_serialize_many(db, settings):
             "title": "Bonorum",
             "content": "Sed ut perspiciatis unde",
             "publish_start": "2021-08-07T15:30:00-05:00",
+            "publish_end": None,
+            "updated_at": drf_datetime(bonorum.updated_at),
         },
     ]
 
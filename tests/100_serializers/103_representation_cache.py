@@ -0,0 +1,98 @@
+import pytest
+
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article
+from djangoapp_sample.serializers import ArticleSerializer
+from djangoapp_sample.serializers.mixins import CachedRepresentationMixin
+
+
+representation_cache = pytest.mark.parametrize(
+    "locmem_cache", [{"REPRESENTATION_CACHE_ENABLED": True}], indirect=True
+)
+
+
+@pytest.fixture
+def serialized(monkeypatch):
+    """
+    Record the primary keys of articles serialized without cache.
+    """
+    calls = []
+    original = CachedRepresentationMixin.to_uncached_representation
+
+    def spy(self, instance):
+        if isinstance(instance, Article):
+            calls.append(instance.pk)
+        return original(self, instance)
+
+    monkeypatch.setattr(CachedRepresentationMixin, "to_uncached_representation", spy)
+
+    return calls
+
+
+@representation_cache
+def test_representation_cache_detail(db, locmem_cache, serialized):
+    """
+    Detail representation should be cached per object version with URLs built for
+    the current request host.
+    """
+    article = ArticleFactory(title="Original")
+    url = "/djangoapp_sample/api/articles/{}/".format(article.id)
+    client = APIClient()
+
+    first = client.get(url).json()
+    assert client.get(url).json() == first
+    assert serialized == [article.id]
+
+    other = client.get(url, HTTP_HOST="example.com").json()
+    assert serialized == [article.id]
+    assert other["url"] == "http://example.com{}".format(url)
+    assert other["blog"]["view_url"] == (
+        "http://example.com/djangoapp_sample/{}/".format(article.blog_id)
+    )
+
+    # Object change leads to a new version
+    article.title = "Changed"
+    article.save()
+    assert client.get(url).json()["title"] == "Changed"
+    assert serialized == [article.id, article.id]
+
+    # Nested blog change too
+    article.blog.title = "Renamed"
+    article.blog.save()
+    assert client.get(url).json()["blog"]["title"] == "Renamed"
+
+
+@representation_cache
+def test_representation_cache_list(db, locmem_cache, serialized):
+    """
+    List representation should only serialize objects missing from cache.
+    """
+    blog = BlogFactory()
+    articles = ArticleFactory.create_batch(3, blog=blog)
+    client = APIClient()
+
+    first = client.get("/djangoapp_sample/api/articles/").json()
+    assert sorted(serialized) == sorted(item.id for item in articles)
+
+    del serialized[:]
+    assert client.get("/djangoapp_sample/api/articles/").json() == first
+    assert serialized == []
+
+    articles[0].title = "Changed"
+    articles[0].save()
+    response = client.get("/djangoapp_sample/api/articles/").json()
+    assert serialized == [articles[0].id]
+    assert "Changed" in [item["title"] for item in response["results"]]
+
+
+def test_representation_cache_disabled(db, serialized):
+    """
+    Without cache enabled, serializers always serialize.
+    """
+    article = ArticleFactory()
+
+    ArticleSerializer(article, context={"request": None}).data
+    ArticleSerializer(article, context={"request": None}).data
+    assert serialized == [article.id, article.id]
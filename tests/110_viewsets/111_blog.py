@@ -6,6 +6,7 @@ from djangoapp_sample.factories import BlogFactory, UserFactory
 from djangoapp_sample.models import Blog
 
 from djangoapp_sample.utils.tests import DRF_DUMMY_HOST_URL as HOSTURL
+from djangoapp_sample.utils.tests import drf_datetime
 
 
 def test_blog_viewset_list(db):
@@ -19,7 +20,7 @@ def test_blog_viewset_list(db):
     # Use test client to get blog list
     client = APIClient()
     response = client.get("/djangoapp_sample/api/blogs/", format="json")
-    json_data = response.json()
+    json_data = response.json()["results"]
 
     # Expected payload from JSON response
     expected = [
@@ -35,6 +36,7 @@ def test_blog_viewset_list(db):
             ),
             "title": "Bar",
             "article_count": 0,
+            "updated_at": drf_datetime(bar.updated_at),
         },
         {
             "id": foo.id,
@@ -48,6 +50,7 @@ def test_blog_viewset_list(db):
             ),
             "title": "Foo",
             "article_count": 0,
+            "updated_at": drf_datetime(foo.updated_at),
         },
     ]
 
@@ -83,6 +86,7 @@ def test_blog_viewset_detail(db):
         ),
         "title": "Foo",
         "article_count": 0,
+        "updated_at": drf_datetime(foo.updated_at),
     }
 
     assert response.status_code == 200
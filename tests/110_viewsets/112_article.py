@@ -11,6 +11,7 @@ from djangoapp_sample.factories import (
 from djangoapp_sample.models import Article
 
 from djangoapp_sample.utils.tests import DRF_DUMMY_HOST_URL as HOSTURL
+from djangoapp_sample.utils.tests import drf_datetime
 
 
 def test_article_viewset_list(db, settings):
@@ -38,7 +39,7 @@ def test_article_viewset_list(db, settings):
     # Use test client to get article list
     client = APIClient()
     response = client.get("/djangoapp_sample/api/articles/", format="json")
-    json_data = response.json()
+    json_data = response.json()["results"]
 
     # Expected payload from JSON response
     expected = [
@@ -148,6 +149,8 @@ def test_article_viewset_detail(db, settings):
             "title": lorem.blog.title,
         },
         "publish_start": lorem.publish_start.isoformat(),
+        "publish_end": None,
+        "updated_at": drf_datetime(lorem.updated_at),
         "title": lorem.title,
         "content": lorem.content,
     }
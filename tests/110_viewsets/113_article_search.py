@@ -0,0 +1,30 @@
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory
+
+
+def test_article_viewset_search(settings, db):
+    """
+    Search endpoint should return ranked and paginated resumed articles.
+    """
+    settings.ARTICLE_PAGINATION = 2
+
+    ArticleFactory(title="Other", content="Yellow submarine")
+    ArticleFactory(title="Yellow submarine", content="Ping")
+    ArticleFactory(title="Yellow", content="Submarine")
+    ArticleFactory(title="Nope", content="Nothing")
+
+    client = APIClient()
+    response = client.get(
+        "/djangoapp_sample/api/articles/search/",
+        {"q": "yellow submarine"},
+        format="json",
+    )
+    assert response.status_code == 200
+
+    json_data = response.json()
+    assert json_data["count"] == 3
+    assert len(json_data["results"]) == 2
+    assert json_data["next"] is not None
+    assert "content" not in json_data["results"][0]
+    assert "Other" not in [item["title"] for item in json_data["results"]]
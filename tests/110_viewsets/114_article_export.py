@@ -0,0 +1,93 @@
+import csv
+import datetime
+import io
+import json
+
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+
+
+def get_content(response):
+    return b"".join(response.streaming_content).decode("utf-8")
+
+
+def test_article_viewset_export_ndjson(db, django_assert_num_queries):
+    """
+    Export endpoint should stream every article as NDJSON lines ordered by id.
+    """
+    blog = BlogFactory(title="Foo")
+    articles = ArticleFactory.create_batch(3, blog=blog)
+
+    client = APIClient()
+    response = client.get("/djangoapp_sample/api/articles/export/")
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson; charset=utf-8"
+
+    with django_assert_num_queries(1):
+        lines = get_content(response).splitlines()
+
+    rows = [json.loads(line) for line in lines]
+    assert [row["id"] for row in rows] == [item.id for item in articles]
+    assert rows[0]["blog"] == blog.id
+    assert rows[0]["blog_title"] == "Foo"
+    assert rows[0]["publish_start"] == articles[0].publish_start.isoformat()
+
+
+def test_article_viewset_export_csv_filters(db):
+    """
+    Export endpoint should stream CSV when requested and apply filters.
+    """
+    now = datetime.datetime(2012, 10, 15, 12, tzinfo=datetime.timezone.utc)
+    blog = BlogFactory()
+    ArticleFactory(blog=blog, title="Old", publish_start=now)
+    kept = ArticleFactory(
+        blog=blog, title="Kept", publish_start=now + datetime.timedelta(days=2),
+    )
+    ArticleFactory(title="Other blog", publish_start=now + datetime.timedelta(days=2))
+
+    client = APIClient()
+    response = client.get("/djangoapp_sample/api/articles/export/", {
+        "format": "csv",
+        "blog": blog.id,
+        "publish_after": (now + datetime.timedelta(days=1)).isoformat(),
+    })
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+
+    rows = list(csv.DictReader(io.StringIO(get_content(response))))
+    assert [row["title"] for row in rows] == ["Kept"]
+    assert rows[0]["id"] == str(kept.id)
+
+    # Invalid filters are refused before streaming
+    response = client.get("/djangoapp_sample/api/articles/export/", {
+        "publish_after": "nope",
+    })
+    assert response.status_code == 400
+
+
+def test_blog_viewset_export(db):
+    """
+    Blog export endpoint should only stream articles from the blog.
+    """
+    blog = BlogFactory()
+    ArticleFactory.create_batch(2, blog=blog)
+    ArticleFactory()
+
+    client = APIClient()
+    response = client.get(
+        "/djangoapp_sample/api/blogs/{}/export/".format(blog.id),
+        HTTP_ACCEPT="application/x-ndjson",
+    )
+    assert response.status_code == 200
+    assert response["Content-Disposition"] == (
+        'attachment; filename="blog-{}-articles.ndjson"'.format(blog.id)
+    )
+
+    rows = [json.loads(line) for line in get_content(response).splitlines()]
+    assert len(rows) == 2
+    assert {row["blog"] for row in rows} == {blog.id}
+
+    response = client.get("/djangoapp_sample/api/blogs/9999/export/", follow=True)
+    assert response.status_code == 404
@@ -0,0 +1,169 @@
+import datetime
+
+from django.contrib.auth.models import Permission
+
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.models import Article, Blog
+
+from djangoapp_sample.utils.tests import DRF_DUMMY_HOST_URL as HOSTURL
+
+
+BATCH_URL = "/djangoapp_sample/api/articles/batch/"
+
+
+def test_article_viewset_batch(db, django_assert_max_num_queries):
+    """
+    Batch endpoint should create, update and delete articles at once.
+    """
+    foo = BlogFactory(title="Foo")
+    bar = BlogFactory(title="Bar")
+    moved = ArticleFactory(blog=foo, title="Moved")
+    renamed = ArticleFactory(blog=foo, title="Renamed")
+    deleted = ArticleFactory(blog=bar, title="Deleted")
+
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(flag_is_superuser=True))
+
+    payload = {
+        "create": [
+            {"blog": foo.id, "title": "New {}".format(i)} for i in range(20)
+        ],
+        "update": [
+            {"id": moved.id, "blog": bar.id},
+            {"id": renamed.id, "title": "Changed"},
+        ],
+        "delete": [deleted.id],
+    }
+    # Query count does not depend on the number of items
+    with django_assert_max_num_queries(30):
+        response = client.post(BATCH_URL, payload, format="json")
+
+    assert response.status_code == 200
+    json_data = response.json()
+    assert len(json_data["create"]) == 20
+    created_id = json_data["create"][0]["id"]
+    assert json_data["create"][0]["url"] == (
+        "{}/djangoapp_sample/api/articles/{}/".format(HOSTURL, created_id)
+    )
+    assert json_data["update"] == [{"id": moved.id}, {"id": renamed.id}]
+    assert json_data["delete"] == [{"id": deleted.id}]
+
+    assert Article.objects.get(pk=created_id).title == "New 0"
+    assert Article.objects.get(pk=moved.id).blog_id == bar.id
+    renamed = Article.objects.get(pk=renamed.id)
+    assert (renamed.title, renamed.blog_id) == ("Changed", foo.id)
+    assert Article.objects.filter(pk=deleted.id).exists() is False
+
+    counts = dict(Blog.objects.values_list("title", "article_count"))
+    assert counts == {"Foo": 21, "Bar": 1}
+
+
+def test_article_viewset_batch_errors(db):
+    """
+    Invalid items should be reported at their position and nothing written.
+    """
+    blog = BlogFactory()
+    article = ArticleFactory(blog=blog)
+
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(flag_is_superuser=True))
+
+    response = client.post(BATCH_URL, {
+        "create": [
+            {"blog": blog.id, "title": "Valid"},
+            {"blog": 9999, "title": "Unknown blog"},
+            {"blog": blog.id},
+        ],
+        "update": [
+            {"title": "No id"},
+            {"id": article.id, "title": "Valid"},
+        ],
+        "delete": [article.id, 9999],
+    }, format="json")
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "create": [
+            {},
+            {"blog": ["Unknown blog id 9999."]},
+            {"title": ["This field is required."]},
+        ],
+        "update": [
+            {"id": ["This field is required."]},
+            {},
+        ],
+        "delete": [
+            {"id": ["Article {} is already in the batch.".format(article.id)]},
+            {"id": ["Unknown article id 9999."]},
+        ],
+    }
+    assert Article.objects.count() == 1
+
+    response = client.post(BATCH_URL, ["nope"], format="json")
+    assert response.status_code == 400
+
+
+def test_article_viewset_batch_permissions(db):
+    """
+    Every operation of a batch requires its model permission.
+    """
+    article = ArticleFactory()
+    user = UserFactory()
+    user.user_permissions.add(
+        Permission.objects.get(codename="add_article")
+    )
+
+    client = APIClient()
+    response = client.post(BATCH_URL, {"delete": [article.id]}, format="json")
+    assert response.status_code == 403
+
+    client.force_authenticate(user=user)
+    response = client.post(BATCH_URL, {"delete": [article.id]}, format="json")
+    assert response.status_code == 403
+    assert Article.objects.filter(pk=article.id).exists() is True
+
+    response = client.post(BATCH_URL, {
+        "create": [{"blog": article.blog_id, "title": "Allowed"}],
+    }, format="json")
+    assert response.status_code == 200
+
+    # Permissions are checked before validation, errors do not tell which ids
+    # exist
+    response = client.post(BATCH_URL, {
+        "create": [{"blog": 9999, "title": "Allowed"}],
+        "update": [{"id": 9999, "title": "Nope"}],
+    }, format="json")
+    assert response.status_code == 403
+    assert "9999" not in response.content.decode()
+
+
+def test_article_viewset_batch_partial_dates(db):
+    """
+    Partial updates should be checked against the stored publication dates.
+    """
+    start = datetime.datetime(2021, 6, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    article = ArticleFactory(
+        publish_start=start, publish_end=start + datetime.timedelta(days=10),
+    )
+    other = ArticleFactory(publish_start=start)
+
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(flag_is_superuser=True))
+
+    response = client.post(BATCH_URL, {
+        "update": [
+            {"id": article.id, "publish_start": "2021-07-01T12:00:00Z"},
+            {"id": other.id, "publish_end": "2021-05-01T12:00:00Z"},
+        ],
+    }, format="json")
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "update": [
+            {"publish_end": ["Publication end must be after publication start."]},
+            {"publish_end": ["Publication end must be after publication start."]},
+        ],
+    }
+    assert Article.objects.get(pk=other.pk).publish_end is None
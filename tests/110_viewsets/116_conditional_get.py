@@ -0,0 +1,53 @@
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+
+
+def test_viewsets_conditional_get(db):
+    """
+    List and detail endpoints should answer 304 when content has not changed.
+    """
+    blog = BlogFactory()
+    article = ArticleFactory(blog=blog)
+    client = APIClient()
+
+    urls = [
+        "/djangoapp_sample/api/blogs/",
+        "/djangoapp_sample/api/blogs/{}/".format(blog.id),
+        "/djangoapp_sample/api/articles/",
+        "/djangoapp_sample/api/articles/{}/".format(article.id),
+    ]
+    etags = {}
+    for url in urls:
+        response = client.get(url)
+        assert response.status_code == 200
+        etags[url] = response["ETag"]
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+        assert response.status_code == 304
+
+    # Every endpoint displays the blog title
+    blog.title = "Changed"
+    blog.save()
+    for url in urls:
+        response = client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+        assert response.status_code == 200
+        assert response["ETag"] != etags[url]
+
+    # Each format has its own ETag
+    response = client.get(urls[0], {"format": "api"})
+    assert response["ETag"] != client.get(urls[0])["ETag"]
+
+
+def test_viewsets_conditional_get_missing(db):
+    """
+    Missing or invalid objects should not get validators.
+    """
+    client = APIClient()
+
+    for pk in ("9999", "nope"):
+        response = client.get(
+            "/djangoapp_sample/api/articles/{}/".format(pk), follow=True
+        )
+        assert response.status_code == 404
+        assert not response.has_header("ETag")
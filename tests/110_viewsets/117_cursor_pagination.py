@@ -0,0 +1,69 @@
+import datetime
+
+from django.utils import timezone
+
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.pagination.api import ArticleCursorPagination
+
+
+def browse(client, url):
+    """
+    Follow every 'next' links from given URL.
+
+    Returns:
+        list: Item ids for each page.
+    """
+    pages = []
+    while url:
+        data = client.get(url).json()
+        pages.append([item["id"] for item in data["results"]])
+        url = data["next"]
+
+    return pages
+
+
+def test_article_list_cursor(db):
+    """
+    Article list should be paginated on publication date then id, without
+    skipping or duplicating articles sharing the same date.
+    """
+    same_date = timezone.now() - datetime.timedelta(days=1)
+    articles = ArticleFactory.create_batch(5, publish_start=same_date)
+    latest = ArticleFactory(publish_start=same_date + datetime.timedelta(hours=1))
+
+    pages = browse(APIClient(), "/djangoapp_sample/api/articles/?page_size=2")
+
+    assert [len(page) for page in pages] == [2, 2, 2]
+    assert sum(pages, []) == [latest.id] + [item.id for item in articles]
+
+
+def test_blog_list_cursor(db, settings):
+    """
+    Blog list should be paginated on title with default page size from settings.
+    """
+    blogs = [
+        BlogFactory(title="blog-{}".format(i))
+        for i in range(settings.BLOG_PAGINATION + 1)
+    ]
+
+    pages = browse(APIClient(), "/djangoapp_sample/api/blogs/")
+
+    assert [len(page) for page in pages] == [settings.BLOG_PAGINATION, 1]
+    assert sum(pages, []) == [item.id for item in blogs]
+
+
+def test_cursor_page_size(settings):
+    """
+    Page size should default to setting and be bounded.
+    """
+    factory = APIRequestFactory()
+    pagination = ArticleCursorPagination()
+
+    request = Request(factory.get("/"))
+    assert pagination.get_page_size(request) == settings.ARTICLE_PAGINATION
+
+    request = Request(factory.get("/", {"page_size": 1000}))
+    assert pagination.get_page_size(request) == pagination.max_page_size
@@ -0,0 +1,111 @@
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article, Blog
+from djangoapp_sample.serializers import plan_queryset
+
+
+class PlanningArticleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = ["id", "title"]
+
+
+class PlanningBlogSerializer(serializers.ModelSerializer):
+    articles = PlanningArticleSerializer(source="article_set", many=True)
+    live_count = serializers.IntegerField()
+
+    plan_annotations = {"live_count": Count("article")}
+
+    class Meta:
+        model = Blog
+        fields = ["id", "title", "articles", "live_count"]
+
+
+def count_queries(client, url):
+    """
+    Return the number of queries for a request, once the queries done only on the
+    first request of a process have been done.
+    """
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert response.status_code == 200
+
+    return len(context.captured_queries)
+
+
+def test_plan_queryset(db, django_assert_num_queries):
+    """
+    Nested many relations should be prefetched with their own projection and
+    serializer annotations should be applied.
+    """
+    for blog in BlogFactory.create_batch(3):
+        ArticleFactory.create_batch(2, blog=blog)
+
+    queryset = plan_queryset(Blog.objects.order_by("id"), PlanningBlogSerializer())
+
+    with django_assert_num_queries(2):
+        data = PlanningBlogSerializer(queryset, many=True).data
+
+    assert [item["live_count"] for item in data] == [2, 2, 2]
+    assert [len(item["articles"]) for item in data] == [2, 2, 2]
+
+    blog = queryset.first()
+    assert blog.get_deferred_fields() == {"article_count", "updated_at"}
+    assert blog.article_set.all()[0].get_deferred_fields() == {
+        "content", "publish_end", "publish_start", "updated_at",
+    }
+
+
+def test_article_list_queries(db):
+    """
+    Article list should run the same queries whatever the page size.
+    """
+    for blog in BlogFactory.create_batch(5):
+        ArticleFactory.create_batch(2, blog=blog)
+
+    client = APIClient()
+    url = "/djangoapp_sample/api/articles/?page_size={}"
+
+    assert count_queries(client, url.format(2)) == count_queries(
+        client, url.format(10)
+    )
+
+
+def test_article_detail_queries(db, django_assert_num_queries):
+    """
+    Article detail should load its blog with the article.
+    """
+    article = ArticleFactory()
+
+    client = APIClient()
+    url = "/djangoapp_sample/api/articles/{}/".format(article.pk)
+    client.get(url)
+    # CMS URL revision, conditional validators then the article
+    with django_assert_num_queries(3):
+        response = client.get(url)
+
+    assert response.json()["blog"]["id"] == article.blog_id
+
+
+def test_blog_list_queries(db):
+    """
+    Blog list should run the same queries whatever the page size.
+    """
+    for blog in BlogFactory.create_batch(5):
+        ArticleFactory(blog=blog)
+
+    client = APIClient()
+    url = "/djangoapp_sample/api/blogs/?page_size={}"
+
+    assert count_queries(client, url.format(2)) == count_queries(
+        client, url.format(10)
+    )
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.serializers import ArticleResumeSerializer
+
+
+def test_article_list_fields(db):
+    """
+    Only requested fields should be serialized and loaded from database.
+    """
+    ArticleFactory.create_batch(2)
+
+    client = APIClient()
+    with mock.patch.object(
+        ArticleResumeSerializer, "get_view_url"
+    ) as get_view_url, CaptureQueriesContext(connection) as context:
+        response = client.get(
+            "/djangoapp_sample/api/articles/?fields=id,title,publish_start"
+        )
+
+    assert response.status_code == 200
+    assert [sorted(item) for item in response.json()["results"]] == [
+        ["id", "publish_start", "title"],
+    ] * 2
+    assert get_view_url.called is False
+
+    listing = [
+        query["sql"] for query in context.captured_queries
+        if query["sql"].startswith('SELECT "djangoapp_sample_article"."id"')
+    ]
+    assert len(listing) == 1
+    assert '"djangoapp_sample_article"."blog_id"' not in listing[0]
+    assert '"djangoapp_sample_blog"' not in listing[0]
+
+
+def test_article_detail_omit(db):
+    """
+    Omitted fields should be removed from the complete representation.
+    """
+    article = ArticleFactory()
+
+    response = APIClient().get(
+        "/djangoapp_sample/api/articles/{}/?omit=content,blog,url".format(article.pk)
+    )
+
+    assert response.status_code == 200
+    assert sorted(response.json()) == [
+        "id", "publish_end", "publish_start", "title", "updated_at", "view_url",
+    ]
+
+
+def test_blog_list_fields(db):
+    """
+    Blog list should accept sparse fieldsets.
+    """
+    BlogFactory(title="Lorem")
+
+    response = APIClient().get("/djangoapp_sample/api/blogs/?fields=title")
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [{"title": "Lorem"}]
+
+
+def test_unknown_fields(db):
+    """
+    Unknown field names should be rejected.
+    """
+    response = APIClient().get(
+        "/djangoapp_sample/api/blogs/?fields=title,nope&omit=foo"
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "fields": ["Unknown field(s): nope."],
+        "omit": ["Unknown field(s): foo."],
+    }
@@ -0,0 +1,161 @@
+import datetime
+
+import pytest
+
+from django.utils import timezone
+
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.filters import IndexedArticleFilterBackend
+from djangoapp_sample.models import Article
+
+
+URL = "/djangoapp_sample/api/articles/"
+
+
+def get_ids(response):
+    assert response.status_code == 200
+
+    return [item["id"] for item in response.json()["results"]]
+
+
+def test_filter_blog_publication(db):
+    """
+    Articles should be filtered on blog and publication range.
+    """
+    now = timezone.now()
+    blog = BlogFactory()
+    old, recent, latest = [
+        ArticleFactory(blog=blog, publish_start=now - datetime.timedelta(days=days))
+        for days in (30, 10, 1)
+    ]
+    ArticleFactory(publish_start=now - datetime.timedelta(days=10))
+
+    client = APIClient()
+    after = (now - datetime.timedelta(days=20)).isoformat()
+
+    response = client.get(URL, {"blog": blog.pk, "publish_after": after})
+    assert get_ids(response) == [latest.pk, recent.pk]
+
+    response = client.get(URL, {"blog": blog.pk, "ordering": "publish_start"})
+    assert get_ids(response) == [old.pk, recent.pk, latest.pk]
+
+
+def test_filter_title_prefix(db):
+    """
+    Title prefix should be case sensitive and ordered on title by default.
+    """
+    past = timezone.now() - datetime.timedelta(days=1)
+    for title in ("Lorem", "Lore", "lorem", "Lord", "Ipsum"):
+        ArticleFactory(title=title, publish_start=past)
+
+    client = APIClient()
+
+    response = client.get(URL, {"title_prefix": "Lore"})
+    assert [item["title"] for item in response.json()["results"]] == [
+        "Lore", "Lorem",
+    ]
+
+    response = client.get(URL, {"title_prefix": "Lor", "ordering": "-title"})
+    assert [item["title"] for item in response.json()["results"]] == [
+        "Lorem", "Lore", "Lord",
+    ]
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("Lorem", "Loren"),
+    ("Lo\U0010ffff", "Lp"),
+    ("Lo\U0010ffff\U0010ffff", "Lp"),
+    ("\U0010ffff", None),
+    ("Lo\ud7ff", "Lo\ue000"),
+])
+def test_prefix_upper_bound(prefix, expected):
+    """
+    Upper bound should be computed for any last characters.
+    """
+    assert IndexedArticleFilterBackend().get_prefix_upper_bound(prefix) == expected
+
+
+def test_filter_title_prefix_last_code_point(db):
+    """
+    Prefixes ending with the last code point should be filtered without upper
+    bound on their last character.
+    """
+    past = timezone.now() - datetime.timedelta(days=1)
+    for title in ("Lo\U0010ffff", "Lo\U0010ffffrem", "Lp", "Lorem"):
+        ArticleFactory(title=title, publish_start=past)
+
+    response = APIClient().get(URL, {"title_prefix": "Lo\U0010ffff"})
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["results"]] == [
+        "Lo\U0010ffff", "Lo\U0010ffffrem",
+    ]
+
+
+@pytest.mark.parametrize("params", [
+    {"blog": 1, "title_prefix": "Lorem"},
+    {"title_prefix": "Lorem", "ordering": "-publish_start"},
+    {"blog": 1, "ordering": "title"},
+    {"title_prefix": "Lorem", "publish_after": "2021-01-01T00:00:00Z"},
+])
+def test_unindexed_combinations(db, params):
+    """
+    Combinations which are not served by an index should be rejected.
+    """
+    response = APIClient().get(URL, params)
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "non_field_errors": [
+            "This combination of filters and ordering is not indexed."
+        ],
+    }
+
+
+def test_invalid_ordering(db):
+    response = APIClient().get(URL, {"ordering": "content"})
+
+    assert response.status_code == 400
+    assert list(response.json()) == ["ordering"]
+
+
+@pytest.mark.parametrize("plan", IndexedArticleFilterBackend.index_plans)
+def test_plans_use_index(db, plan):
+    """
+    Each declared combination should be planned on its index by the database.
+    """
+    params = {"ordering": plan.orderings[0]}
+    if "blog" in plan.equal:
+        params["blog"] = 1
+    if plan.range == "publish_start":
+        params["publish_after"] = "2021-01-01T00:00:00Z"
+    else:
+        params["title_prefix"] = "Lorem"
+
+    request = Request(APIRequestFactory().get("/", params))
+    queryset = IndexedArticleFilterBackend().filter_queryset(
+        request, Article.objects.all(), None
+    )
+
+    assert plan.index in queryset.explain()
+
+
+def test_filters_documentation(db):
+    """
+    Filters should be described in the schema and the browsable API.
+    """
+    backend = IndexedArticleFilterBackend()
+
+    assert [
+        item["name"] for item in backend.get_schema_operation_parameters(None)
+    ] == ["blog", "publish_after", "publish_before", "title_prefix", "ordering"]
+
+    response = APIClient().get(URL, HTTP_ACCEPT="text/html")
+    content = response.content.decode()
+
+    assert response.status_code == 200
+    assert 'name="title_prefix"' in content
+    assert 'name="ordering"' in content
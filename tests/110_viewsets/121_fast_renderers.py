@@ -0,0 +1,102 @@
+import json
+from io import BytesIO
+
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+
+from djangoapp_sample import renderers
+from djangoapp_sample.factories import ArticleFactory
+from djangoapp_sample.parsers import MessagePackParser
+from djangoapp_sample.renderers import MessagePackRenderer, ORJSONRenderer
+
+
+URL = "/djangoapp_sample/api/articles/"
+
+
+def test_orjson_same_content(db, settings):
+    """
+    orjson renderer should render the same content than the default JSON one.
+    """
+    pytest.importorskip("orjson")
+    ArticleFactory.create_batch(3, title="Lorém")
+    article = ArticleFactory()
+
+    client = APIClient()
+    for url in (URL, "{}{}/".format(URL, article.pk)):
+        settings.API_FAST_RENDERERS_ENABLED = False
+        default = client.get(url)
+        settings.API_FAST_RENDERERS_ENABLED = True
+        fast = client.get(url)
+
+        assert fast["Content-Type"] == default["Content-Type"]
+        assert json.loads(fast.content) == json.loads(default.content)
+
+
+def test_orjson_indent():
+    pytest.importorskip("orjson")
+
+    content = ORJSONRenderer().render(
+        {"a": [1]}, "application/json; indent=4", {}
+    )
+
+    assert content == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_msgpack_negotiation(db, settings):
+    """
+    MessagePack should be selected from the Accept header or the format argument
+    and parsed back to the same data than JSON.
+    """
+    msgpack = pytest.importorskip("msgpack")
+    settings.API_FAST_RENDERERS_ENABLED = True
+    ArticleFactory.create_batch(2)
+
+    client = APIClient()
+    expected = client.get(URL).json()
+
+    response = client.get(URL, HTTP_ACCEPT="application/msgpack")
+    assert response["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content, raw=False) == expected
+
+    # Format argument is kept in hyperlinks
+    response = client.get(URL, {"format": "msgpack"})
+    data = msgpack.unpackb(response.content, raw=False)
+    assert [item["id"] for item in data["results"]] == [
+        item["id"] for item in expected["results"]
+    ]
+
+
+def test_fast_renderers_disabled(db):
+    """
+    Fast renderers are not used unless enabled from settings.
+    """
+    response = APIClient().get(URL, HTTP_ACCEPT="application/msgpack")
+
+    assert response.status_code == 406
+
+
+def test_msgpack_parser_error():
+    pytest.importorskip("msgpack")
+
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(BytesIO(b"\xc1"))
+
+
+def test_missing_libraries(monkeypatch):
+    """
+    Fast renderers should not be used nor built without their library.
+    """
+    monkeypatch.setattr(renderers, "orjson", None)
+    monkeypatch.setattr(renderers, "msgpack", None)
+
+    assert renderers.get_fast_renderer_classes() == []
+
+    with pytest.raises(ImproperlyConfigured):
+        ORJSONRenderer()
+
+    with pytest.raises(ImproperlyConfigured):
+        MessagePackRenderer()
@@ -0,0 +1,72 @@
+from django.db import connection
+
+from cms.api import add_plugin
+
+from djangoapp_sample.cms_plugins import BlogPlugin
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.models import Article
+from djangoapp_sample.utils.cms_api import CmsAPI
+from djangoapp_sample.utils.tests import html_pyquery
+
+
+def get_titles(client, url):
+    dom = html_pyquery(client.get(url))
+
+    return [
+        item.text
+        for item in dom.find(".blog-plugin .plugin-articles li:not(.empty) a")
+    ]
+
+
+def test_plugin_cache_invalidation(db, client, settings, locmem_cache,
+                                   django_capture_on_commit_callbacks):
+    """
+    Plugin output should be cached with the CMS caches enabled and invalidated as
+    soon as its blog articles change.
+    """
+    settings.LANGUAGE_CODE = "en"
+    settings.CMS_PAGE_CACHE = True
+    settings.CMS_PLACEHOLDER_CACHE = True
+    settings.CMS_PLUGIN_CACHE = True
+
+    cmsapi = CmsAPI(author=UserFactory(is_staff=True, is_superuser=True))
+    blog = BlogFactory(title="News")
+    other = BlogFactory(title="Other")
+    article = ArticleFactory(blog=blog, title="First")
+
+    page, page_content, version = cmsapi.create_page(
+        "Dummy",
+        template=settings.TEST_PAGE_TEMPLATE,
+        publish=True,
+    )
+    add_plugin(
+        cmsapi.get_placeholder(page=page),
+        BlogPlugin,
+        settings.LANGUAGE_CODE,
+        blog=blog,
+        limit=5,
+    )
+    url = page.get_absolute_url(language=settings.LANGUAGE_CODE)
+
+    assert get_titles(client, url) == ["First"]
+
+    # Changes without signals nor invalidation are not visible, it is cached
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE djangoapp_sample_article SET title = %s WHERE id = %s",
+            ["Silent", article.pk],
+        )
+    assert get_titles(client, url) == ["First"]
+
+    # Another blog changes do not clear plugin caches
+    assert BlogPlugin.clear_cache_for_blogs([other.pk]) == 0
+
+    # A saved article invalidates caches
+    with django_capture_on_commit_callbacks(execute=True):
+        ArticleFactory(blog=blog, title="Second")
+    assert get_titles(client, url) == ["Second", "Silent"]
+
+    # Bulk changes too
+    with django_capture_on_commit_callbacks(execute=True):
+        Article.objects.filter(pk=article.pk).delete()
+    assert get_titles(client, url) == ["Second"]
@@ -0,0 +1,23 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Blog
+
+
+def test_rebuild_article_counts(db):
+    """
+    Command should correct drifted counters by chunks.
+    """
+    blogs = BlogFactory.create_batch(5)
+    for blog in blogs:
+        ArticleFactory(blog=blog)
+
+    Blog.objects.filter(pk__in=[blogs[0].pk, blogs[3].pk]).update(article_count=0)
+
+    out = StringIO()
+    call_command("rebuild_article_counts", chunk_size=2, stdout=out)
+
+    assert out.getvalue().strip() == "Processed 5 blog(s), corrected 2 counter(s)."
+    assert [blog.article_count for blog in Blog.objects.all()] == [1] * 5
@@ -0,0 +1,124 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+from djangoapp_sample.factories import BlogFactory
+from djangoapp_sample.models import Article, Blog
+from djangoapp_sample.search import search_articles
+
+
+def test_import_articles_jsonl(db, tmp_path, django_assert_max_num_queries):
+    """
+    Articles should be imported by batches with blogs resolved from ids or
+    created from titles, invalid rows are reported.
+    """
+    existing = BlogFactory(title="Existing")
+    rows = [
+        {"blog": existing.id, "title": "First", "content": "Lorem"},
+        {"blog": "New blog", "title": "Second",
+         "publish_start": "2012-10-15T12:00:00+00:00"},
+        {"blog": "Existing", "title": "Third"},
+        {"blog": 9999, "title": "Unknown blog"},
+        {"blog": "New blog", "title": ""},
+    ] + [
+        {"blog": "New blog", "title": "Bulk {}".format(i)} for i in range(10)
+    ]
+    source = tmp_path / "articles.jsonl"
+    source.write_text("\n".join(json.dumps(row) for row in rows))
+
+    out = StringIO()
+    err = StringIO()
+    # 15 rows by batches of 5 are 3 batches costing a few queries each
+    with django_assert_max_num_queries(30):
+        call_command(
+            "bulk_import", "articles", str(source),
+            batch_size=5, stdout=out, stderr=err,
+        )
+
+    assert "Imported 13 articles from 15 rows" in out.getvalue()
+    assert err.getvalue().splitlines() == [
+        "Row 4: Unknown blog '9999'.",
+        "Row 5: Title is required.",
+    ]
+
+    new_blog = Blog.objects.get(title="New blog")
+    assert Blog.objects.count() == 2
+    assert new_blog.article_count == 11
+    assert Blog.objects.get(pk=existing.pk).article_count == 2
+    assert Article.objects.get(title="Second").publish_start.year == 2012
+    # Imported articles are indexed for search
+    assert search_articles(Article.objects.all(), "bulk").count() == 10
+
+
+def test_import_blogs_csv(db, tmp_path):
+    """
+    Blogs import should ignore existing titles.
+    """
+    BlogFactory(title="Foo")
+    source = tmp_path / "blogs.csv"
+    source.write_text("title\nFoo\nBar\n\n")
+
+    out = StringIO()
+    call_command("bulk_import", "blogs", str(source), stdout=out, stderr=StringIO())
+
+    assert sorted(Blog.objects.values_list("title", flat=True)) == ["Bar", "Foo"]
+    # Only created blogs are counted
+    assert "Imported 1 blogs from 2 rows" in out.getvalue()
+
+
+def test_import_invalid_json(db, tmp_path):
+    """
+    Invalid JSON should abort the import with an error.
+    """
+    source = tmp_path / "articles.jsonl"
+    source.write_text("{nope")
+
+    with pytest.raises(CommandError, match="Invalid JSON on line 1"):
+        call_command("bulk_import", "articles", str(source), stdout=StringIO())
+
+
+def test_import_invalid_value_types(db, tmp_path):
+    """
+    Values with a wrong JSON type should be reported as row errors.
+    """
+    rows = [
+        {"blog": "Lorem", "title": 12},
+        {"blog": "Lorem", "title": "Dates", "publish_start": 1634300000},
+        {"blog": "Lorem", "title": "Content", "content": ["nope"]},
+        {"blog": True, "title": "Boolean blog"},
+        {"blog": {"a": 1}, "title": "Object blog"},
+        {"blog": 1.5, "title": "Float blog"},
+        {"blog": "Lorem", "title": "Valid"},
+    ]
+    source = tmp_path / "articles.jsonl"
+    source.write_text("\n".join(json.dumps(row) for row in rows))
+
+    out = StringIO()
+    err = StringIO()
+    call_command("bulk_import", "articles", str(source), stdout=out, stderr=err)
+
+    assert "Imported 1 articles from 7 rows" in out.getvalue()
+    assert err.getvalue().splitlines() == [
+        "Row 1: Invalid value for 'title', a string is expected.",
+        "Row 2: Invalid value for 'publish_start', a string is expected.",
+        "Row 3: Invalid value for 'content', a string is expected.",
+        "Row 4: Invalid value for 'blog', a string or an integer is expected.",
+        "Row 5: Invalid value for 'blog', a string or an integer is expected.",
+        "Row 6: Invalid value for 'blog', a string or an integer is expected.",
+    ]
+    # No blog is created nor used from wrongly typed references
+    assert list(Blog.objects.values_list("title", flat=True)) == ["Lorem"]
+
+    source = tmp_path / "blogs.jsonl"
+    source.write_text(json.dumps({"title": 12}))
+
+    err = StringIO()
+    call_command("bulk_import", "blogs", str(source), stdout=out, stderr=err)
+
+    assert err.getvalue().splitlines() == [
+        "Row 1: Invalid value for 'title', a string is expected.",
+    ]
@@ -0,0 +1,80 @@
+import datetime
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+import pytest
+
+from djangoapp_sample.compat.import_zoneinfo import ZoneInfo
+from djangoapp_sample.factories import ArticleFactory, BlogFactory
+from djangoapp_sample.models import Article, Blog
+
+
+@pytest.mark.parametrize("filename", ["articles.ndjson", "articles.csv"])
+def test_export_articles_roundtrip(db, tmp_path, filename):
+    """
+    Exported articles should be importable back with the bulk import command.
+    """
+    blog = BlogFactory(title="Foo")
+    ArticleFactory(blog=blog, title="First", content="Line\nwith, comma")
+    ArticleFactory(blog=blog, title="Second", content="")
+    ArticleFactory(title="Other")
+    target = tmp_path / filename
+
+    out = StringIO()
+    call_command("export_articles", str(target), blog=blog.id, stdout=out)
+    assert out.getvalue().strip() == "Exported 2 articles to {}.".format(target)
+
+    Article.objects.all().delete()
+    call_command("bulk_import", "articles", str(target), stdout=StringIO())
+
+    assert sorted(
+        Article.objects.values_list("title", "content")
+    ) == [("First", "Line\nwith, comma"), ("Second", "")]
+    assert Blog.objects.get(pk=blog.pk).article_count == 2
+
+
+def test_export_articles_errors(db, tmp_path):
+    """
+    Command should refuse unknown format and invalid dates.
+    """
+    with pytest.raises(CommandError):
+        call_command("export_articles", str(tmp_path / "foo.txt"))
+
+    with pytest.raises(CommandError):
+        call_command(
+            "export_articles", str(tmp_path / "foo.csv"), publish_after="nope",
+        )
+
+
+def test_export_articles_stdout(db, settings):
+    """
+    Export to standard output should use the command output and naive dates
+    should be in the current timezone.
+    """
+    settings.TIME_ZONE = "America/Chicago"
+    tz = ZoneInfo(settings.TIME_ZONE)
+    ArticleFactory(
+        title="Before",
+        publish_start=datetime.datetime(2021, 1, 1, 12, 0, tzinfo=tz),
+    )
+    after = ArticleFactory(
+        title="After",
+        publish_start=datetime.datetime(2021, 1, 1, 20, 0, tzinfo=tz),
+        publish_end=datetime.datetime(2021, 2, 1, 20, 0, tzinfo=tz),
+    )
+
+    out = StringIO()
+    # Naive date is 16:00 in Chicago, between both articles
+    call_command(
+        "export_articles", "-", format="ndjson",
+        publish_after="2021-01-01T16:00:00", stdout=out,
+    )
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+
+    assert [row["id"] for row in rows] == [after.id]
+    assert datetime.datetime.fromisoformat(rows[0]["publish_end"]) == (
+        after.publish_end
+    )
@@ -0,0 +1,126 @@
+import datetime
+import re
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.signals import got_request_exception
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from cms.api import add_plugin
+
+from djangoapp_sample.cache import get_metrics
+from djangoapp_sample.cms_plugins import BlogPlugin
+from djangoapp_sample.factories import ArticleFactory, BlogFactory, UserFactory
+from djangoapp_sample.utils.cms_api import CmsAPI
+from djangoapp_sample.utils.tests import html_pyquery
+from djangoapp_sample.views import BlogIndexView
+
+
+warm_caches = pytest.mark.parametrize(
+    "locmem_cache",
+    [{"VIEW_CACHE_ENABLED": True, "REPRESENTATION_CACHE_ENABLED": True}],
+    indirect=True,
+)
+
+
+def warm(**options):
+    out = StringIO()
+    call_command("warm_djangoapp_sample_cache", stdout=out, **options)
+
+    return out.getvalue()
+
+
+@warm_caches
+def test_warm_cache(db, client, settings, locmem_cache):
+    """
+    Command should render every target into caches.
+    """
+    settings.LANGUAGE_CODE = "en"
+    blog = BlogFactory(title="Foo")
+    ArticleFactory.create_batch(settings.ARTICLE_PAGINATION + 1, blog=blog)
+    # Scheduled articles are not listed to anonymous users so they make no page
+    ArticleFactory.create_batch(
+        settings.ARTICLE_PAGINATION + 1,
+        blog=BlogFactory(title="Bar"),
+        publish_start=timezone.now() + datetime.timedelta(days=1),
+    )
+
+    cmsapi = CmsAPI(author=UserFactory(is_staff=True, is_superuser=True))
+    page, page_content, version = cmsapi.create_page(
+        "Dummy", template=settings.TEST_PAGE_TEMPLATE, publish=True,
+    )
+    add_plugin(
+        cmsapi.get_placeholder(page=page), BlogPlugin, settings.LANGUAGE_CODE,
+        blog=blog, limit=2,
+    )
+
+    output = warm(pages=3, articles=2, workers=1)
+
+    # Index (1 page), Foo (2 pages), Bar (1 page), 2 articles, 2 API lists and the
+    # plugin
+    assert "Warmed 9 of 9 targets" in output
+    assert re.search(r"- blog-detail: 3 ok, 0 failed", output)
+    assert re.search(r"- blog-plugin: 1 ok, 0 failed", output)
+    assert get_metrics()["miss"] == 7
+
+    # Pages are served from cache
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE djangoapp_sample_blog SET title = %s WHERE id = %s",
+            ["Silent", blog.pk],
+        )
+    dom = html_pyquery(client.get(blog.get_absolute_url() + "?page=2"))
+    assert dom.find(".blog-detail h2")[0].text == "Foo"
+
+
+@warm_caches
+def test_warm_cache_workers(transactional_db, client, locmem_cache):
+    """
+    Command should work from many threads with a rate limit.
+    """
+    for i in range(3):
+        ArticleFactory(blog=BlogFactory(title="blog-{}".format(i)))
+
+    # CMS stores its URL revision and menu cache keys on the first request, SQLite
+    # in memory locks tables from concurrent writes
+    assert client.get(reverse("djangoapp_sample:blog-index")).status_code == 200
+
+    output = warm(articles=3, workers=3, rate=100)
+
+    assert "Warmed 9 of 9 targets" in output
+    assert "with 3 worker(s)" in output
+
+
+@warm_caches
+def test_warm_cache_failures(db, locmem_cache, monkeypatch):
+    """
+    Failures should be reported with their reason without stopping the warming.
+    """
+    ArticleFactory()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("Boom")
+
+    monkeypatch.setattr(BlogIndexView, "get", fail)
+
+    output = warm(articles=1, workers=1)
+
+    assert "Warmed 4 of 5 targets" in output
+    assert (
+        "Failed: /djangoapp_sample/ (Response status 500: RuntimeError: Boom)"
+    ) in output
+    # Exceptions are only listened during the warming
+    assert not got_request_exception.has_listeners()
+
+
+def test_warm_cache_errors(db):
+    with pytest.raises(CommandError):
+        warm(workers=0)
+
+    with pytest.raises(CommandError):
+        warm(pages=0)
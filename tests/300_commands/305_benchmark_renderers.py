@@ -0,0 +1,34 @@
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from djangoapp_sample.factories import ArticleFactory
+from djangoapp_sample.renderers import get_fast_renderer_classes
+
+
+def test_benchmark_renderers(db):
+    """
+    Command should report every available renderer.
+    """
+    ArticleFactory.create_batch(3)
+
+    out = StringIO()
+    call_command(
+        "benchmark_renderers", serializer="article-resume", repeat=2, stdout=out
+    )
+    lines = out.getvalue().splitlines()
+
+    assert lines[0] == (
+        "Rendered 3 object(s) from serializer 'article-resume', best of 2:"
+    )
+    assert [line.split(":")[0] for line in lines[1:]] == ["- JSONRenderer"] + [
+        "- {}".format(klass.__name__) for klass in get_fast_renderer_classes()
+    ]
+
+
+def test_benchmark_renderers_empty(db):
+    with pytest.raises(CommandError):
+        call_command("benchmark_renderers", stdout=StringIO())
@@ -5,7 +5,11 @@ from pathlib import Path
 
 import pytest
 
+from django.core.cache import caches
+from django.db import connection
+
 import djangoapp_sample
+from djangoapp_sample.cache import get_cache, reset_metrics
 
 
 class FixturesSettingsTestMixin(object):
@@ -81,3 +85,62 @@ def tests_settings():
                 print(tests_settings.format("Application version: {VERSION}"))
     """
     return FixturesSettingsTestMixin()
+
+
+@pytest.fixture
+def locmem_cache(request, settings):
+    """
+    Use a local memory cache as the default cache, it is cleared with the
+    stampede metrics before and after the test.
+
+    Settings to enable along can be given with an indirect parametrization.
+
+    Example:
+        You may use it in tests like this: ::
+
+            @pytest.mark.parametrize(
+                "locmem_cache", [{"VIEW_CACHE_ENABLED": True}], indirect=True
+            )
+            def test_foo(locmem_cache):
+                locmem_cache.get("foo")
+    """
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "djangoapp-sample-tests",
+        }
+    }
+    for name, value in getattr(request, "param", {}).items():
+        setattr(settings, name, value)
+
+    get_cache().clear()
+    reset_metrics()
+
+    yield caches["default"]
+
+    get_cache().clear()
+    reset_metrics()
+
+
+@pytest.fixture
+def rename_silently():
+    """
+    Return a function to change an object title without any signal nor
+    invalidation.
+
+    Example:
+        You may use it in tests like this: ::
+
+            def test_foo(db, rename_silently):
+                rename_silently(Blog, blog.pk, "Silent")
+    """
+    def rename(model, pk, title):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE {} SET title = %s WHERE id = %s".format(
+                    model._meta.db_table
+                ),
+                [title, pk],
+            )
+
+    return rename